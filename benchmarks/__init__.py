@@ -0,0 +1,4 @@
+"""
+성능 측정 스크립트 모음.
+각 모듈은 `python -m benchmarks.<module>` 으로 실행한다.
+"""
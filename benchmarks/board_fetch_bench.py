@@ -0,0 +1,51 @@
+from board.data import Point, Section, Tiles
+from board.data.handler import BoardHandler
+from .utils import bench, compare
+
+
+def legacy_fetch(start: Point, end: Point) -> Tiles:
+    """
+    Section.fetch로 Tiles를 만든 뒤 row 단위로 다시 복사하던 BoardHandler.fetch
+    """
+    out_width, out_height = (end.x - start.x + 1), (start.y - end.y + 1)
+    out = bytearray(out_width * out_height)
+
+    for section in BoardHandler.sections.overlapping(start, end):
+        inner_start = Point(
+            x=max(start.x, section.abs_x) - (section.abs_x),
+            y=min(start.y, section.abs_y + Section.LENGTH-1) - section.abs_y
+        )
+        inner_end = Point(
+            x=min(end.x, section.abs_x + Section.LENGTH-1) - section.abs_x,
+            y=max(end.y, section.abs_y) - section.abs_y
+        )
+
+        fetched = section.fetch(start=inner_start, end=inner_end)
+
+        x_gap, y_gap = (inner_end.x - inner_start.x + 1), (inner_start.y - inner_end.y + 1)
+
+        out_x = (section.abs_x + inner_start.x) - start.x
+        out_y = start.y - (section.abs_y + inner_start.y)
+
+        for row_num in range(y_gap):
+            out_idx = (out_width * (out_y + row_num)) + out_x
+            data_idx = row_num * x_gap
+
+            data = fetched.data[data_idx:data_idx+x_gap]
+            out[out_idx:out_idx+x_gap] = data
+
+    return Tiles(data=out)
+
+
+if __name__ == "__main__":
+    # 200x100 뷰포트
+    start, end = Point(-100, 50), Point(99, -49)
+    BoardHandler.fetch(start, end)
+
+    buf = bytearray(200 * 100)
+
+    legacy = bench("BoardHandler.fetch (legacy)", lambda: legacy_fetch(start, end), number=1000)
+    current = bench("BoardHandler.fetch", lambda: BoardHandler.fetch(start, end), number=1000)
+    reused = bench("BoardHandler.fetch_into (reused buffer)", lambda: BoardHandler.fetch_into(start, end, buf), number=1000)
+    compare("speedup (fetch)", legacy, current)
+    compare("speedup (fetch_into)", legacy, reused)
@@ -0,0 +1,139 @@
+import random
+from board.data import Point
+from cursor.data import Cursor, Color
+from cursor.data.handler import CursorHandler, CursorStore
+from cursor.data.handler.internal.cursor_handler import view_range
+from .utils import bench, compare
+
+N_CURSORS = 10000
+# 커서들이 흩어져 있는 범위
+WORLD = 3000
+VIEW_WIDTH, VIEW_HEIGHT = 30, 15
+
+
+def legacy_exists_range(cursors: dict[str, Cursor], start: Point, end: Point) -> list[Cursor]:
+    """
+    cursor_dict 전체를 순회하던 CursorHandler.exists_range
+    """
+    result = []
+    for cursor_id in cursors:
+        cursor = cursors[cursor_id]
+        pos = cursor.position
+        if \
+                start.x > pos.x or end.x < pos.x or \
+                end.y > pos.y or start.y < pos.y:
+            continue
+
+        result.append(cursor)
+
+    return result
+
+
+def legacy_view_includes(cursors: dict[str, Cursor], p: Point) -> list[Cursor]:
+    """
+    cursor_dict 전체를 순회하던 CursorHandler.view_includes
+    """
+    result = []
+    for cursor_id in cursors:
+        cursor = cursors[cursor_id]
+        if not cursor.check_in_view(p):
+            continue
+
+        result.append(cursor)
+
+    return result
+
+
+def legacy_move(cursor: Cursor, position: Point):
+    """
+    이동할 때마다 새 뷰 전체를 다시 계산하던 receive_movable_result의 watcher 갱신
+    """
+    CursorHandler.move_cursor(cursor, position)
+
+    cursors_in_view = CursorHandler.exists_range(*view_range(cursor), exclude_ids=[cursor.conn_id])
+
+    original_watching_ids = list(CursorHandler.get_watching(cursor_id=cursor.conn_id))
+    original_watchings = [CursorHandler.get_cursor(id) for id in original_watching_ids]
+    for watching in original_watchings:
+        if not cursor.check_in_view(watching.position):
+            CursorHandler.remove_watcher(watcher=cursor, watching=watching)
+
+    new_watchings = list(filter(lambda c: c.conn_id not in original_watching_ids, cursors_in_view))
+    for other_cursor in new_watchings:
+        CursorHandler.add_watcher(watcher=cursor, watching=other_cursor)
+
+    watchers_new_pos = CursorHandler.view_includes(p=position, exclude_ids=[cursor.conn_id])
+
+    original_watcher_ids = list(CursorHandler.get_watchers(cursor_id=cursor.conn_id))
+    original_watchers = [CursorHandler.get_cursor(id) for id in original_watcher_ids]
+    for watcher in original_watchers:
+        if not watcher.check_in_view(cursor.position):
+            CursorHandler.remove_watcher(watcher=watcher, watching=cursor)
+
+    new_watchers = list(filter(lambda c: c.conn_id not in original_watcher_ids, watchers_new_pos))
+    for other_cursor in new_watchers:
+        CursorHandler.add_watcher(watcher=other_cursor, watching=cursor)
+
+
+def create_cursors(n: int) -> dict[str, Cursor]:
+    rand = random.Random(0)
+    cursors = {}
+    for i in range(n):
+        conn_id = str(i)
+        cursors[conn_id] = Cursor(
+            conn_id=conn_id,
+            position=Point(rand.randint(-WORLD, WORLD), rand.randint(-WORLD, WORLD)),
+            pointer=None,
+            color=Color.BLUE,
+            width=VIEW_WIDTH,
+            height=VIEW_HEIGHT,
+            revive_at=None
+        )
+    return cursors
+
+
+if __name__ == "__main__":
+    cursors = create_cursors(N_CURSORS)
+    CursorHandler.cursor_dict = CursorStore(cursors)
+
+    center = cursors["0"].position
+    start = Point(center.x - VIEW_WIDTH, center.y + VIEW_HEIGHT)
+    end = Point(center.x + VIEW_WIDTH, center.y - VIEW_HEIGHT)
+
+    assert legacy_exists_range(cursors, start, end) == CursorHandler.exists_range(start, end)
+
+    legacy = bench(f"exists_range (linear, {N_CURSORS} cursors)", lambda: legacy_exists_range(cursors, start, end))
+    current = bench(f"exists_range (grid, {N_CURSORS} cursors)", lambda: CursorHandler.exists_range(start, end), number=10000)
+    compare("speedup", legacy, current)
+
+    assert legacy_view_includes(cursors, center) == CursorHandler.view_includes(center)
+
+    legacy = bench(f"view_includes (linear, {N_CURSORS} cursors)", lambda: legacy_view_includes(cursors, center))
+    current = bench(f"view_includes (grid, {N_CURSORS} cursors)", lambda: CursorHandler.view_includes(center), number=10000)
+    compare("speedup", legacy, current)
+
+    cursor = cursors["0"]
+    positions = [Point(center.x + dx, center.y) for dx in (1, 0)]
+    bench("move_cursor x2", lambda: [CursorHandler.move_cursor(cursor, p) for p in positions], number=10000)
+    sizes = [(VIEW_WIDTH + 40, VIEW_HEIGHT), (VIEW_WIDTH, VIEW_HEIGHT)]
+    bench("set_cursor_size x2", lambda: [CursorHandler.set_cursor_size(cursor, w, h) for w, h in sizes], number=10000)
+
+    # 1000개 커서가 모여 있는 곳에서 한 칸씩 왕복 이동
+    crowd = create_cursors(N_CURSORS)
+    rand = random.Random(1)
+    for c in list(crowd.values())[:1000]:
+        c.position = Point(rand.randint(-VIEW_WIDTH, VIEW_WIDTH), rand.randint(-VIEW_HEIGHT, VIEW_HEIGHT))
+    CursorHandler.cursor_dict = CursorStore(crowd)
+    CursorHandler.watchers, CursorHandler.watching = {}, {}
+
+    cursor = crowd["0"]
+    for other in CursorHandler.exists_range(*view_range(cursor), exclude_ids=[cursor.conn_id]):
+        CursorHandler.add_watcher(watcher=cursor, watching=other)
+    for other in CursorHandler.view_includes(cursor.position, exclude_ids=[cursor.conn_id]):
+        CursorHandler.add_watcher(watcher=other, watching=cursor)
+
+    pos = cursor.position
+    steps = [Point(pos.x + 1, pos.y), pos]
+    legacy = bench("legacy_move x2 (crowd of 1000)", lambda: [legacy_move(cursor, p) for p in steps], number=200)
+    current = bench("apply_move x2 (crowd of 1000)", lambda: [CursorHandler.apply_move(cursor, p) for p in steps], number=200)
+    compare("speedup", legacy, current)
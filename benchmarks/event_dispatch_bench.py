@@ -0,0 +1,44 @@
+import asyncio
+from event import EventBroker, Receiver
+from message import Message
+from .utils import bench, compare
+
+N_MESSAGES = 1000
+
+
+async def noop(message: Message):
+    pass
+
+
+async def lookup_publish(message: Message):
+    """
+    이전 publish: id -> Receiver 조회 후 항상 gather
+    """
+    coroutines = []
+    for id in EventBroker.event_dict[message.event]:
+        receiver = Receiver.get_receiver(id)
+        coroutines.append(receiver(message))
+
+    await asyncio.gather(*coroutines)
+
+
+def publish_all(publish, messages: list[Message]):
+    async def run():
+        for message in messages:
+            await publish(message)
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    EventBroker.add_receiver("bench-single")(noop)
+    EventBroker.add_receiver("bench-multi")(noop)
+    EventBroker.add_receiver("bench-multi")(noop)
+
+    for event in ["bench-single", "bench-multi"]:
+        messages = [Message(event=event, payload=None) for _ in range(N_MESSAGES)]
+
+        lookup = bench(f"{event} x{N_MESSAGES} (lookup)", lambda: publish_all(lookup_publish, messages), number=10)
+        table = bench(f"{event} x{N_MESSAGES} (dispatch table)", lambda: publish_all(EventBroker.publish, messages), number=10)
+        compare("speedup", lookup, table)
+        print(f"{'per event':<48} {table / N_MESSAGES * 1_000_000_000:>12.2f} ns")
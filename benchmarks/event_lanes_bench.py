@@ -0,0 +1,71 @@
+import asyncio
+import time
+from event import EventBroker, EventLanes, Lane, Priority
+from message import Message
+
+N_BULK = 50
+# fetch-tiles 하나를 처리하는 데 걸리는 CPU 시간(초)
+BULK_WORK = 0.001
+
+
+async def bulk(message: Message):
+    end = time.perf_counter() + BULK_WORK
+    while time.perf_counter() < end:
+        pass
+
+
+def create_messages() -> tuple[list[Message], Message]:
+    bulks = [Message(event="bench-bulk", header={"sender": f"bulk{i}"}, payload=None) for i in range(N_BULK)]
+    high = Message(event="bench-high", header={"sender": "high"}, payload=None)
+    return bulks, high
+
+
+async def measure(lanes: bool) -> float:
+    """
+    fetch-tiles가 몰린 상태에서 보낸 pointing이 처리될 때까지 걸린 시간(초)
+    """
+    done = asyncio.Event()
+
+    async def high(message: Message):
+        done.set()
+
+    receiver = EventBroker.add_receiver("bench-high")(high)
+    bulks, high_message = create_messages()
+
+    if lanes:
+        EventLanes.start(
+            lanes=[
+                Lane(priority=Priority.HIGH, maxsize=1024, workers=8),
+                Lane(priority=Priority.BULK, maxsize=1024, workers=1)
+            ],
+            event_priority={"bench-high": Priority.HIGH, "bench-bulk": Priority.BULK}
+        )
+
+    start = time.perf_counter()
+    if lanes:
+        for message in bulks + [high_message]:
+            await EventLanes.submit(message)
+    else:
+        # 세션마다 바로 publish
+        tasks = [asyncio.create_task(EventBroker.publish(message)) for message in bulks + [high_message]]
+
+    await done.wait()
+    latency = time.perf_counter() - start
+
+    if lanes:
+        await EventLanes.stop()
+    else:
+        await asyncio.gather(*tasks)
+
+    EventBroker.remove_receiver(receiver)
+    return latency
+
+
+if __name__ == "__main__":
+    EventBroker.add_receiver("bench-bulk")(bulk)
+
+    direct = asyncio.run(measure(lanes=False))
+    laned = asyncio.run(measure(lanes=True))
+
+    print(f"{f'pointing latency, {N_BULK} fetch-tiles pending (direct)':<60} {direct * 1000:>8.2f} ms")
+    print(f"{f'pointing latency, {N_BULK} fetch-tiles pending (lanes)':<60} {laned * 1000:>8.2f} ms")
@@ -0,0 +1,46 @@
+import asyncio
+import io
+from contextlib import redirect_stdout
+from board.data import Point
+from event import EventBroker, Tracer, TraceLevel, PrintSink
+from message import Message
+from message.payload import MovedPayload
+from cursor.data import Color
+from .utils import bench, compare
+
+N_MESSAGES = 1000
+
+
+async def noop(message: Message):
+    pass
+
+
+def publish_all(messages: list[Message]):
+    async def run():
+        for message in messages:
+            await EventBroker.publish(message)
+
+    # 출력은 버린다.
+    with redirect_stdout(io.StringIO()):
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    EventBroker.add_receiver("bench")(noop)
+
+    messages = [
+        Message(
+            event="bench",
+            header={"target_conns": ["a", "b"], "origin_event": "moved"},
+            payload=MovedPayload(origin_position=Point(0, 0), new_position=Point(0, 1), color=Color.BLUE)
+        )
+        for _ in range(N_MESSAGES)
+    ]
+
+    # 이전 _debug와 같은 동작 (stdout은 버림)
+    Tracer.configure(level=TraceLevel.PAYLOAD, sink=PrintSink())
+    traced = bench(f"publish x{N_MESSAGES} (payload trace)", lambda: publish_all(messages), number=10)
+
+    Tracer.configure(level=TraceLevel.OFF)
+    off = bench(f"publish x{N_MESSAGES} (trace off)", lambda: publish_all(messages), number=10)
+    compare("speedup", traced, off)
@@ -0,0 +1,128 @@
+import json
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from board.data import Point
+from message import Message
+from message.internal.message import DECODABLE_PAYLOAD_DICT
+from message.internal import json_codec
+from message.payload import (
+    Payload,
+    ParsablePayload,
+    InvalidFieldException,
+    MissingFieldException,
+    DumbHumanException,
+    TilesEvent,
+    PointEvent,
+    MoveEvent,
+    NewConnEvent,
+    FetchTilesPayload,
+    TilesPayload,
+    PointingPayload,
+    ClickType,
+    MovingPayload,
+    SetViewSizePayload
+)
+from .utils import bench, compare
+
+SAMPLES: dict[str, Payload] = {
+    TilesEvent.FETCH_TILES: FetchTilesPayload(start_p=Point(-100, 50), end_p=Point(99, -49)),
+    TilesEvent.TILES: TilesPayload(start_p=Point(-2, 1), end_p=Point(1, -2), tiles="81" * 16),
+    PointEvent.POINTING: PointingPayload(position=Point(3, 4), click_type=ClickType.GENERAL_CLICK),
+    MoveEvent.MOVING: MovingPayload(position=Point(3, 4)),
+    NewConnEvent.SET_VIEW_SIZE: SetViewSizePayload(width=200, height=100)
+}
+
+
+def legacy_to_str(message: Message) -> str:
+    """
+    이전 Message.to_str: 객체마다 default 훅으로 직렬화
+    slots dataclass에는 __dict__가 없으므로 필드로 dict를 만든다.
+    """
+    data = Message(event=message.event, payload=message.payload)
+    del data.header
+    del data._frames
+    return json.dumps(
+        data,
+        default=lambda o: {f.name: getattr(o, f.name) for f in fields(o)} if is_dataclass(o) else o.__dict__,
+        sort_keys=True
+    )
+
+
+def legacy_from_dict(cls, dict: dict):
+    """
+    이전 Payload._from_dict: 매번 __annotations__를 보고 decode
+    """
+    kwargs = {}
+
+    missing = set(cls.__annotations__.keys()) - set(dict.keys())
+    if len(missing) > 0:
+        raise MissingFieldException(missing)
+
+    for key in dict:
+        if not key in cls.__annotations__:
+            raise InvalidFieldException(key, dict[key])
+
+        t = cls.__annotations__[key]
+        if hasattr(t, "__origin__") and t.__origin__ == ParsablePayload:
+            if len(t.__args__) != 1:
+                raise DumbHumanException()
+            try:
+                kwargs[key] = t.__args__[0](**dict[key])
+            except Exception as e:
+                raise InvalidFieldException(key, e)
+            continue
+
+        if issubclass(t, Payload):
+            kwargs[key] = legacy_from_dict(t, dict[key])
+            continue
+
+        if issubclass(t, Enum) and dict[key] in t:
+            kwargs[key] = t(dict[key])
+            continue
+
+        if not type(dict[key]) == t:
+            raise InvalidFieldException(key, dict[key])
+
+        kwargs[key] = t(dict[key])
+
+    return cls(**kwargs)
+
+
+def legacy_from_str(msg: str) -> Message:
+    decoded = json.loads(msg)
+
+    event = decoded["event"]
+    payload = legacy_from_dict(DECODABLE_PAYLOAD_DICT[event], decoded["payload"])
+
+    message = Message(event=event, payload=payload)
+    if "header" in decoded:
+        message.header = decoded["header"]
+
+    return message
+
+
+if __name__ == "__main__":
+    print(f"json backend: {'orjson' if json_codec.orjson is not None else 'json'}")
+
+    # 받을 수 있는 모든 이벤트를 다룬다.
+    assert SAMPLES.keys() == DECODABLE_PAYLOAD_DICT.keys()
+
+    for event, payload in SAMPLES.items():
+        event = event.value
+        message = Message(event=event, payload=payload)
+        encoded = message.to_str()
+        assert json.loads(encoded) == json.loads(legacy_to_str(message))
+
+        old = bench(f"{event} encode (legacy)", lambda: legacy_to_str(message), number=10000)
+        new = bench(f"{event} encode (compiled)", lambda: message.to_str(), number=10000)
+        compare(f"{event} encode speedup", old, new)
+
+        old = bench(f"{event} decode (legacy)", lambda: legacy_from_str(encoded), number=10000)
+        new = bench(f"{event} decode (compiled)", lambda: Message.from_str(encoded), number=10000)
+        compare(f"{event} decode speedup", old, new)
+
+        data = json.loads(encoded)["payload"]
+        cls = DECODABLE_PAYLOAD_DICT[event]
+        old = bench(f"{event} _from_dict (legacy)", lambda: legacy_from_dict(cls, data), number=10000)
+        new = bench(f"{event} _from_dict (compiled)", lambda: cls._from_dict(data), number=10000)
+        compare(f"{event} _from_dict speedup", old, new)
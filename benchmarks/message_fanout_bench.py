@@ -0,0 +1,32 @@
+from board.data import Point
+from message import Message
+from message.payload import TileUpdatedPayload
+from .utils import bench, compare
+
+N_CONNS = 500
+
+
+def create_message() -> Message:
+    return Message(
+        event="tile-updated",
+        payload=TileUpdatedPayload(position=Point(1, 2), tile="81")
+    )
+
+
+def encode_each(message: Message):
+    """
+    이전 방식: 연결마다 to_str()
+    """
+    for _ in range(N_CONNS):
+        message.to_str()
+
+
+def encode_once(message: Message):
+    for _ in range(N_CONNS):
+        message.to_frame()
+
+
+if __name__ == "__main__":
+    each = bench(f"tile-updated to {N_CONNS} conns (to_str per conn)", lambda: encode_each(create_message()), number=100)
+    once = bench(f"tile-updated to {N_CONNS} conns (to_frame)", lambda: encode_once(create_message()), number=100)
+    compare("speedup", each, once)
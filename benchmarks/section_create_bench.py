@@ -0,0 +1,52 @@
+from random import randint
+from board.data import Point, Section
+from board.data.internal.section import (
+    MINE_TILE,
+    check_neighbor_restrictions,
+    increase_number_around
+)
+from .utils import bench, compare
+
+
+def legacy_create(p: Point):
+    """
+    벡터화 이전의 Section.create. 지뢰를 하나씩 랜덤 위치에 놓는다.
+    """
+    total = Section.LENGTH**2
+    mine_cnt = int((total * Section.MINE_RATIO)//1)
+
+    data = bytearray(total)
+
+    for _ in range(mine_cnt):
+        while True:
+            rand_p = Point(
+                x=randint(0, Section.LENGTH - 1),
+                y=randint(0, Section.LENGTH - 1)
+            )
+
+            rand_idx = (rand_p.y * Section.LENGTH) + rand_p.x
+            cur_tile = data[rand_idx]
+
+            if cur_tile == MINE_TILE:
+                continue
+
+            valid = check_neighbor_restrictions(tiles=data, p=rand_p)
+            if not valid:
+                continue
+
+            data[rand_idx] = MINE_TILE
+
+            increase_number_around(tiles=data, p=rand_p)
+            break
+
+    return Section(p=p, data=data)
+
+
+if __name__ == "__main__":
+    Section.LENGTH = 100
+
+    p = Point(0, 0)
+
+    legacy = bench("Section.create (legacy, per-mine randint)", lambda: legacy_create(p), number=10)
+    current = bench("Section.create (numpy)", lambda: Section.create(p), number=10)
+    compare("speedup", legacy, current)
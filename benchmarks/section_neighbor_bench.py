@@ -0,0 +1,103 @@
+from random import randrange
+from board.data import Point, Section
+from board.data.internal.section import (
+    MINE_TILE,
+    _delta,
+    create_section_data,
+    check_neighbor_restrictions,
+    increase_number_around,
+    decrease_number_around_and_count_mines
+)
+from .utils import bench, compare
+
+N_PROBES = 10000
+
+
+def legacy_for_each_neighbor(tiles: bytearray, p: Point, func):
+    """
+    이전 for_each_neighbor: 방향마다 Point를 만들고 범위 검사 후 func 호출
+    """
+    for dx, dy in _delta:
+        np = Point(p.x+dx, p.y+dy)
+        if \
+                np.x < 0 or np.x >= Section.LENGTH or \
+                np.y < 0 or np.y >= Section.LENGTH:
+            continue
+
+        new_idx = (np.y * Section.LENGTH) + np.x
+        tile, stop = func(tiles[new_idx], np)
+        if tile is not None:
+            tiles[new_idx] = tile
+        if stop:
+            break
+
+
+def legacy_check_neighbor_restrictions(tiles: bytearray, p: Point) -> bool:
+    valid = True
+
+    def do(t: int, p: Point):
+        nonlocal valid
+        if t & 0b111 == 7:
+            valid = False
+        return None, not valid
+
+    legacy_for_each_neighbor(tiles, p, do)
+    return valid
+
+
+def legacy_increase_number_around(tiles: bytearray, p: Point):
+    def do(t: int, p: Point):
+        if t == MINE_TILE:
+            return None, False
+        return t + 1, False
+
+    legacy_for_each_neighbor(tiles, p, do)
+
+
+def legacy_decrease_number_around_and_count_mines(tiles: bytearray, p: Point) -> int:
+    cnt = 0
+
+    def do(t: int, p: Point):
+        nonlocal cnt
+        if t == MINE_TILE:
+            cnt += 1
+            return None, False
+        return t - 1, False
+
+    legacy_for_each_neighbor(tiles, p, do)
+    return cnt
+
+
+def probe(check, increase, decrease, tiles: bytearray, points: list[Point]):
+    for p in points:
+        check(tiles, p)
+        # 증가 후 감소로 원래대로 되돌린다.
+        increase(tiles, p)
+        decrease(tiles, p)
+
+
+if __name__ == "__main__":
+    Section.LENGTH = 100
+
+    tiles = create_section_data(length=Section.LENGTH, mine_ratio=Section.MINE_RATIO)
+    # 주변에 7이 있으면 증가시킬 때 숫자 범위를 넘으므로 피한다.
+    points = []
+    while len(points) < N_PROBES:
+        p = Point(randrange(Section.LENGTH), randrange(Section.LENGTH))
+        if check_neighbor_restrictions(tiles, p):
+            points.append(p)
+
+    legacy = bench(
+        f"neighbour probes x{N_PROBES} (Point + closure)",
+        lambda: probe(
+            legacy_check_neighbor_restrictions, legacy_increase_number_around,
+            legacy_decrease_number_around_and_count_mines, tiles, points
+        ),
+        number=10
+    )
+    current = bench(
+        f"neighbour probes x{N_PROBES} (index table)",
+        lambda: probe(check_neighbor_restrictions, increase_number_around, decrease_number_around_and_count_mines, tiles, points),
+        number=10
+    )
+    compare("speedup", legacy, current)
@@ -0,0 +1,91 @@
+from board.data import Point, Section
+from board.data.internal.section import (
+    MINE_TILE,
+    create_section_data,
+    affect_origin_mines_to_new,
+    affect_new_mines_to_origin
+)
+from .utils import bench, compare
+
+
+def legacy_apply_vertical(self: Section, neighbor: Section):
+    """
+    이전 apply_neighbor_vertical: 모서리 칸마다 Python 반복
+    """
+    if self.p.y > neighbor.p.y:
+        self_y, neighbor_y = Section.LENGTH - 1, 0
+    else:
+        self_y, neighbor_y = 0, Section.LENGTH - 1
+
+    for x in range(Section.LENGTH):
+        self_idx = (self_y * Section.LENGTH) + x
+        neighbor_idx = (neighbor_y * Section.LENGTH) + x
+        leftmost = max(0, x - 1)
+        rightmost = min(x + 1, Section.LENGTH - 1)
+
+        if self.data[self_idx] == MINE_TILE:
+            affect_origin_mines_to_new(
+                new_tiles=neighbor.data, x_range=(leftmost, rightmost), y_range=(neighbor_y, neighbor_y)
+            )
+
+        if neighbor.data[neighbor_idx] == MINE_TILE:
+            affect_new_mines_to_origin(
+                origin_tiles=self.data, new_tiles=neighbor.data, mine_p=Point(x, neighbor_y),
+                x_range=(leftmost, rightmost), y_range=(self_y, self_y)
+            )
+
+
+def legacy_apply_horizontal(self: Section, neighbor: Section):
+    """
+    이전 apply_neighbor_horizontal: 모서리 칸마다 Python 반복
+    """
+    if self.p.x > neighbor.p.x:
+        self_x, neighbor_x = 0, Section.LENGTH - 1
+    else:
+        self_x, neighbor_x = Section.LENGTH - 1, 0
+
+    for y in range(Section.LENGTH):
+        self_idx = (y * Section.LENGTH) + self_x
+        neighbor_idx = (y * Section.LENGTH) + neighbor_x
+        top = min(y + 1, Section.LENGTH - 1)
+        bottom = max(0, y - 1)
+
+        if self.data[self_idx] == MINE_TILE:
+            affect_origin_mines_to_new(
+                new_tiles=neighbor.data, x_range=(neighbor_x, neighbor_x), y_range=(bottom, top)
+            )
+
+        if neighbor.data[neighbor_idx] == MINE_TILE:
+            affect_new_mines_to_origin(
+                origin_tiles=self.data, new_tiles=neighbor.data, mine_p=Point(neighbor_x, y),
+                x_range=(self_x, self_x), y_range=(bottom, top)
+            )
+
+
+def stitch(apply, pairs: list[tuple[Section, Section]]):
+    for origin, new in pairs:
+        # 매번 원본 데이터에서 시작
+        apply(Section(origin.p, bytearray(origin.data)), Section(new.p, bytearray(new.data)))
+
+
+if __name__ == "__main__":
+    Section.LENGTH = 100
+
+    def create_pairs(new_p: Point) -> list[tuple[Section, Section]]:
+        return [
+            (
+                Section(Point(0, 0), create_section_data(Section.LENGTH, Section.MINE_RATIO)),
+                Section(new_p, create_section_data(Section.LENGTH, Section.MINE_RATIO))
+            )
+            for _ in range(20)
+        ]
+
+    vertical_pairs = create_pairs(Point(0, 1))
+    old = bench("apply_neighbor_vertical x20 (legacy)", lambda: stitch(legacy_apply_vertical, vertical_pairs), number=20)
+    new = bench("apply_neighbor_vertical x20 (stitch_edge)", lambda: stitch(Section.apply_neighbor_vertical, vertical_pairs), number=20)
+    compare("vertical speedup", old, new)
+
+    horizontal_pairs = create_pairs(Point(1, 0))
+    old = bench("apply_neighbor_horizontal x20 (legacy)", lambda: stitch(legacy_apply_horizontal, horizontal_pairs), number=20)
+    new = bench("apply_neighbor_horizontal x20 (stitch_edge)", lambda: stitch(Section.apply_neighbor_horizontal, horizontal_pairs), number=20)
+    compare("horizontal speedup", old, new)
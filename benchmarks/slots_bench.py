@@ -0,0 +1,52 @@
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from board.data import Point, Tile
+from cursor.data import Cursor, Color
+from message.payload import MovedPayload
+from .utils import bench, compare
+
+N_OBJECTS = 100_000
+
+
+def dict_variant(cls: type) -> type:
+    """
+    같은 필드를 가진, slots 없는 (__dict__가 있는) dataclass
+    """
+    return make_dataclass(f"Dict{cls.__name__}", [(f.name, f.type) for f in fields(cls)])
+
+
+def measure_memory(create) -> int:
+    """
+    create()로 N_OBJECTS개를 만들었을 때 할당된 byte 수
+    """
+    tracemalloc.start()
+    objects = [create() for _ in range(N_OBJECTS)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del objects
+    return size
+
+
+if __name__ == "__main__":
+    samples = {
+        Point: lambda cls: cls(1, 2),
+        Tile: lambda cls: cls(is_open=True, is_mine=False, is_flag=False, color=None, number=3),
+        Cursor: lambda cls: cls(
+            conn_id="a", position=Point(0, 0), pointer=None,
+            color=Color.RED, width=10, height=10, revive_at=None
+        ),
+        MovedPayload: lambda cls: cls(origin_position=Point(0, 0), new_position=Point(0, 1), color=Color.RED)
+    }
+
+    for cls, create in samples.items():
+        legacy = dict_variant(cls)
+
+        legacy_size = measure_memory(lambda: create(legacy))
+        slots_size = measure_memory(lambda: create(cls))
+        print(f"{f'{cls.__name__} x{N_OBJECTS} memory (__dict__)':<48} {legacy_size / 1024:>12.0f} KiB")
+        print(f"{f'{cls.__name__} x{N_OBJECTS} memory (slots)':<48} {slots_size / 1024:>12.0f} KiB")
+
+        old = bench(f"{cls.__name__} create (__dict__)", lambda: create(legacy), number=100_000)
+        new = bench(f"{cls.__name__} create (slots)", lambda: create(cls), number=100_000)
+        compare(f"{cls.__name__} create speedup", old, new)
@@ -0,0 +1,33 @@
+from board.data import Point
+from board.data.handler import BoardHandler
+from message.payload import TilesPayload, TileEncoding
+from message.payload.internal.tiles_payload import compress_tiles
+from .utils import bench
+
+import zlib
+
+
+if __name__ == "__main__":
+    # 200x100 뷰포트
+    start, end = Point(-100, 50), Point(99, -49)
+    tiles = BoardHandler.fetch(start, end, hide_info=True)
+    payload = TilesPayload(start_p=start, end_p=end, tiles=tiles.to_str())
+    raw = tiles.to_bytes()
+    raw_payload = TilesPayload(start_p=start, end_p=end, tiles=raw)
+
+    print(f"hex (json): {len(payload.tiles)} bytes")
+    print(f"raw (binary): {len(raw)} bytes")
+    for level in (1, 6, 9):
+        size = len(zlib.compress(raw, level=level))
+        print(f"deflate level {level}: {size} bytes ({size / len(raw):.1%})")
+        bench(f"zlib.compress level {level}", lambda: zlib.compress(raw, level=level), number=1000)
+
+    bench("to_bytes (hex)", lambda: payload.to_bytes(TileEncoding.HEX), number=1000)
+    bench("to_bytes (raw)", lambda: raw_payload.to_bytes(TileEncoding.HEX), number=1000)
+
+    def deflate_uncached():
+        compress_tiles.cache_clear()
+        return payload.to_bytes(TileEncoding.DEFLATE)
+
+    bench("to_bytes (deflate, uncached)", deflate_uncached, number=1000)
+    bench("to_bytes (deflate, cached)", lambda: payload.to_bytes(TileEncoding.DEFLATE), number=1000)
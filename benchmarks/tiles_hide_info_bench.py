@@ -0,0 +1,38 @@
+from board.data import Point, Tiles
+from board.data.handler import BoardHandler
+from .utils import bench, compare
+
+
+def legacy_hide_info(tiles: Tiles):
+    """
+    byte 단위로 순회하던 Tiles.hide_info
+    """
+    opened = 0b10000000
+    mask = 0b10111000
+    for idx in range(len(tiles.data)):
+        b = tiles.data[idx]
+        if b & opened:
+            continue
+
+        b &= mask
+        tiles.data[idx] = b
+
+
+def fetch_then_hide(start: Point, end: Point):
+    tiles = BoardHandler.fetch(start, end)
+    tiles.hide_info()
+    return tiles
+
+
+if __name__ == "__main__":
+    # 200x100 뷰포트
+    start, end = Point(-100, 50), Point(99, -49)
+    data = BoardHandler.fetch(start, end).data
+
+    legacy = bench("Tiles.hide_info (legacy loop)", lambda: legacy_hide_info(Tiles(data=data.copy())), number=100)
+    current = bench("Tiles.hide_info (translate)", lambda: Tiles(data=data.copy()).hide_info(), number=100)
+    compare("speedup", legacy, current)
+
+    two_pass = bench("fetch + hide_info", lambda: fetch_then_hide(start, end), number=1000)
+    one_pass = bench("fetch(hide_info=True)", lambda: BoardHandler.fetch(start, end, hide_info=True), number=1000)
+    compare("speedup", two_pass, one_pass)
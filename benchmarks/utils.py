@@ -0,0 +1,14 @@
+import timeit
+
+
+def bench(name: str, func, number: int = 100, repeat: int = 5) -> float:
+    """
+    func를 number번 실행하는 것을 repeat번 반복하여 가장 빠른 1회 실행 시간(초)을 출력, 반환한다.
+    """
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    print(f"{name:<48} {best * 1_000_000:>12.2f} us")
+    return best
+
+
+def compare(name: str, baseline: float, target: float):
+    print(f"{name:<48} {baseline / target:>12.2f} x")
@@ -1,5 +1,5 @@
 from .internal.point import Point
-from .internal.section import Section
+from .internal.section import Section, create_section_data
 from .internal.tile import Tile
-from .internal.tiles import Tiles
+from .internal.tiles import Tiles, HIDE_INFO_TABLE
 from .internal.exceptions import InvalidTileException, InvalidDataLengthException
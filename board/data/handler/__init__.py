@@ -1 +1,4 @@
 from .internal.board import BoardHandler
+from .internal.section_pool import SectionPool
+from .internal.section_store import SectionStore
+from .internal.prefetcher import SectionPrefetcher
@@ -1,7 +1,12 @@
-from board.data import Point, Section, Tile, Tiles
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from board.data import Point, Section, Tile, Tiles, InvalidDataLengthException, HIDE_INFO_TABLE, create_section_data
+from .section_pool import SectionPool
+from .section_store import SectionStore
 
 
-def init_first_section() -> dict[int, dict[int, Section]]:
+def init_first_section() -> SectionStore:
     section_0_0 = Section.create(Point(0, 0))
 
     tiles = section_0_0.fetch(Point(0, 0))
@@ -11,55 +16,138 @@ def init_first_section() -> dict[int, dict[int, Section]]:
 
     section_0_0.update(Tiles(data=[t.data]), Point(0, 0))
 
-    return {0: {0: section_0_0}}
+    return SectionStore([section_0_0])
 
 
 class BoardHandler:
-    # sections[y][x]
-    sections: dict[int, dict[int, Section]] = init_first_section()
+    sections: SectionStore = init_first_section()
+
+    # 주변 섹션과 적용되지 않은 섹션 데이터를 미리 만들어두는 풀
+    section_pool: SectionPool = SectionPool(size=16, low_watermark=4)
+
+    # None이 아니면 섹션 생성을 이 executor에서 수행한다. (ensure_sections)
+    executor: Executor | None = None
+    # 생성 중인 섹션들. (x, y) -> future
+    _in_flight: dict[tuple[int, int], asyncio.Future] = {}
+
+    @staticmethod
+    def use_process_pool(max_workers: int | None = None):
+        """
+        섹션 생성을 프로세스 풀에서 수행하도록 설정한다.
+        섹션 풀을 채우는 작업도 같은 프로세스 풀을 사용한다.
+        """
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        BoardHandler.set_executor(executor)
+
+    @staticmethod
+    def set_executor(executor: Executor | None):
+        BoardHandler.executor = executor
+        BoardHandler.section_pool.executor = executor
+
+    @staticmethod
+    async def ensure_sections(start: Point, end: Point):
+        """
+        start ~ end 범위에 없는 섹션들을 executor에서 생성하여 붙인다.
+
+        executor가 설정되어 있지 않으면 아무것도 하지 않는다. (fetch 시 동기적으로 생성)
+        """
+        if BoardHandler.executor is None:
+            return
+
+        await BoardHandler.create_sections(start, end)
+
+    @staticmethod
+    async def create_sections(start: Point, end: Point):
+        """
+        start ~ end 범위에 없는 섹션들을 백그라운드에서 생성하여 붙인다.
+        같은 섹션에 대한 요청이 동시에 들어오면 하나의 생성 작업을 함께 기다린다.
+
+        executor가 설정되어 있지 않으면 이벤트 루프의 기본 executor를 사용한다.
+        """
+        futures = [
+            BoardHandler._create_section_in_background(x, y)
+            for x, y in BoardHandler.missing_sections(start, end)
+        ]
+
+        if len(futures) > 0:
+            await asyncio.gather(*futures)
 
     @staticmethod
-    def fetch(start: Point, end: Point) -> Tiles:
+    def missing_sections(start: Point, end: Point) -> list[tuple[int, int]]:
+        """
+        start ~ end 범위에서 아직 생성되지 않은 섹션 좌표 (x, y) 목록
+        """
+        return BoardHandler.sections.missing(start, end)
+
+    @staticmethod
+    def fetch(start: Point, end: Point, hide_info: bool = False) -> Tiles:
         # 반환할 데이터 공간 미리 할당
         out_width, out_height = (end.x - start.x + 1), (start.y - end.y + 1)
         out = bytearray(out_width * out_height)
 
-        for sec_y in range(start.y // Section.LENGTH, end.y // Section.LENGTH - 1, - 1):
-            for sec_x in range(start.x // Section.LENGTH, end.x // Section.LENGTH + 1):
-                section = BoardHandler._get_or_create_section(sec_x, sec_y)
+        BoardHandler.fetch_into(start, end, out, hide_info=hide_info)
+
+        return Tiles(data=out)
+
+    @staticmethod
+    def fetch_into(start: Point, end: Point, out: bytearray | memoryview, hide_info: bool = False) -> int:
+        """
+        start ~ end 범위의 타일들을 out 앞부분에 row 순서대로 채운다.
+        각 섹션의 row를 중간 버퍼 없이 out으로 바로 복사하므로, out을 재사용하면 할당이 일어나지 않는다.
+
+        hide_info가 True면 채운 영역에서 닫힌 타일의 정보를 제거한다. (Tiles.hide_info)
+
+        채운 byte 수를 반환한다.
+        """
+        out_width, out_height = (end.x - start.x + 1), (start.y - end.y + 1)
+        size = out_width * out_height
+        if len(out) < size:
+            raise InvalidDataLengthException(expected=size, actual=len(out))
 
-                inner_start = Point(
-                    x=max(start.x, section.abs_x) - (section.abs_x),
-                    y=min(start.y, section.abs_y + Section.LENGTH-1) - section.abs_y
-                )
-                inner_end = Point(
-                    x=min(end.x, section.abs_x + Section.LENGTH-1) - section.abs_x,
-                    y=max(end.y, section.abs_y) - section.abs_y
-                )
+        for sec_x, sec_y in BoardHandler.sections.missing(start, end):
+            BoardHandler._get_or_create_section(sec_x, sec_y)
 
-                fetched = section.fetch(start=inner_start, end=inner_end)
+        length = Section.LENGTH
 
-                x_gap, y_gap = (inner_end.x - inner_start.x + 1), (inner_start.y - inner_end.y + 1)
+        with memoryview(out) as out_view:
+            for section in BoardHandler.sections.overlapping(start, end):
+                abs_x, abs_y = section.abs_x, section.abs_y
 
+                # 섹션 내부 좌표
+                left = max(start.x, abs_x) - abs_x
+                right = min(end.x, abs_x + length - 1) - abs_x
+                top = min(start.y, abs_y + length - 1) - abs_y
+                bottom = max(end.y, abs_y) - abs_y
+
+                x_gap = right - left + 1
+
+                # (row 길이 * y의 실제 인덱스 위치) + x 오프셋
+                data_idx = length * (length - top - 1) + left
                 # start로부터 떨어진 거리
-                out_x = (section.abs_x + inner_start.x) - start.x
-                out_y = start.y - (section.abs_y + inner_start.y)
+                out_idx = out_width * (start.y - (abs_y + top)) + (abs_x + left - start.x)
 
-                for row_num in range(y_gap):
-                    out_idx = (out_width * (out_y + row_num)) + out_x
-                    data_idx = row_num * x_gap
+                with memoryview(section.data) as data_view:
+                    for _ in range(top - bottom + 1):
+                        out_view[out_idx:out_idx+x_gap] = data_view[data_idx:data_idx+x_gap]
 
-                    data = fetched.data[data_idx:data_idx+x_gap]
-                    out[out_idx:out_idx+x_gap] = data
+                        data_idx += length
+                        out_idx += out_width
 
-        return Tiles(data=out)
+            if hide_info:
+                # 복사된 영역 전체를 한 번에 변환
+                out_view[:size] = out_view[:size].tobytes().translate(HIDE_INFO_TABLE)
+
+        return size
 
     @staticmethod
     def update_tile(p: Point, tile: Tile):
         tiles = Tiles(data=bytearray([tile.data]))
 
         sec_p = Point(x=p.x // Section.LENGTH, y=p.y // Section.LENGTH)
-        section = BoardHandler.sections[sec_p.y][sec_p.x]
+        section = BoardHandler.sections.get(sec_p.x, sec_p.y)
 
         inner_p = Point(
             x=p.x - section.abs_x,
@@ -69,44 +157,67 @@ class BoardHandler:
         section.update(data=tiles, start=inner_p)
 
         # 지금은 안 해도 되긴 할텐데 일단 해 놓기
-        BoardHandler.sections[sec_p.y][sec_p.x] = section
+        BoardHandler.sections.put(section)
 
     @staticmethod
     def _get_or_create_section(x: int, y: int) -> Section:
-        if y not in BoardHandler.sections:
-            BoardHandler.sections[y] = {}
+        section = BoardHandler.sections.get(x, y)
+        if section is None:
+            data = BoardHandler.section_pool.take()
+            if data is not None:
+                new_section = Section(Point(x, y), data)
+            else:
+                new_section = Section.create(Point(x, y))
 
-        if x not in BoardHandler.sections[y]:
-            new_section = Section.create(Point(x, y))
+            BoardHandler._attach_section(new_section)
+            section = new_section
 
-            # (x, y)
-            delta = [
-                (0, 1), (0, -1), (-1, 0), (1, 0),  # 상하좌우
-                (-1, 1), (1, 1), (-1, -1), (1, -1),  # 좌상 우상 좌하 우하
-            ]
+        return section
 
-            # 주변 섹션과 새로운 섹션의 인접 타일을 서로 적용시킨다.
-            for dx, dy in delta:
-                nx, ny = x+dx, y+dy
-                neighbor = BoardHandler._get_section_or_none(nx, ny)
-                # 주변 섹션이 없을 수 있음.
-                if neighbor is None:
-                    continue
+    @staticmethod
+    def _create_section_in_background(x: int, y: int) -> asyncio.Future:
+        key = (x, y)
+        if key in BoardHandler._in_flight:
+            return BoardHandler._in_flight[key]
+
+        future = asyncio.ensure_future(BoardHandler._generate_and_attach(x, y))
+        BoardHandler._in_flight[key] = future
+        future.add_done_callback(lambda _: BoardHandler._in_flight.pop(key, None))
 
-                if dx != 0 and dy != 0:
-                    neighbor.apply_neighbor_diagonal(new_section)
-                elif dx != 0:
-                    neighbor.apply_neighbor_horizontal(new_section)
-                elif dy != 0:
-                    neighbor.apply_neighbor_vertical(new_section)
+        return future
 
-                BoardHandler.sections[ny][nx] = neighbor
+    @staticmethod
+    async def _generate_and_attach(x: int, y: int):
+        data = BoardHandler.section_pool.take()
+        if data is None:
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(
+                BoardHandler.executor,
+                create_section_data, Section.LENGTH, Section.MINE_RATIO
+            )
 
-            BoardHandler.sections[y][x] = new_section
+        # 기다리는 동안 fetch에서 동기적으로 생성되었을 수 있음.
+        if (x, y) in BoardHandler.sections:
+            return
 
-        return BoardHandler.sections[y][x]
+        BoardHandler._attach_section(Section(Point(x, y), data))
 
     @staticmethod
-    def _get_section_or_none(x: int, y: int) -> Section | None:
-        if y in BoardHandler.sections and x in BoardHandler.sections[y]:
-            return BoardHandler.sections[y][x]
+    def _attach_section(new_section: Section):
+        """
+        주변 섹션과 새로운 섹션의 인접 타일을 서로 적용시킨 뒤 보드에 추가한다.
+        """
+        x, y = new_section.p.x, new_section.p.y
+
+        # 주변 섹션이 없을 수 있음.
+        for dx, dy, neighbor in BoardHandler.sections.neighbors(x, y):
+            if dx != 0 and dy != 0:
+                neighbor.apply_neighbor_diagonal(new_section)
+            elif dx != 0:
+                neighbor.apply_neighbor_horizontal(new_section)
+            elif dy != 0:
+                neighbor.apply_neighbor_vertical(new_section)
+
+            BoardHandler.sections.put(neighbor)
+
+        BoardHandler.sections.put(new_section)
@@ -0,0 +1,105 @@
+import asyncio
+from dataclasses import dataclass
+from board.data import Point, Section
+from .board import BoardHandler
+
+
+@dataclass
+class TrackedView:
+    position: Point
+    width: int
+    height: int
+    # 최근 이동 방향. 이동할 때마다 MOMENTUM 비율로 이전 값을 유지한다.
+    vx: float = 0
+    vy: float = 0
+
+
+class SectionPrefetcher:
+    """
+    커서의 최근 이동 방향과 뷰 크기를 추적하여,
+    이동 방향으로 뷰보다 한 섹션 앞까지의 섹션들을 백그라운드에서 미리 생성한다.
+    """
+    views: dict[str, TrackedView] = {}
+
+    # 이동 방향 계산 시 이전 이동 방향을 유지하는 비율
+    MOMENTUM = 0.5
+    # 이 값 이상이면 해당 방향으로 이동 중인 것으로 본다.
+    THRESHOLD = 0.5
+
+    # 실행 중인 prefetch 작업들. 작업이 GC 되지 않도록 참조를 들고 있는다.
+    _tasks: set[asyncio.Task] = set()
+
+    @staticmethod
+    def track(conn_id: str, position: Point, width: int, height: int):
+        SectionPrefetcher.views[conn_id] = TrackedView(position=position, width=width, height=height)
+
+    @staticmethod
+    def untrack(conn_id: str):
+        SectionPrefetcher.views.pop(conn_id, None)
+
+    @staticmethod
+    def set_size(conn_id: str, width: int, height: int):
+        if conn_id not in SectionPrefetcher.views:
+            return
+
+        view = SectionPrefetcher.views[conn_id]
+        view.width, view.height = width, height
+
+    @staticmethod
+    def move(conn_id: str, position: Point):
+        """
+        커서의 이동을 기록하고, 이동 방향 앞쪽에 없는 섹션이 있으면 생성 작업을 시작한다.
+        """
+        if conn_id not in SectionPrefetcher.views:
+            return
+
+        view = SectionPrefetcher.views[conn_id]
+
+        m = SectionPrefetcher.MOMENTUM
+        view.vx = (view.vx * m) + ((position.x - view.position.x) * (1 - m))
+        view.vy = (view.vy * m) + ((position.y - view.position.y) * (1 - m))
+        view.position = position
+
+        start, end = SectionPrefetcher.get_prefetch_range(view)
+        if start is None:
+            return
+
+        if len(BoardHandler.missing_sections(start, end)) == 0:
+            return
+
+        task = asyncio.create_task(BoardHandler.create_sections(start, end))
+        SectionPrefetcher._tasks.add(task)
+        task.add_done_callback(SectionPrefetcher._tasks.discard)
+
+    @staticmethod
+    def get_prefetch_range(view: TrackedView) -> tuple[Point | None, Point | None]:
+        """
+        뷰 범위를 이동 방향으로 Section.LENGTH 만큼 늘린 범위.
+        이동 중이 아니면 (None, None)
+        """
+        dir_x = direction(view.vx, SectionPrefetcher.THRESHOLD)
+        dir_y = direction(view.vy, SectionPrefetcher.THRESHOLD)
+
+        if dir_x == 0 and dir_y == 0:
+            return None, None
+
+        pos = view.position
+
+        start = Point(
+            x=pos.x - view.width - (Section.LENGTH if dir_x < 0 else 0),
+            y=pos.y + view.height + (Section.LENGTH if dir_y > 0 else 0)
+        )
+        end = Point(
+            x=pos.x + view.width + (Section.LENGTH if dir_x > 0 else 0),
+            y=pos.y - view.height - (Section.LENGTH if dir_y < 0 else 0)
+        )
+
+        return start, end
+
+
+def direction(v: float, threshold: float) -> int:
+    if v >= threshold:
+        return 1
+    if v <= -threshold:
+        return -1
+    return 0
@@ -0,0 +1,96 @@
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from board.data import Section, create_section_data
+
+
+class SectionPool:
+    """
+    미리 생성해둔 섹션 데이터 풀.
+    주변 섹션과의 적용(apply_neighbor_*)은 하지 않은 상태로 보관하며, 섹션을 붙일 때 적용한다.
+
+    풀에 남은 데이터가 low_watermark 이하로 떨어지면 executor에서 size 만큼 다시 채운다.
+    """
+
+    def __init__(self, size: int, low_watermark: int, executor: Executor | None = None):
+        self.size = size
+        self.low_watermark = low_watermark
+        self.executor = executor
+
+        self.hits = 0
+        self.misses = 0
+
+        self._pool: deque[bytearray] = deque()
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def take(self) -> bytearray | None:
+        """
+        풀에서 섹션 데이터를 하나 꺼낸다. 풀이 비어 있으면 None.
+        """
+        data = None
+        expected_len = Section.LENGTH ** 2
+
+        while data is None:
+            try:
+                candidate = self._pool.popleft()
+            except IndexError:
+                break
+
+            # Section.LENGTH가 바뀌기 전에 생성된 데이터는 버린다.
+            if len(candidate) == expected_len:
+                data = candidate
+
+        if data is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        if len(self._pool) <= self.low_watermark:
+            self.refill()
+
+        return data
+
+    def refill(self):
+        """
+        풀이 size 만큼 차도록 생성 작업을 executor에 등록한다.
+        """
+        with self._lock:
+            lacking = self.size - len(self._pool) - self._pending
+            if lacking <= 0:
+                return
+            self._pending += lacking
+
+        executor = self._get_executor()
+        for _ in range(lacking):
+            future = executor.submit(create_section_data, Section.LENGTH, Section.MINE_RATIO)
+            future.add_done_callback(self._on_created)
+
+    def clear(self):
+        self._pool.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._pool),
+            "pending": self._pending,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+    def _get_executor(self) -> Executor:
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="section-pool")
+        return self.executor
+
+    def _on_created(self, future: Future):
+        with self._lock:
+            self._pending -= 1
+
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        if len(self._pool) < self.size:
+            self._pool.append(future.result())
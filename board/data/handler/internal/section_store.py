@@ -0,0 +1,97 @@
+from typing import Iterable, Iterator
+from board.data import Point, Section
+
+# (x, y)
+_delta = [
+    (0, 1), (0, -1), (-1, 0), (1, 0),  # 상하좌우
+    (-1, 1), (1, 1), (-1, -1), (1, -1),  # 좌상 우상 좌하 우하
+]
+
+
+def section_key(x: int, y: int) -> int:
+    """
+    섹션 좌표 (x, y)를 하나의 정수로 묶는다.
+    x, y 모두 [-2^31, 2^31) 범위라면 겹치지 않는다.
+    """
+    return (y << 32) + x
+
+
+# 주변 섹션 키 = 섹션 키 + offset
+_NEIGHBOR_OFFSETS = [(dx, dy, section_key(dx, dy)) for dx, dy in _delta]
+
+
+class SectionStore:
+    """
+    섹션 좌표를 정수 키 하나로 묶어 섹션들을 저장한다.
+    섹션 캐싱, 제거, 영속화는 이 클래스를 통해 이루어져야 한다.
+    """
+
+    def __init__(self, sections: Iterable[Section] = ()):
+        self._sections: dict[int, Section] = {}
+
+        for section in sections:
+            self.put(section)
+
+    def get(self, x: int, y: int) -> Section | None:
+        return self._sections.get(section_key(x, y))
+
+    def put(self, section: Section):
+        self._sections[section_key(section.p.x, section.p.y)] = section
+
+    def remove(self, x: int, y: int) -> Section | None:
+        return self._sections.pop(section_key(x, y), None)
+
+    def neighbors(self, x: int, y: int) -> list[tuple[int, int, Section]]:
+        """
+        (x, y) 주변 8방향에 존재하는 섹션들을 (dx, dy, section)으로 반환한다.
+        """
+        key = section_key(x, y)
+
+        result = []
+        for dx, dy, offset in _NEIGHBOR_OFFSETS:
+            neighbor = self._sections.get(key + offset)
+            if neighbor is not None:
+                result.append((dx, dy, neighbor))
+
+        return result
+
+    def overlapping(self, start: Point, end: Point) -> list[Section]:
+        """
+        start ~ end 타일 범위와 겹치는, 존재하는 섹션들.
+        위쪽 row부터 왼쪽에서 오른쪽 순서로 반환한다.
+        """
+        result = []
+        for key in self._range_keys(start, end):
+            section = self._sections.get(key)
+            if section is not None:
+                result.append(section)
+
+        return result
+
+    def missing(self, start: Point, end: Point) -> list[tuple[int, int]]:
+        """
+        start ~ end 타일 범위와 겹치는, 아직 존재하지 않는 섹션 좌표 (x, y)들.
+        """
+        result = []
+        for sec_y in range(start.y // Section.LENGTH, end.y // Section.LENGTH - 1, - 1):
+            base = section_key(0, sec_y)
+            for sec_x in range(start.x // Section.LENGTH, end.x // Section.LENGTH + 1):
+                if (base + sec_x) not in self._sections:
+                    result.append((sec_x, sec_y))
+
+        return result
+
+    def __len__(self) -> int:
+        return len(self._sections)
+
+    def __iter__(self) -> Iterator[Section]:
+        return iter(self._sections.values())
+
+    def __contains__(self, p: tuple[int, int]) -> bool:
+        return section_key(*p) in self._sections
+
+    def _range_keys(self, start: Point, end: Point) -> Iterator[int]:
+        for sec_y in range(start.y // Section.LENGTH, end.y // Section.LENGTH - 1, - 1):
+            base = section_key(0, sec_y)
+            for sec_x in range(start.x // Section.LENGTH, end.x // Section.LENGTH + 1):
+                yield base + sec_x
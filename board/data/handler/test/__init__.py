@@ -1 +1,4 @@
-from .board_test import BoardHandlerTestCase
+from .board_test import BoardHandlerTestCase, BoardHandlerEnsureSectionsTestCase
+from .section_pool_test import SectionPoolTestCase
+from .prefetcher_test import SectionPrefetcherTestCase
+from .section_store_test import SectionStoreTestCase
@@ -1,6 +1,9 @@
+import asyncio
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 from tests.utils import cases
-from board.data import Point, Tile
+from board.data import Point, Tile, Tiles, Section, InvalidDataLengthException, create_section_data
 from board.data.handler import BoardHandler
 from .fixtures import setup_board
 
@@ -44,6 +47,38 @@ class BoardHandlerTestCase(unittest.TestCase):
 
         self.assertEqual(data,  expect)
 
+    @cases(FETCH_CASE)
+    def test_fetch_into(self, data, expect):
+        start_p = data["start_p"]
+        end_p = data["end_p"]
+
+        # 이전 fetch의 데이터가 남아있는 버퍼를 재사용
+        out = bytearray(b"\xff" * 100)
+
+        size = BoardHandler.fetch_into(start_p, end_p, out)
+
+        self.assertEqual(size, len(expect) // 2)
+        self.assertEqual(out[:size].hex(), expect)
+        self.assertEqual(out[size:], bytearray(b"\xff" * (100 - size)))
+
+    @cases(FETCH_CASE)
+    def test_fetch_hide_info(self, data, expect):
+        start_p = data["start_p"]
+        end_p = data["end_p"]
+
+        expected = Tiles(data=bytearray.fromhex(expect))
+        expected.hide_info()
+
+        tiles = BoardHandler.fetch(start_p, end_p, hide_info=True)
+
+        self.assertEqual(tiles.data, expected.data)
+
+    def test_fetch_into_small_buffer(self):
+        out = bytearray(3)
+
+        with self.assertRaises(InvalidDataLengthException):
+            BoardHandler.fetch_into(Point(-1, 0), Point(0, -1), out)
+
     def test_update_tile(self):
         p = Point(-1, -1)
 
@@ -55,5 +90,57 @@ class BoardHandlerTestCase(unittest.TestCase):
         self.assertEqual(tiles.data[0], tile.data)
 
 
+class BoardHandlerEnsureSectionsTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        setup_board()
+        BoardHandler.section_pool.clear()
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        BoardHandler.set_executor(self.executor)
+
+    def tearDown(self):
+        self.executor.shutdown(wait=True)
+        BoardHandler.set_executor(None)
+        BoardHandler.section_pool.clear()
+
+    async def test_ensure_sections(self):
+        start_p = Point(-4, 7)
+        end_p = Point(7, -4)
+
+        await BoardHandler.ensure_sections(start_p, end_p)
+
+        for sec_y in range(-1, 2):
+            for sec_x in range(-1, 2):
+                section = BoardHandler.sections.get(sec_x, sec_y)
+                self.assertIsNotNone(section)
+                self.assertEqual(len(section.data), Section.LENGTH ** 2)
+
+        self.assertEqual(len(BoardHandler._in_flight), 0)
+
+    @patch("board.data.handler.internal.board.create_section_data", wraps=create_section_data)
+    async def test_ensure_sections_concurrent(self, mock):
+        pool_size = BoardHandler.section_pool.size
+        BoardHandler.section_pool.size = 0
+        self.addCleanup(setattr, BoardHandler.section_pool, "size", pool_size)
+
+        start_p = Point(4, 3)
+        end_p = Point(7, 0)
+
+        await asyncio.gather(
+            BoardHandler.ensure_sections(start_p, end_p),
+            BoardHandler.ensure_sections(start_p, end_p)
+        )
+
+        # 같은 섹션은 한 번만 생성
+        mock.assert_called_once()
+        self.assertIsNotNone(BoardHandler.sections.get(1, 0))
+
+    async def test_ensure_sections_no_executor(self):
+        BoardHandler.set_executor(None)
+
+        await BoardHandler.ensure_sections(Point(4, 3), Point(7, 0))
+
+        self.assertIsNone(BoardHandler.sections.get(1, 0))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,5 @@
 from board.data import Section, Point
-from board.data.handler import BoardHandler
+from board.data.handler import BoardHandler, SectionPrefetcher, SectionStore
 
 
 def setup_board():
@@ -34,14 +34,11 @@ def setup_board():
         0b00000010, 0b00000001, 0b00000001, 0b00000000
     ])
 
-    BoardHandler.sections = \
-        {
-            0: {
-                0: Section(Point(0, 0), tile_state_1),
-                -1: Section(Point(-1, 0), tile_state_2)
-            },
-            -1: {
-                0: Section(Point(0, -1), tile_state_4),
-                -1: Section(Point(-1, -1), tile_state_3)
-            }
-        }
+    BoardHandler.sections = SectionStore([
+        Section(Point(0, 0), tile_state_1),
+        Section(Point(-1, 0), tile_state_2),
+        Section(Point(0, -1), tile_state_4),
+        Section(Point(-1, -1), tile_state_3)
+    ])
+
+    SectionPrefetcher.views = {}
@@ -0,0 +1,71 @@
+import asyncio
+import unittest
+from board.data import Point
+from board.data.handler import BoardHandler, SectionPrefetcher
+from .fixtures import setup_board
+
+
+class SectionPrefetcherTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        setup_board()
+        BoardHandler.section_pool.clear()
+        SectionPrefetcher.track("A", Point(0, 0), width=2, height=2)
+
+    async def wait_prefetch(self):
+        await asyncio.gather(*SectionPrefetcher._tasks)
+
+    def test_track(self):
+        view = SectionPrefetcher.views["A"]
+
+        self.assertEqual(view.position, Point(0, 0))
+        self.assertEqual(view.width, 2)
+        self.assertEqual(view.height, 2)
+
+        SectionPrefetcher.set_size("A", 3, 4)
+        self.assertEqual(view.width, 3)
+        self.assertEqual(view.height, 4)
+
+        SectionPrefetcher.untrack("A")
+        self.assertNotIn("A", SectionPrefetcher.views)
+
+    def test_prefetch_range(self):
+        view = SectionPrefetcher.views["A"]
+
+        # 이동하지 않음
+        start, end = SectionPrefetcher.get_prefetch_range(view)
+        self.assertIsNone(start)
+        self.assertIsNone(end)
+
+        view.vx, view.vy = 1, -1
+        start, end = SectionPrefetcher.get_prefetch_range(view)
+
+        # 오른쪽 아래로 한 섹션(4) 만큼 늘어남
+        self.assertEqual(start, Point(-2, 2))
+        self.assertEqual(end, Point(2 + 4, -2 - 4))
+
+    async def test_move(self):
+        SectionPrefetcher.move("A", Point(1, 0))
+
+        view = SectionPrefetcher.views["A"]
+        self.assertEqual(view.position, Point(1, 0))
+        self.assertGreater(view.vx, 0)
+        self.assertEqual(view.vy, 0)
+
+        # 오른쪽 섹션들이 미리 생성된다.
+        self.assertEqual(len(SectionPrefetcher._tasks), 1)
+        await self.wait_prefetch()
+
+        self.assertIsNotNone(BoardHandler.sections.get(1, 0))
+        self.assertIsNotNone(BoardHandler.sections.get(1, -1))
+        # 이동 방향이 아닌 섹션은 생성되지 않는다.
+        self.assertIsNone(BoardHandler.sections.get(-2, 0))
+        self.assertIsNone(BoardHandler.sections.get(0, 1))
+
+    async def test_move_untracked(self):
+        SectionPrefetcher.move("B", Point(1, 0))
+
+        self.assertEqual(len(SectionPrefetcher._tasks), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
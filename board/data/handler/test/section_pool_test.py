@@ -0,0 +1,71 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from board.data import Section
+from board.data.handler import SectionPool
+
+
+class SectionPoolTestCase(unittest.TestCase):
+    def setUp(self):
+        Section.LENGTH = 4
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.pool = SectionPool(size=3, low_watermark=1, executor=self.executor)
+
+    def tearDown(self):
+        self.executor.shutdown(wait=True)
+
+    def wait_refill(self):
+        # 작업이 끝날 때까지 빈 작업을 기다린다.
+        self.executor.submit(lambda: None).result()
+
+    def test_take_empty(self):
+        data = self.pool.take()
+
+        self.assertIsNone(data)
+        self.assertEqual(self.pool.misses, 1)
+        self.assertEqual(self.pool.hits, 0)
+
+        # miss 이후 풀이 채워진다.
+        self.wait_refill()
+        self.assertEqual(self.pool.stats["size"], 3)
+        self.assertEqual(self.pool.stats["pending"], 0)
+
+    def test_take_hit(self):
+        self.pool.refill()
+        self.wait_refill()
+
+        data = self.pool.take()
+
+        self.assertIsNotNone(data)
+        self.assertEqual(len(data), Section.LENGTH ** 2)
+        self.assertEqual(self.pool.hits, 1)
+        self.assertEqual(self.pool.misses, 0)
+
+    def test_low_watermark_refill(self):
+        self.pool.refill()
+        self.wait_refill()
+
+        self.pool.take()
+        # 남은 개수가 low_watermark보다 많으면 다시 채우지 않음
+        self.assertEqual(self.pool.stats["pending"], 0)
+
+        self.pool.take()
+        # low_watermark 도달 시 size 만큼 다시 채움
+        self.wait_refill()
+        self.assertEqual(self.pool.stats["size"], 3)
+
+    def test_drop_stale_length(self):
+        self.pool.refill()
+        self.wait_refill()
+
+        Section.LENGTH = 5
+        try:
+            data = self.pool.take()
+        finally:
+            Section.LENGTH = 4
+
+        self.assertIsNone(data)
+        self.assertEqual(self.pool.misses, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from board.data import Point, Section
+from board.data.handler import SectionStore
+from board.data.handler.internal.section_store import section_key
+
+
+class SectionStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        Section.LENGTH = 4
+
+        self.sections = [
+            Section(Point(x, y), bytearray(Section.LENGTH ** 2))
+            for y in range(-1, 2) for x in range(-1, 2)
+            if (x, y) != (1, 1)
+        ]
+        self.store = SectionStore(self.sections)
+
+    def test_section_key(self):
+        keys = set()
+        for y in [-(2**31), -1, 0, 1, 2**31 - 1]:
+            for x in [-(2**31), -1, 0, 1, 2**31 - 1]:
+                keys.add(section_key(x, y))
+
+        self.assertEqual(len(keys), 25)
+
+    def test_get_put_remove(self):
+        self.assertEqual(len(self.store), 8)
+        self.assertIs(self.store.get(-1, 0), self.sections[3])
+        self.assertIsNone(self.store.get(1, 1))
+        self.assertIn((0, 0), self.store)
+        self.assertNotIn((1, 1), self.store)
+
+        new_section = Section(Point(1, 1), bytearray(Section.LENGTH ** 2))
+        self.store.put(new_section)
+        self.assertIs(self.store.get(1, 1), new_section)
+
+        removed = self.store.remove(1, 1)
+        self.assertIs(removed, new_section)
+        self.assertIsNone(self.store.get(1, 1))
+        self.assertIsNone(self.store.remove(1, 1))
+
+    def test_neighbors(self):
+        neighbors = self.store.neighbors(0, 0)
+
+        self.assertEqual(len(neighbors), 7)
+        for dx, dy, section in neighbors:
+            self.assertEqual(section.p, Point(dx, dy))
+
+        neighbors = self.store.neighbors(-2, 0)
+        self.assertEqual([(dx, dy) for dx, dy, _ in neighbors], [(1, 0), (1, 1), (1, -1)])
+
+    def test_overlapping(self):
+        # (-1, 1) ~ (1, 0) 섹션들
+        got = self.store.overlapping(Point(-1, 4), Point(5, 0))
+
+        self.assertEqual(
+            [section.p for section in got],
+            [Point(-1, 1), Point(0, 1), Point(-1, 0), Point(0, 0), Point(1, 0)]
+        )
+
+    def test_missing(self):
+        got = self.store.missing(Point(-1, 4), Point(8, 0))
+
+        self.assertEqual(got, [(1, 1), (2, 1), (2, 0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,8 +2,9 @@ from .point import Point
 from .tile import Tile
 from .tiles import Tiles
 from .exceptions import InvalidDataLengthException
-from random import randint
 from typing import Callable
+from functools import lru_cache
+import numpy as np
 
 MINE_TILE = 0b01000000
 NUM_MASK = 0b00000111
@@ -105,7 +106,14 @@ class Section:
             self_y = 0
             neighbor_y = Section.LENGTH - 1
 
-        for x in range(Section.LENGTH):
+        # 복구가 필요한 칸 전까지는 한 번에 적용하고, 그 뒤부터 한 칸씩 적용한다.
+        start = stitch_edge(
+            origin_tiles=self.data, new_tiles=neighbor.data,
+            origin_start=self_y * Section.LENGTH, new_start=neighbor_y * Section.LENGTH,
+            stride=1, length=Section.LENGTH
+        )
+
+        for x in range(start, Section.LENGTH):
             self_idx = (self_y * Section.LENGTH) + x
             neighbor_idx = (neighbor_y * Section.LENGTH) + x
 
@@ -141,7 +149,14 @@ class Section:
             self_x = Section.LENGTH - 1
             neighbor_x = 0
 
-        for y in range(Section.LENGTH):
+        # 복구가 필요한 칸 전까지는 한 번에 적용하고, 그 뒤부터 한 칸씩 적용한다.
+        start = stitch_edge(
+            origin_tiles=self.data, new_tiles=neighbor.data,
+            origin_start=self_x, new_start=neighbor_x,
+            stride=Section.LENGTH, length=Section.LENGTH
+        )
+
+        for y in range(start, Section.LENGTH):
             self_idx = (y * Section.LENGTH) + self_x
             neighbor_idx = (y * Section.LENGTH) + neighbor_x
 
@@ -174,39 +189,138 @@ class Section:
 
     @staticmethod
     def create(p: Point):
-        total = Section.LENGTH**2
-        mine_cnt = int((total * Section.MINE_RATIO)//1)
-
-        # zero-value로 초기화됨,
-        data = bytearray(total)
-
-        for _ in range(mine_cnt):
-            # 랜덤 위치가 잘못된 경우 재시도
-            while True:
-                rand_p = Point(
-                    x=randint(0, Section.LENGTH - 1),
-                    y=randint(0, Section.LENGTH - 1)
-                )
+        data = create_section_data(length=Section.LENGTH, mine_ratio=Section.MINE_RATIO)
+        return Section(p=p, data=data)
 
-                rand_idx = (rand_p.y * Section.LENGTH) + rand_p.x
-                cur_tile = data[rand_idx]
 
-                # 이미 지뢰가 존재
-                if cur_tile == MINE_TILE:
-                    continue
+def create_section_data(length: int, mine_ratio: float) -> bytearray:
+    """
+    length x length 크기의 섹션 데이터를 생성한다.
+    지뢰 위치를 한 번에 뽑은 뒤, 숫자는 3x3 컨볼루션으로 계산한다.
+    주변 8칸이 모두 지뢰인 타일(숫자 8)이 생기면 지뢰를 하나 빼고 다시 채우는 과정을 반복한다.
+    """
+    total = length**2
+    mine_cnt = int((total * mine_ratio)//1)
 
-                # 주변 타일 검사
-                valid = check_neighbor_restrictions(tiles=data, p=rand_p)
-                if not valid:
-                    continue
+    # 스레드/프로세스마다 독립적인 시드를 사용하도록 호출마다 생성
+    rng = np.random.default_rng()
 
-                data[rand_idx] = MINE_TILE
+    mines = np.zeros(total, dtype=np.uint8)
+    mines[rng.choice(total, size=mine_cnt, replace=False)] = 1
+    mines = mines.reshape(length, length)
 
-                # 주변 타일 숫자 증가
-                increase_number_around(tiles=data, p=rand_p)
-                break
+    while True:
+        counts = count_neighbor_mines(mines)
+        empty = mines == 0
 
-        return Section(p=p, data=data)
+        # 숫자가 8이 된 타일: 주변 8칸이 모두 지뢰이므로 그 중 하나를 제거한다.
+        overflow_y, overflow_x = np.nonzero(empty & (counts == 8))
+        if len(overflow_y) > 0:
+            picked = rng.integers(0, len(_delta), size=len(overflow_y))
+            mines[overflow_y + _DELTA_Y[picked], overflow_x + _DELTA_X[picked]] = 0
+            continue
+
+        lacking = mine_cnt - int(mines.sum())
+        if lacking == 0:
+            break
+
+        # 주변에 숫자 7인 타일이 있는 곳에는 지뢰를 놓을 수 없다.
+        full = (empty & (counts == 7)).astype(np.uint8)
+        candidates = np.flatnonzero(empty & (count_neighbor_mines(full) == 0))
+
+        picked = rng.choice(candidates, size=min(lacking, len(candidates)), replace=False)
+        mines.flat[picked] = 1
+
+    data = np.where(mines == 1, np.uint8(MINE_TILE), counts)
+    return bytearray(data.tobytes())
+
+
+def count_neighbor_mines(mines: np.ndarray) -> np.ndarray:
+    """
+    mines(지뢰면 1, 아니면 0인 uint8 2차원 배열)에 3x3 커널을 컨볼루션하여
+    각 타일 주변의 지뢰 개수를 구한다. 범위 밖은 0으로 취급한다.
+    """
+    height, width = mines.shape
+    padded = np.pad(mines, 1)
+
+    counts = np.zeros_like(mines)
+    for dx, dy in _delta:
+        counts += padded[1+dy:1+dy+height, 1+dx:1+dx+width]
+
+    return counts
+
+
+def stitch_edge(
+    origin_tiles: bytearray, new_tiles: bytearray,
+    origin_start: int, new_start: int, stride: int, length: int
+) -> int:
+    """
+    맞닿은 두 섹션 모서리(각 length칸)의 지뢰를 서로 상대 모서리 숫자에 한 번에 적용한다.
+    모서리의 i번째 칸은 origin_start + i * stride (new_start + i * stride) 위치이다.
+
+    apply_neighbor_vertical/horizontal의 칸별 반복과 결과가 같도록,
+    숫자가 7인 타일을 만나 복구가 필요한 첫 칸 직전까지만 적용하고 그 칸의 순번을 반환한다.
+    복구가 필요 없으면 length를 반환한다.
+    """
+    end = stride * (length - 1) + 1
+    origin_line = np.frombuffer(origin_tiles, dtype=np.uint8)[origin_start:origin_start + end:stride]
+    new_line = np.frombuffer(new_tiles, dtype=np.uint8)[new_start:new_start + end:stride]
+
+    origin_mines = origin_line == MINE_TILE
+    new_mines = new_line == MINE_TILE
+
+    first = min(
+        _first_repair_step(new_line, origin_mines),
+        _first_repair_step(origin_line, new_mines)
+    )
+    if first == 0:
+        return first
+
+    applied = np.arange(length) < first
+    new_line += np.where(new_mines, np.uint8(0), _window_sum(origin_mines & applied))
+    origin_line += np.where(origin_mines, np.uint8(0), _window_sum(new_mines & applied))
+
+    return first
+
+
+def _window_sum(mask: np.ndarray) -> np.ndarray:
+    """
+    각 칸과 양 옆 칸 중 mask가 True인 개수
+    """
+    counts = mask.astype(np.uint8)
+    result = counts.copy()
+    result[1:] += counts[:-1]
+    result[:-1] += counts[1:]
+    return result
+
+
+def _first_repair_step(targets: np.ndarray, sources: np.ndarray) -> int:
+    """
+    sources의 지뢰들을 칸 순서대로 targets 양 옆까지 1씩 더할 때,
+    숫자가 7인 target을 처음 만나는 칸의 순번. 없으면 len(targets)
+    """
+    length = len(targets)
+    current = sources.astype(np.int16)
+    prev = np.zeros(length, dtype=np.int16)
+    prev[1:] = current[:-1]
+    following = np.zeros(length, dtype=np.int16)
+    following[:-1] = current[1:]
+
+    # 몇 번째로 더해질 때 7인 상태인지
+    need = 8 - (targets & NUM_MASK).astype(np.int16)
+
+    # target i에는 i-1, i, i+1번째 칸 순서로 더해진다.
+    idx = np.arange(length)
+    step = np.where(
+        prev >= need, idx - 1,
+        np.where(
+            prev + current >= need, idx,
+            np.where(prev + current + following >= need, idx + 1, length)
+        )
+    )
+    step = np.where(targets == MINE_TILE, length, step)
+
+    return int(step.min())
 
 
 def affect_origin_mines_to_new(new_tiles: bytearray, x_range: tuple[int, int], y_range: tuple[int, int]):
@@ -217,6 +331,8 @@ def affect_origin_mines_to_new(new_tiles: bytearray, x_range: tuple[int, int], y
 
     x_range, y_range 범위에 위치한 new 타일을 1씩 더해준다.
     """
+    neighbors = neighbor_table(Section.LENGTH)
+
     for y in range(y_range[0], y_range[1] + 1):
         for x in range(x_range[0], x_range[1] + 1):
             idx = (y * Section.LENGTH) + x
@@ -228,7 +344,7 @@ def affect_origin_mines_to_new(new_tiles: bytearray, x_range: tuple[int, int], y
             num = tile & NUM_MASK
             if num == 7:
                 # new의 num이 7이라면 주변 지뢰 1개 제거하여 origin의 지뢰를 적용시킬 수 있도록 한다.
-                remove_one_nearby_mine(new_tiles, Point(x, y))
+                _remove_one_nearby_mine(new_tiles, neighbors, idx)
             else:
                 tile += 1
             new_tiles[idx] = tile
@@ -245,6 +361,8 @@ def affect_new_mines_to_origin(
 
     x_range, y_range 범위에 위치한 origin 타일을 1씩 더해준다.
     """
+    new_tiles_idx = (mine_p.y * Section.LENGTH) + mine_p.x
+
     for y in range(y_range[0], y_range[1] + 1):
         for x in range(x_range[0], x_range[1] + 1):
             idx = (y * Section.LENGTH) + x
@@ -257,12 +375,9 @@ def affect_new_mines_to_origin(
             if num == 7:
                 # origin의 num이 7이다.
                 # 이 경우에는 new의 지뢰를 제거하고 숫자로 덮어씌워준다.
-                cnt = decrease_number_around_and_count_mines(
-                    tiles=new_tiles,
-                    p=mine_p
+                cnt = _decrease_number_around_and_count_mines(
+                    new_tiles, neighbor_table(Section.LENGTH), new_tiles_idx
                 )
-
-                new_tiles_idx = (mine_p.y * Section.LENGTH) + mine_p.x
                 new_tiles[new_tiles_idx] = cnt
                 continue
 
@@ -274,20 +389,8 @@ def decrease_number_around_and_count_mines(tiles: bytearray, p: Point) -> int:
     주변 8칸 타일들의 num을 1씩 감소시킨다.
     만약 타일이 지뢰라면, cnt++ 해준다.
     """
-    cnt = 0
-
-    def do(t: int, p: Point) -> tuple[int | None, bool]:
-        nonlocal cnt
-        if t == MINE_TILE:
-            cnt += 1
-            return None, False
-
-        t -= 1
-        return t, False
-
-    for_each_neighbor(tiles, p, do)
-
-    return cnt
+    idx = (p.y * Section.LENGTH) + p.x
+    return _decrease_number_around_and_count_mines(tiles, neighbor_table(Section.LENGTH), idx)
 
 
 def remove_one_nearby_mine(tiles: bytearray, p: Point):
@@ -296,29 +399,18 @@ def remove_one_nearby_mine(tiles: bytearray, p: Point):
     지뢰 타일은 주변 지뢰 개수 숫자로 덮어씌워지며,
     그 주변 타일의 num은 1씩 감소한다.
     """
-    def do(t: int, p: Point) -> tuple[int | None, bool]:
-        if t != MINE_TILE:
-            return None, False
-
-        cnt = decrease_number_around_and_count_mines(tiles=tiles, p=p)
-        return cnt, True
-
-    for_each_neighbor(tiles, p, do)
+    idx = (p.y * Section.LENGTH) + p.x
+    _remove_one_nearby_mine(tiles, neighbor_table(Section.LENGTH), idx)
 
 
 def increase_number_around(tiles: bytearray, p: Point):
     """
     주변 타일의 num을 1씩 증가시킨다.
     """
-    def do(t: int, p: Point) -> tuple[int | None, bool]:
-        if t == MINE_TILE:
-            return None, False
-
-        t += 1
-
-        return t, False
-
-    for_each_neighbor(tiles, p, do)
+    for idx in neighbor_table(Section.LENGTH)[(p.y * Section.LENGTH) + p.x]:
+        t = tiles[idx]
+        if t != MINE_TILE:
+            tiles[idx] = t + 1
 
 
 def check_neighbor_restrictions(tiles: bytearray, p: Point) -> bool:
@@ -328,19 +420,34 @@ def check_neighbor_restrictions(tiles: bytearray, p: Point) -> bool:
 
     1. num이 7인가? -> mine을 더 추가하면 8이 된다.
     """
-    valid = True
-
-    def do(t: int, p: Point) -> tuple[int | None, bool]:
-        nonlocal valid
+    for idx in neighbor_table(Section.LENGTH)[(p.y * Section.LENGTH) + p.x]:
         # 주변 타일이 7을 넘지 않아야 함
-        if t & NUM_MASK == 7:
-            valid = False
+        if tiles[idx] & NUM_MASK == 7:
+            return False
+
+    return True
+
+
+def _decrease_number_around_and_count_mines(tiles: bytearray, neighbors: list[tuple[int, ...]], idx: int) -> int:
+    cnt = 0
+    for n_idx in neighbors[idx]:
+        t = tiles[n_idx]
+        if t == MINE_TILE:
+            cnt += 1
+            continue
 
-        return None, not valid
+        tiles[n_idx] = t - 1
 
-    for_each_neighbor(tiles, p, do)
+    return cnt
+
+
+def _remove_one_nearby_mine(tiles: bytearray, neighbors: list[tuple[int, ...]], idx: int):
+    for n_idx in neighbors[idx]:
+        if tiles[n_idx] != MINE_TILE:
+            continue
 
-    return valid
+        tiles[n_idx] = _decrease_number_around_and_count_mines(tiles, neighbors, n_idx)
+        break
 
 
 # (x, y)
@@ -348,6 +455,42 @@ _delta = [
     (0, 1), (0, -1), (-1, 0), (1, 0),  # 상하좌우
     (-1, 1), (1, 1), (-1, -1), (1, -1),  # 좌상 우상 좌하 우하
 ]
+_DELTA_X = np.array([dx for dx, _ in _delta])
+_DELTA_Y = np.array([dy for _, dy in _delta])
+
+
+def _neighbor_offsets(length: int, left: bool, right: bool, bottom: bool, top: bool) -> tuple[int, ...]:
+    """
+    flat index 기준 주변 타일 오프셋들. _delta 순서를 따른다.
+    left, right, bottom, top: 타일이 섹션의 그 끝에 붙어 있는지. 붙어 있는 방향은 범위를 벗어나므로 제외한다.
+    """
+    offsets = []
+    for dx, dy in _delta:
+        if (left and dx == -1) or (right and dx == 1) or (bottom and dy == -1) or (top and dy == 1):
+            continue
+        offsets.append(dy * length + dx)
+    return tuple(offsets)
+
+
+@lru_cache(maxsize=8)
+def neighbor_table(length: int) -> list[tuple[int, ...]]:
+    """
+    length x length 섹션의 flat index -> 주변 타일들의 flat index.
+    안쪽, 모서리, 꼭짓점 타일의 오프셋을 미리 만들어두고 타일마다 더한다.
+    """
+    offsets: dict[tuple[bool, bool, bool, bool], tuple[int, ...]] = {}
+
+    table = []
+    for y in range(length):
+        for x in range(length):
+            key = (x == 0, x == length - 1, y == 0, y == length - 1)
+            if key not in offsets:
+                offsets[key] = _neighbor_offsets(length, *key)
+
+            idx = (y * length) + x
+            table.append(tuple(idx + offset for offset in offsets[key]))
+
+    return table
 
 
 def for_each_neighbor(tiles: bytearray, p: Point, func: Callable[[int, Point], tuple[int | None, bool]]):
@@ -359,19 +502,10 @@ def for_each_neighbor(tiles: bytearray, p: Point, func: Callable[[int, Point], t
     tile: None이 아니면 타일을 업데이트.
     stop: True면 반복 중지
     """
+    for new_idx in neighbor_table(Section.LENGTH)[(p.y * Section.LENGTH) + p.x]:
+        y, x = divmod(new_idx, Section.LENGTH)
 
-    # 주변 탐색
-    for dx, dy in _delta:
-        np = Point(p.x+dx, p.y+dy)
-        if \
-                np.x < 0 or np.x >= Section.LENGTH or \
-                np.y < 0 or np.y >= Section.LENGTH:
-            continue
-
-        new_idx = (np.y * Section.LENGTH) + np.x
-        nearby_tile = tiles[new_idx]
-
-        tile, stop = func(nearby_tile, np)
+        tile, stop = func(tiles[new_idx], Point(x, y))
         if tile is not None:
             tiles[new_idx] = tile
 
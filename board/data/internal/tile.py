@@ -3,7 +3,7 @@ from cursor.data import Color
 from .exceptions import InvalidTileException
 
 
-@dataclass
+@dataclass(slots=True)
 class Tile:
     is_open: bool
     is_mine: bool
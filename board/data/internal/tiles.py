@@ -1,6 +1,20 @@
 from dataclasses import dataclass
 
 
+def _create_hide_info_table() -> bytes:
+    """
+    타일 byte -> mine, number 정보를 제거한 byte 변환 테이블.
+    OPENED 타일은 그대로 둔다.
+    """
+    opened = 0b10000000
+    mask = 0b10111000
+    return bytes(b if b & opened else b & mask for b in range(256))
+
+
+# bytes.translate에 사용
+HIDE_INFO_TABLE = _create_hide_info_table()
+
+
 @dataclass
 class Tiles:
     data: bytearray
@@ -8,6 +22,9 @@ class Tiles:
     def to_str(self):
         return self.data.hex()
 
+    def to_bytes(self) -> bytes:
+        return bytes(self.data)
+
     def hide_info(self):
         """
         타일들의 mine, number 정보를 제거한다.
@@ -15,12 +32,4 @@ class Tiles:
 
         주의: Tiles 데이터가 변형된다.
         """
-        opened = 0b10000000
-        mask = 0b10111000
-        for idx in range(len(self.data)):
-            b = self.data[idx]
-            if b & opened:
-                continue
-
-            b &= mask
-            self.data[idx] = b
+        self.data[:] = self.data.translate(HIDE_INFO_TABLE)
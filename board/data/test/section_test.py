@@ -1,6 +1,15 @@
 from tests.utils import cases
 from board.data import Section, Point, Tile, Tiles
-from board.data.internal.section import for_each_neighbor
+from board.data.internal.section import (
+    for_each_neighbor,
+    create_section_data,
+    neighbor_table,
+    increase_number_around,
+    decrease_number_around_and_count_mines,
+    remove_one_nearby_mine,
+    check_neighbor_restrictions,
+    stitch_edge
+)
 
 import unittest
 
@@ -160,6 +169,111 @@ class SectionTestCase(unittest.TestCase):
 
                 for_each_neighbor(sec.data, Point(x, y), func=check_number_restriction)
 
+    def test_create_section_data(self):
+        num_mask = 0b00000111
+        mine_tile = 0b01000000
+
+        for length in [4, 10, 100]:
+            data = create_section_data(length=length, mine_ratio=Section.MINE_RATIO)
+
+            total = length ** 2
+            mine_cnt = int((total * Section.MINE_RATIO)//1)
+
+            self.assertEqual(len(data), total)
+            self.assertEqual(data.count(mine_tile), mine_cnt)
+
+            for y in range(length):
+                for x in range(length):
+                    tile = data[(y * length) + x]
+                    if tile == mine_tile:
+                        continue
+
+                    expected = 0
+                    for dy in (-1, 0, 1):
+                        for dx in (-1, 0, 1):
+                            nx, ny = x + dx, y + dy
+                            if (dx, dy) == (0, 0) or not (0 <= nx < length and 0 <= ny < length):
+                                continue
+                            if data[(ny * length) + nx] == mine_tile:
+                                expected += 1
+
+                    # 숫자만 기록되어 있고, 7을 넘지 않는가
+                    self.assertEqual(tile, tile & num_mask)
+                    self.assertEqual(tile, expected)
+                    self.assertLessEqual(tile, 7)
+
+    def test_neighbor_table(self):
+        table = neighbor_table(4)
+
+        # 꼭짓점, 모서리, 안쪽
+        self.assertEqual(set(table[0]), {1, 4, 5})
+        self.assertEqual(set(table[1]), {0, 2, 4, 5, 6})
+        self.assertEqual(set(table[5]), {0, 1, 2, 4, 6, 8, 9, 10})
+        self.assertEqual(set(table[15]), {10, 11, 14})
+
+        self.assertIs(neighbor_table(4), table)
+        self.assertEqual(neighbor_table(1), [()])
+
+    def test_neighbor_primitives(self):
+        mine = 0b01000000
+        # (0, 1)에 지뢰 하나
+        data = bytearray([
+            1, 1, 0, 0,
+            mine, 1, 0, 0,
+            1, 1, 0, 0,
+            0, 0, 0, 0
+        ])
+
+        self.assertTrue(check_neighbor_restrictions(data, Point(1, 0)))
+
+        increase_number_around(data, Point(0, 0))
+        self.assertEqual(data[:8], bytearray([1, 2, 0, 0, mine, 2, 0, 0]))
+
+        self.assertEqual(decrease_number_around_and_count_mines(data, Point(0, 0)), 1)
+        self.assertEqual(data[:8], bytearray([1, 1, 0, 0, mine, 1, 0, 0]))
+
+        # 지뢰를 주변 지뢰 개수로 바꾸고 주변 숫자를 줄인다.
+        remove_one_nearby_mine(data, Point(0, 0))
+        self.assertEqual(data, bytearray(16))
+
+        data[0] = 7
+        self.assertFalse(check_neighbor_restrictions(data, Point(1, 1)))
+
+    def test_stitch_edge(self):
+        mine = 0b01000000
+        origin = bytearray([mine, 0, 0, 0])
+        new = bytearray([0, 0, 0, mine])
+
+        got = stitch_edge(origin_tiles=origin, new_tiles=new, origin_start=0, new_start=0, stride=1, length=4)
+
+        # 복구할 칸이 없으면 모두 적용
+        self.assertEqual(got, 4)
+        self.assertEqual(origin, bytearray([mine, 0, 1, 1]))
+        self.assertEqual(new, bytearray([1, 1, 0, mine]))
+
+    def test_stitch_edge_column(self):
+        mine = 0b01000000
+        # 2x2 섹션의 왼쪽 열
+        origin = bytearray([mine, 0, 0, 0])
+        new = bytearray([0, 0, 0, 0])
+
+        got = stitch_edge(origin_tiles=origin, new_tiles=new, origin_start=0, new_start=0, stride=2, length=2)
+
+        self.assertEqual(got, 2)
+        self.assertEqual(new, bytearray([1, 0, 1, 0]))
+
+    def test_stitch_edge_repair(self):
+        mine = 0b01000000
+        origin = bytearray([0, mine, 0, 0])
+        new = bytearray([0, 0, 7, 0])
+
+        got = stitch_edge(origin_tiles=origin, new_tiles=new, origin_start=0, new_start=0, stride=1, length=4)
+
+        # 1번째 칸의 지뢰가 숫자 7에 더해지므로 그 전까지만 적용
+        self.assertEqual(got, 1)
+        self.assertEqual(origin, bytearray([0, mine, 0, 0]))
+        self.assertEqual(new, bytearray([0, 0, 7, 0]))
+
 
 class SectionApplyNeighborTestCase(unittest.TestCase):
     def setUp(self):
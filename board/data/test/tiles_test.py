@@ -52,3 +52,12 @@ class TilesTestCase(unittest.TestCase):
         data = tiles.data
 
         self.assertEqual(flag_tile.copy(hide_info=True).data, data[0])
+
+    def test_hide_info_all_bytes(self):
+        tiles = Tiles(data=bytearray(range(256)))
+
+        tiles.hide_info()
+
+        for b in range(256):
+            expected = b if b & 0b10000000 else b & 0b10111000
+            self.assertEqual(tiles.data[b], expected)
@@ -1,7 +1,7 @@
 import asyncio
 from event import EventBroker
 from board.data import Point, Tile
-from board.data.handler import BoardHandler
+from board.data.handler import BoardHandler, SectionPrefetcher
 from cursor.data import Color
 from message import Message
 from message.payload import (
@@ -18,7 +18,9 @@ from message.payload import (
     MovableResultPayload,
     ClickType,
     InteractionEvent,
-    TileStateChangedPayload
+    TileStateChangedPayload,
+    SetViewSizePayload,
+    ConnClosedPayload
 )
 
 
@@ -42,12 +44,29 @@ class BoardEventHandler():
         start_p = Point(x=-width, y=height)
         end_p = Point(x=width, y=-height)
 
+        SectionPrefetcher.track(sender, Point(0, 0), width, height)
+
         await BoardEventHandler._publish_tiles(start_p, end_p, [sender])
 
+    @EventBroker.add_receiver(NewConnEvent.SET_VIEW_SIZE)
+    @staticmethod
+    async def receive_set_view_size(message: Message[SetViewSizePayload]):
+        sender = message.header["sender"]
+
+        SectionPrefetcher.set_size(sender, message.payload.width, message.payload.height)
+
+    @EventBroker.add_receiver(NewConnEvent.CONN_CLOSED)
+    @staticmethod
+    async def receive_conn_closed(message: Message[ConnClosedPayload]):
+        sender = message.header["sender"]
+
+        SectionPrefetcher.untrack(sender)
+
     @staticmethod
     async def _publish_tiles(start: Point, end: Point, to: list[str]):
-        tiles = BoardHandler.fetch(start, end)
-        tiles.hide_info()
+        await BoardHandler.ensure_sections(start, end)
+
+        tiles = BoardHandler.fetch(start, end, hide_info=True)
 
         pub_message = Message(
             event="multicast",
@@ -56,7 +75,7 @@ class BoardEventHandler():
             payload=TilesPayload(
                 start_p=Point(start.x, start.y),
                 end_p=Point(end.x, end.y),
-                tiles=tiles.to_str()
+                tiles=tiles.to_bytes()
             )
         )
 
@@ -65,6 +84,35 @@ class BoardEventHandler():
     @EventBroker.add_receiver(PointEvent.TRY_POINTING)
     @staticmethod
     async def receive_try_pointing(message: Message[TryPointingPayload]):
+        result, state_changed = BoardEventHandler._try_pointing(message)
+
+        publish_coroutines = [EventBroker.publish(result)]
+        if state_changed is not None:
+            publish_coroutines.append(EventBroker.publish(state_changed))
+
+        await asyncio.gather(*publish_coroutines)
+
+    @EventBroker.add_responder(PointEvent.TRY_POINTING)
+    @staticmethod
+    async def try_pointing(message: Message[TryPointingPayload]) -> Message[PointingResultPayload]:
+        """
+        try-pointing 요청에 pointing-result 메시지로 응답한다.
+        타일 상태가 바뀌면 tile-state-changed를 발행한다.
+        """
+        result, state_changed = BoardEventHandler._try_pointing(message)
+
+        if state_changed is not None:
+            await EventBroker.publish(state_changed)
+
+        return result
+
+    @staticmethod
+    def _try_pointing(
+        message: Message[TryPointingPayload]
+    ) -> tuple[Message[PointingResultPayload], Message[TileStateChangedPayload] | None]:
+        """
+        포인팅 결과와, 타일 상태가 바뀌었다면 tile-state-changed 메시지를 반환한다.
+        """
         sender = message.header["sender"]
 
         pointer = message.payload.new_pointer
@@ -81,9 +129,7 @@ class BoardEventHandler():
                 pointable = True
                 break
 
-        publish_coroutines = []
-
-        pub_message = Message(
+        result = Message(
             event=PointEvent.POINTING_RESULT,
             header={"receiver": sender},
             payload=PointingResultPayload(
@@ -92,13 +138,10 @@ class BoardEventHandler():
             )
         )
 
-        publish_coroutines.append(EventBroker.publish(pub_message))
-
         cursor_pos = message.payload.cursor_position
 
         if not pointable:
-            await asyncio.gather(*publish_coroutines)
-            return
+            return result, None
 
         # 인터랙션 범위 체크
         if \
@@ -106,23 +149,20 @@ class BoardEventHandler():
                 pointer.x > cursor_pos.x + 1 or \
                 pointer.y < cursor_pos.y - 1 or \
                 pointer.y > cursor_pos.y + 1:
-            await asyncio.gather(*publish_coroutines)
-            return
+            return result, None
 
         # 보드 상태 업데이트하기
         tile = Tile.from_int(tiles.data[4])  # 3x3칸 중 가운데
         click_type = message.payload.click_type
 
         if tile.is_open:
-            await asyncio.gather(*publish_coroutines)
-            return
+            return result, None
 
         match (click_type):
             # 닫힌 타일 열기
             case ClickType.GENERAL_CLICK:
                 if tile.is_flag:
-                    await asyncio.gather(*publish_coroutines)
-                    return
+                    return result, None
 
                 tile.is_open = True
 
@@ -135,7 +175,7 @@ class BoardEventHandler():
 
         BoardHandler.update_tile(pointer, tile)
 
-        pub_message = Message(
+        state_changed = Message(
             event=InteractionEvent.TILE_STATE_CHANGED,
             payload=TileStateChangedPayload(
                 position=pointer,
@@ -143,13 +183,21 @@ class BoardEventHandler():
             )
         )
 
-        publish_coroutines.append(EventBroker.publish(pub_message))
-
-        await asyncio.gather(*publish_coroutines)
+        return result, state_changed
 
     @EventBroker.add_receiver(MoveEvent.CHECK_MOVABLE)
     @staticmethod
     async def receive_check_movable(message: Message[CheckMovablePayload]):
+        result = await BoardEventHandler.check_movable(message)
+
+        await EventBroker.publish(result)
+
+    @EventBroker.add_responder(MoveEvent.CHECK_MOVABLE)
+    @staticmethod
+    async def check_movable(message: Message[CheckMovablePayload]) -> Message[MovableResultPayload]:
+        """
+        check-movable 요청에 movable-result 메시지로 응답한다.
+        """
         sender = message.header["sender"]
 
         position = message.payload.position
@@ -158,8 +206,11 @@ class BoardEventHandler():
         tile = Tile.from_int(tiles.data[0])
 
         movable = tile.is_open
+        if movable:
+            # 이동 방향 앞쪽의 섹션 미리 생성
+            SectionPrefetcher.move(sender, position)
 
-        message = Message(
+        return Message(
             event=MoveEvent.MOVABLE_RESULT,
             header={"receiver": sender},
             payload=MovableResultPayload(
@@ -167,5 +218,3 @@ class BoardEventHandler():
                 movable=movable
             )
         )
-
-        await EventBroker.publish(message)
@@ -2,6 +2,7 @@ import asyncio
 from cursor.data import Color
 from board.data import Point, Tile, Tiles
 from board.event.handler import BoardEventHandler
+from event import EventBroker
 from board.data.handler import BoardHandler
 from board.data.handler.test.fixtures import setup_board
 from message import Message
@@ -120,7 +121,7 @@ class BoardEventHandler_FetchTilesReceiver_TestCase(unittest.IsolatedAsyncioTest
             empty_open.data, one_open.data, one_open.data, one_open.data
         ]))
 
-        self.assertEqual(got.payload.tiles, expected.to_str())
+        self.assertEqual(got.payload.tiles, expected.to_bytes())
 
     @patch("event.EventBroker.publish")
     async def test_receive_new_conn(self, mock: AsyncMock):
@@ -160,7 +161,7 @@ class BoardEventHandler_FetchTilesReceiver_TestCase(unittest.IsolatedAsyncioTest
             empty_open.data, one_open.data, closed.data,
             one_open.data, one_open.data, purple_flag.data
         ]))
-        self.assertEqual(got.payload.tiles, expected.to_str())
+        self.assertEqual(got.payload.tiles, expected.to_bytes())
 
 
 class BoardEventHandler_PointingReceiver_TestCase(unittest.IsolatedAsyncioTestCase):
@@ -519,6 +520,55 @@ class BoardEventHandler_PointingReceiver_TestCase(unittest.IsolatedAsyncioTestCa
         self.assertEqual(got.payload.position, new_position)
         self.assertFalse(got.payload.movable)
 
+    @patch("event.EventBroker.publish")
+    async def test_check_movable_responder(self, mock: AsyncMock):
+        new_position = Point(0, 0)
+        message = Message(
+            event=MoveEvent.CHECK_MOVABLE,
+            header={"sender": self.sender_id},
+            payload=CheckMovablePayload(
+                position=new_position
+            )
+        )
+
+        got: Message[MovableResultPayload] = await EventBroker.request(message)
+
+        mock.assert_not_called()
+
+        self.assertEqual(got.event, MoveEvent.MOVABLE_RESULT)
+        self.assertEqual(got.header["receiver"], self.sender_id)
+        self.assertEqual(got.payload.position, new_position)
+        self.assertTrue(got.payload.movable)
+
+    @patch("event.EventBroker.publish")
+    async def test_try_pointing_responder(self, mock: AsyncMock):
+        cursor_pos = Point(0, 0)
+        pointer = Point(1, 0)
+
+        message = Message(
+            event=PointEvent.TRY_POINTING,
+            header={"sender": self.sender_id},
+            payload=TryPointingPayload(
+                cursor_position=cursor_pos,
+                new_pointer=pointer,
+                click_type=ClickType.GENERAL_CLICK,
+                color=Color.BLUE
+            )
+        )
+
+        got: Message[PointingResultPayload] = await EventBroker.request(message)
+
+        self.assertEqual(got.event, PointEvent.POINTING_RESULT)
+        self.assertEqual(got.header["receiver"], self.sender_id)
+        self.assertTrue(got.payload.pointable)
+        self.assertEqual(got.payload.pointer, pointer)
+
+        # tile-state-changed만 발행
+        mock.assert_called_once()
+        state_changed: Message[TileStateChangedPayload] = mock.mock_calls[0].args[0]
+        self.assertEqual(state_changed.event, InteractionEvent.TILE_STATE_CHANGED)
+        self.assertEqual(state_changed.payload.position, pointer)
+
 
 if __name__ == "__main__":
     unittest.main()
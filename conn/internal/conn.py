@@ -1,25 +1,132 @@
+import asyncio
 from fastapi.websockets import WebSocket
-from message import Message
-from dataclasses import dataclass
+from message import Message, Protocol
+from message.payload import TileEncoding
+from dataclasses import dataclass, field
 
 
 @dataclass
 class Conn:
     id: str
     conn: WebSocket
+    protocol: Protocol = Protocol.JSON
+    tile_encoding: TileEncoding = TileEncoding.HEX
+    # True면 flush()할 때 연속된 텍스트 프레임을 JSON 배열 하나로 묶어서 보낸다. 연결할 때 클라이언트가 정한다.
+    batch: bool = False
+    # queue()로 쌓인, 아직 보내지 않은 프레임들
+    outbox: list[str | bytes] = field(default_factory=list)
+    flush_task: asyncio.Task | None = None
+    # send()와 flush()가 서로 끼어들지 않도록 한다.
+    sending: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # 서버가 close()로 연결을 닫았는지
+    closed: bool = False
 
     @staticmethod
-    def create(id: str, ws: WebSocket):
-        return Conn(id=id, conn=ws)
+    def create(
+        id: str, ws: WebSocket,
+        protocol: Protocol = Protocol.JSON, tile_encoding: TileEncoding = TileEncoding.HEX, batch: bool = False
+    ):
+        return Conn(id=id, conn=ws, protocol=protocol, tile_encoding=tile_encoding, batch=batch)
 
     async def accept(self):
         await self.conn.accept()
 
     async def close(self):
+        self.closed = True
         await self.conn.close()
 
     async def receive(self):
         return Message.from_str(await self.conn.receive_text())
 
+    def encode(self, msg: Message) -> str | bytes:
+        return msg.to_frame(protocol=self.protocol, tile_encoding=self.tile_encoding)
+
     async def send(self, msg: Message):
-        await self.conn.send_text(msg.to_str())
+        """
+        msg를 바로 보낸다. queue()로 쌓인 프레임이 있으면 먼저 보낸다.
+        """
+        frame = self.encode(msg)
+
+        async with self.sending:
+            if len(self.outbox) > 0:
+                self._cancel_flush()
+                await self._flush()
+
+            await self._send_frame(frame)
+
+    def queue(self, msg: Message, interval: float):
+        """
+        msg를 바로 보내지 않고 쌓아뒀다가 interval(초) 뒤에 flush()로 한 번에 보낸다.
+        msg는 지금 인코딩하므로 이후에 msg가 바뀌어도 상관 없다.
+        """
+        self.outbox.append(self.encode(msg))
+
+        if self.flush_task is None:
+            self.flush_task = asyncio.create_task(self._flush_after(interval))
+
+    async def _flush_after(self, interval: float):
+        await asyncio.sleep(interval)
+        self.flush_task = None
+
+        try:
+            await self.flush()
+        except Exception as e:
+            # 아무도 기다리지 않는 task이므로 여기서 처리한다.
+            print(f"Unhandled error while flushing conn {self.id}: {type(e)}: '{e}'")
+
+    async def flush(self):
+        """
+        쌓인 프레임들을 순서대로 보낸다.
+        batch면 연속된 텍스트 프레임을 JSON 배열 하나로 묶어서 보낸다. binary 프레임은 항상 하나씩 보낸다.
+        """
+        async with self.sending:
+            await self._flush()
+
+    def discard(self):
+        """
+        보내지 않은 프레임을 버리고 예약된 flush를 취소한다.
+        """
+        self.outbox = []
+        self._cancel_flush()
+
+    def _cancel_flush(self):
+        if self.flush_task is not None:
+            self.flush_task.cancel()
+            self.flush_task = None
+
+    async def _flush(self):
+        frames, self.outbox = self.outbox, []
+
+        if not self.batch:
+            for frame in frames:
+                await self._send_frame(frame)
+            return
+
+        texts = []
+        for frame in frames:
+            if isinstance(frame, bytes):
+                await self._send_texts(texts)
+                texts = []
+                await self.conn.send_bytes(frame)
+                continue
+
+            texts.append(frame)
+
+        await self._send_texts(texts)
+
+    async def _send_frame(self, frame: str | bytes):
+        if isinstance(frame, bytes):
+            await self.conn.send_bytes(frame)
+            return
+
+        await self.conn.send_text(frame)
+
+    async def _send_texts(self, texts: list[str]):
+        if len(texts) == 0:
+            return
+
+        if len(texts) == 1:
+            await self.conn.send_text(texts[0])
+            return
+
+        await self.conn.send_text("[" + ",".join(texts) + "]")
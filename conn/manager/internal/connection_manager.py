@@ -1,9 +1,10 @@
 import asyncio
 from fastapi.websockets import WebSocket
 from conn import Conn
-from message import Message
-from message.payload import NewConnEvent, NewConnPayload, ConnClosedPayload, DumbHumanException
-from event import EventBroker
+from message import Message, Protocol
+from message.payload import NewConnEvent, NewConnPayload, ConnClosedPayload, DumbHumanException, TileEncoding
+from cursor.data.handler import CursorHandler
+from event import EventBroker, EventLanes
 from uuid import uuid4
 
 
@@ -17,6 +18,9 @@ def overwrite_event(msg: Message):
 
 class ConnectionManager:
     conns: dict[str, Conn] = {}
+    # 0보다 크면 보낼 메시지를 연결마다 flush_interval(초) 동안 모았다가 한 번에 보낸다.
+    # batch로 연결한 클라이언트에게는 모은 텍스트 메시지들을 JSON 배열 한 프레임으로 보낸다.
+    flush_interval: float = 0
 
     @staticmethod
     def get_conn(id: str):
@@ -25,10 +29,13 @@ class ConnectionManager:
         return None
 
     @staticmethod
-    async def add(conn: WebSocket, width: int, height: int) -> Conn:
+    async def add(
+        conn: WebSocket, width: int, height: int,
+        protocol: Protocol = Protocol.JSON, tile_encoding: TileEncoding = TileEncoding.HEX, batch: bool = False
+    ) -> Conn:
         id = ConnectionManager.generate_conn_id()
 
-        conn_obj = Conn(id=id, conn=conn)
+        conn_obj = Conn(id=id, conn=conn, protocol=protocol, tile_encoding=tile_encoding, batch=batch)
         await conn_obj.accept()
         ConnectionManager.conns[id] = conn_obj
 
@@ -48,6 +55,10 @@ class ConnectionManager:
     @staticmethod
     async def close(conn: Conn) -> Conn:
         ConnectionManager.conns.pop(conn.id)
+        conn.discard()
+        if EventLanes.enabled():
+            # 닫힌 연결의 메시지가 CONN_CLOSED 이후에 처리되지 않도록 한다.
+            EventLanes.discard(conn.id)
 
         message = Message(
             event=NewConnEvent.CONN_CLOSED,
@@ -67,13 +78,9 @@ class ConnectionManager:
     async def receive_broadcast_event(message: Message):
         overwrite_event(message)
 
-        coroutines = []
+        conns = list(ConnectionManager.conns.values())
 
-        for id in ConnectionManager.conns:
-            conn = ConnectionManager.conns[id]
-            coroutines.append(conn.send(message))
-
-        await asyncio.gather(*coroutines)
+        await ConnectionManager.send(conns, message)
 
     @EventBroker.add_receiver("multicast")
     @staticmethod
@@ -82,17 +89,53 @@ class ConnectionManager:
         if "target_conns" not in message.header:
             raise DumbHumanException()
 
-        coroutines = []
+        conns = []
 
         for conn_id in message.header["target_conns"]:
             conn = ConnectionManager.get_conn(conn_id)
             if not conn:
                 raise DumbHumanException()
 
-            coroutines.append(conn.send(message))
+            conns.append(conn)
+
+        await ConnectionManager.send(conns, message)
+
+    @EventBroker.add_receiver("areacast")
+    @staticmethod
+    async def receive_areacast_event(message: Message):
+        """
+        header의 position을 뷰에 포함하는 연결들에게 전달한다.
+        뷰는 커서가 가지고 있으므로 CursorHandler에서 찾는다.
+        """
+        overwrite_event(message)
+        if "position" not in message.header:
+            raise DumbHumanException()
+
+        position = message.header["position"]
+        del message.header["position"]
+
+        conns = []
+        for cursor in CursorHandler.view_includes(p=position):
+            conn = ConnectionManager.get_conn(cursor.conn_id)
+            if conn:
+                conns.append(conn)
+
+        await ConnectionManager.send(conns, message)
 
-        await asyncio.gather(*coroutines)
+    @staticmethod
+    async def send(conns: list[Conn], message: Message):
+        if ConnectionManager.flush_interval > 0:
+            for conn in conns:
+                conn.queue(message, ConnectionManager.flush_interval)
+            return
+
+        await asyncio.gather(*[conn.send(message) for conn in conns])
 
     @staticmethod
     async def handle_message(message: Message):
+        if EventLanes.enabled():
+            # 우선순위 Lane에 넣고 바로 반환한다. 처리는 Lane worker가 한다.
+            await EventLanes.submit(message)
+            return
+
         await EventBroker.publish(message)
@@ -4,9 +4,11 @@ import uuid
 from unittest.mock import AsyncMock, patch
 from conn import Conn
 from conn.manager import ConnectionManager
+from cursor.data import Cursor, Color
+from cursor.data.handler import CursorHandler, CursorStore
 from message import Message
 from message.payload import TilesPayload, NewConnEvent, NewConnPayload, ConnClosedPayload
-from event import EventBroker
+from event import EventBroker, EventLanes, Lane, Priority
 from conn.test.fixtures import create_connection_mock
 from board.data import Point
 
@@ -20,6 +22,7 @@ class ConnectionManagerTestCase(unittest.IsolatedAsyncioTestCase):
 
     def tearDown(self):
         ConnectionManager.conns = {}
+        CursorHandler.cursor_dict = CursorStore()
 
     @patch("event.EventBroker.publish")
     async def test_add(self, mock: AsyncMock):
@@ -145,6 +148,74 @@ class ConnectionManagerTestCase(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(expected.to_str(), got1)
         self.assertEqual(expected.to_str(), got2)
 
+    @patch("event.EventBroker.publish")
+    async def test_receive_multicast_event_coalesced(self, mock: AsyncMock):
+        ConnectionManager.flush_interval = 0.01
+        self.addCleanup(setattr, ConnectionManager, "flush_interval", 0)
+
+        con1 = await ConnectionManager.add(self.con1, 1, 1, batch=True)
+        _ = await ConnectionManager.add(self.con2, 1, 1)
+
+        messages = [
+            Message(
+                event="multicast",
+                header={"target_conns": [con1.id], "origin_event": f"ayo{i}"},
+                payload=None
+            )
+            for i in range(3)
+        ]
+
+        for message in messages:
+            await ConnectionManager.receive_multicast_event(message)
+
+        self.con1.send_text.assert_not_called()
+
+        await con1.flush_task
+
+        self.con1.send_text.assert_called_once()
+        self.con2.send_text.assert_not_called()
+
+        expected = [Message(event=f"ayo{i}", payload=None).to_str() for i in range(3)]
+        got: str = self.con1.send_text.mock_calls[0].args[0]
+        self.assertEqual(got, "[" + ",".join(expected) + "]")
+
+    @patch("event.EventBroker.publish")
+    async def test_receive_areacast_event(self, mock: AsyncMock):
+        con1 = await ConnectionManager.add(self.con1, 1, 1)
+        con2 = await ConnectionManager.add(self.con2, 1, 1)
+        con3 = await ConnectionManager.add(self.con3, 1, 1)
+
+        def cursor(conn_id: str, position: Point, width: int, height: int):
+            return Cursor(
+                conn_id=conn_id, position=position, pointer=None,
+                width=width, height=height, color=Color.RED, revive_at=None
+            )
+
+        # con1은 (1, -1)을 보지 않음, con3는 연결 목록에 없는 커서와 함께 멀리 있음
+        CursorHandler.cursor_dict = CursorStore({
+            con1.id: cursor(con1.id, Point(0, 0), 0, 0),
+            con2.id: cursor(con2.id, Point(0, 0), 3, 3),
+            con3.id: cursor(con3.id, Point(1000, 1000), 1, 1),
+            "closed": cursor("closed", Point(0, 0), 3, 3)
+        })
+
+        origin_event = "ayo"
+        message = Message(
+            event="areacast",
+            header={"position": Point(1, -1), "origin_event": origin_event},
+            payload=None
+        )
+
+        await ConnectionManager.receive_areacast_event(message)
+
+        self.con1.send_text.assert_not_called()
+        self.con2.send_text.assert_called_once()
+        self.con3.send_text.assert_not_called()
+        self.con4.send_text.assert_not_called()
+
+        expected = Message(event=origin_event, payload=None)
+        self.assertEqual(self.con2.send_text.mock_calls[0].args[0], expected.to_str())
+
     async def test_handle_message(self):
         mock = AsyncMock()
         EventBroker.add_receiver("example")(mock)
@@ -165,6 +236,44 @@ class ConnectionManagerTestCase(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(got.header["sender"], conn_id)
         self.assertEqual(got.to_str(), message.to_str())
 
+    async def test_handle_message_lanes(self):
+        EventLanes.start(lanes=[Lane(priority=Priority.NORMAL, maxsize=1)], event_priority={})
+        self.addAsyncCleanup(EventLanes.stop)
+
+        message = Message(event="example", header={"sender": "a"}, payload=None)
+
+        with patch("event.EventBroker.publish") as publish:
+            await ConnectionManager.handle_message(message=message)
+
+            # 바로 발행하지 않고 Lane에 넣는다.
+            publish.assert_not_called()
+            self.assertEqual(list(EventLanes.lanes[Priority.NORMAL].queue), [message])
+
+    @patch("event.EventBroker.publish")
+    async def test_close_discards_lane_messages(self, mock: AsyncMock):
+        EventLanes.start(
+            lanes=[
+                Lane(priority=Priority.HIGH, maxsize=10),
+                Lane(priority=Priority.NORMAL, maxsize=10)
+            ],
+            event_priority={"example_high": Priority.HIGH}
+        )
+        self.addAsyncCleanup(EventLanes.stop)
+
+        conn = Conn.create("a", self.con1)
+        ConnectionManager.conns[conn.id] = conn
+
+        other = Message(event="example", header={"sender": "b"}, payload=None)
+        await EventLanes.submit(Message(event="example_high", header={"sender": "a"}, payload=None))
+        await EventLanes.submit(Message(event="example", header={"sender": "a"}, payload=None))
+        await EventLanes.submit(other)
+
+        # worker가 꺼내기 전에 닫는다.
+        await ConnectionManager.close(conn)
+
+        self.assertEqual(list(EventLanes.lanes[Priority.HIGH].queue), [])
+        self.assertEqual(list(EventLanes.lanes[Priority.NORMAL].queue), [other])
+
 
 if __name__ == "__main__":
     unittest.main()
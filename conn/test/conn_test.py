@@ -1,9 +1,12 @@
+import asyncio
 import unittest
+from unittest.mock import patch
 
 from .fixtures import create_connection_mock
 from dataclasses import dataclass
-from message.payload import Payload
-from message import Message
+from message.payload import Payload, TilesPayload
+from message import Message, Protocol
+from board.data import Point
 from message.internal.message import DECODABLE_PAYLOAD_DICT
 from conn import Conn
 
@@ -46,6 +49,118 @@ class ConnectionTestCase(unittest.IsolatedAsyncioTestCase):
         self.conn.send_text.assert_called_once()
         self.assertEqual(self.conn.send_text.mock_calls[0].args[0], msg.to_str())
 
+    async def test_send_binary(self):
+        conn_obj = Conn.create(self.id, self.conn, protocol=Protocol.BINARY)
+
+        msg = Message("tiles", payload=TilesPayload(start_p=Point(0, 0), end_p=Point(0, 0), tiles="81"))
+        await conn_obj.send(msg)
+
+        self.conn.send_bytes.assert_called_once()
+        self.assertEqual(self.conn.send_bytes.mock_calls[0].args[0], msg.to_bytes())
+
+        # binary로 보낼 수 없는 이벤트는 JSON으로
+        msg = Message("example", payload=ExamplePayload(a=0))
+        await conn_obj.send(msg)
+
+        self.conn.send_text.assert_called_once()
+        self.assertEqual(self.conn.send_text.mock_calls[0].args[0], msg.to_str())
+
+    async def test_send_encode_once(self):
+        other = create_connection_mock()
+        other_obj = Conn.create("other", other)
+
+        msg = Message("example", payload=ExamplePayload(a=0))
+        with patch.object(Message, "to_str", wraps=msg.to_str) as to_str:
+            await self.conn_obj.send(msg)
+            await other_obj.send(msg)
+
+            to_str.assert_called_once()
+
+        # 같은 프레임을 보낸다.
+        self.assertIs(self.conn.send_text.mock_calls[0].args[0], other.send_text.mock_calls[0].args[0])
+
+    async def test_queue(self):
+        conn_obj = Conn.create(self.id, self.conn, protocol=Protocol.BINARY, batch=True)
+
+        msg1 = Message("example", payload=ExamplePayload(a=1))
+        msg2 = Message("example", payload=ExamplePayload(a=2))
+        tiles = Message("tiles", payload=TilesPayload(start_p=Point(0, 0), end_p=Point(0, 0), tiles="81"))
+        msg3 = Message("example", payload=ExamplePayload(a=3))
+
+        conn_obj.queue(msg1, interval=0.01)
+        conn_obj.queue(msg2, interval=0.01)
+        conn_obj.queue(tiles, interval=0.01)
+        conn_obj.queue(msg3, interval=0.01)
+
+        self.conn.send_text.assert_not_called()
+        self.conn.send_bytes.assert_not_called()
+
+        await conn_obj.flush_task
+
+        # 연속된 텍스트는 배열 하나로, binary는 순서대로 따로
+        self.assertEqual(len(self.conn.send_text.mock_calls), 2)
+        self.assertEqual(self.conn.send_text.mock_calls[0].args[0], f"[{msg1.to_str()},{msg2.to_str()}]")
+        self.assertEqual(self.conn.send_text.mock_calls[1].args[0], msg3.to_str())
+        self.conn.send_bytes.assert_called_once_with(tiles.to_bytes())
+        self.assertIsNone(conn_obj.flush_task)
+        self.assertEqual(conn_obj.outbox, [])
+
+    async def test_queue_no_batch(self):
+        msg1 = Message("example", payload=ExamplePayload(a=1))
+        msg2 = Message("example", payload=ExamplePayload(a=2))
+
+        self.conn_obj.queue(msg1, interval=0.01)
+        self.conn_obj.queue(msg2, interval=0.01)
+
+        await self.conn_obj.flush_task
+
+        # batch가 아니면 메시지마다 한 프레임
+        self.assertEqual(
+            [call.args[0] for call in self.conn.send_text.mock_calls],
+            [msg1.to_str(), msg2.to_str()]
+        )
+
+    async def test_send_after_queue(self):
+        queued = Message("example", payload=ExamplePayload(a=1))
+        direct = Message("example", payload=ExamplePayload(a=2))
+
+        self.conn_obj.queue(queued, interval=0.01)
+        task = self.conn_obj.flush_task
+
+        await self.conn_obj.send(direct)
+
+        # 쌓인 프레임을 먼저 보내고, 예약된 flush는 취소한다.
+        self.assertEqual(
+            [call.args[0] for call in self.conn.send_text.mock_calls],
+            [queued.to_str(), direct.to_str()]
+        )
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertIsNone(self.conn_obj.flush_task)
+
+    async def test_flush_error(self):
+        self.conn.send_text.side_effect = Exception("closed")
+
+        self.conn_obj.queue(Message("example", payload=ExamplePayload(a=0)), interval=0)
+
+        with patch("builtins.print") as print_mock:
+            # task 밖으로 예외가 나오지 않는다.
+            await self.conn_obj.flush_task
+
+            print_mock.assert_called_once()
+
+    async def test_discard(self):
+        self.conn_obj.queue(Message("example", payload=ExamplePayload(a=0)), interval=0.01)
+        task = self.conn_obj.flush_task
+
+        self.conn_obj.discard()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        self.conn.send_text.assert_not_called()
+        self.assertEqual(self.conn_obj.outbox, [])
+
     async def test_receive(self):
         msg: Message[ExamplePayload] = Message("example", payload=ExamplePayload(a=0))
 
@@ -8,6 +8,7 @@ class ConnMock():
         self.accept = AsyncMock()
         self.receive_text = AsyncMock()
         self.send_text = AsyncMock()
+        self.send_bytes = AsyncMock()
         self.close = AsyncMock()
 
 
@@ -1,4 +1,5 @@
-from .internal.cursor_handler import CursorHandler
+from .internal.cursor_handler import CursorHandler, MoveDelta
+from .internal.cursor_store import CursorStore
 from .internal.cursor_exception import (
     AlreadyWatchingException,
     NoMatchingCursorException,
@@ -1,5 +1,8 @@
+from collections.abc import Iterable, Set
+from dataclasses import dataclass
 from board.data import Point
 from cursor.data import Cursor, Color
+from .cursor_store import CursorStore
 from .cursor_exception import (
     AlreadyWatchingException,
     NoMatchingCursorException,
@@ -8,11 +11,23 @@ from .cursor_exception import (
 )
 
 
+@dataclass
+class MoveDelta:
+    # 이동 전에 커서를 보고 있던 커서 id들
+    original_watchers: list[str]
+    # 이동 후 새로 보게 된 커서들
+    new_watchings: list[Cursor]
+    # 이동 후 새로 커서를 보게 된 커서들
+    new_watchers: list[Cursor]
+
+
 class CursorHandler:
-    cursor_dict: dict[str, Cursor] = {}
+    cursor_dict: CursorStore = CursorStore()
 
-    watchers: dict[str, list[str]] = {}
-    watching: dict[str, list[str]] = {}
+    # cursor id -> 이 커서를 보고 있는 커서 id들
+    watchers: dict[str, set[str]] = {}
+    # cursor id -> 이 커서가 보고 있는 커서 id들
+    watching: dict[str, set[str]] = {}
 
     @staticmethod
     def create_cursor(conn_id: str):
@@ -32,32 +47,87 @@ class CursorHandler:
         if conn_id in CursorHandler.cursor_dict:
             return CursorHandler.cursor_dict[conn_id]
 
+    @staticmethod
+    def move_cursor(cursor: Cursor, position: Point):
+        CursorHandler.cursor_dict.move(cursor, position)
+
+    @staticmethod
+    def apply_move(cursor: Cursor, position: Point) -> MoveDelta:
+        """
+        커서를 position으로 옮기고 watcher 관계를 갱신한다.
+        watching은 이전 뷰와 새 뷰의 차이(띠 모양 범위)만 확인한다.
+        watcher는 새 위치를 보는 커서들을 한 번 조회해 기존 watcher들과 비교한다.
+        """
+        cursor_id = cursor.conn_id
+
+        old_start, old_end = view_range(cursor)
+        new_start, new_end = view_range(cursor, position)
+        original_watchers = list(CursorHandler.get_watchers(cursor_id))
+
+        CursorHandler.move_cursor(cursor, position)
+
+        removed = []
+
+        # watching: 뷰에서 빠진 범위, 새로 들어온 범위
+        watching = CursorHandler.get_watching(cursor_id)
+        leaving = CursorHandler.exists_range(
+            start=old_start, end=old_end, exclude_ids=[cursor_id],
+            exclude_start=new_start, exclude_end=new_end
+        )
+        removed.extend((cursor_id, other.conn_id) for other in leaving if other.conn_id in watching)
+
+        entering = CursorHandler.exists_range(
+            start=new_start, end=new_end, exclude_ids=[cursor_id],
+            exclude_start=old_start, exclude_end=old_end
+        )
+        new_watchings = [other for other in entering if other.conn_id not in watching]
+
+        # watcher: 새 위치를 보는 커서들과 기존 watcher들 비교
+        watchers = CursorHandler.get_watchers(cursor_id)
+        new_watchers = []
+        remaining = set()
+        for other in CursorHandler.view_includes(position, exclude_ids=[cursor_id]):
+            if other.conn_id in watchers:
+                remaining.add(other.conn_id)
+            else:
+                new_watchers.append(other)
+
+        removed.extend((watcher_id, cursor_id) for watcher_id in original_watchers if watcher_id not in remaining)
+
+        CursorHandler.update_watchers(
+            added=[
+                *[(cursor_id, other.conn_id) for other in new_watchings],
+                *[(other.conn_id, cursor_id) for other in new_watchers]
+            ],
+            removed=removed
+        )
+
+        return MoveDelta(
+            original_watchers=original_watchers,
+            new_watchings=new_watchings,
+            new_watchers=new_watchers
+        )
+
+    @staticmethod
+    def set_cursor_size(cursor: Cursor, width: int, height: int):
+        CursorHandler.cursor_dict.resize(cursor, width, height)
+
     # range 안에 커서가 있는가
     @staticmethod
     def exists_range(
         start: Point, end: Point, exclude_ids: list[str] = [],
         exclude_start: Point | None = None, exclude_end: Point | None = None
     ) -> list[Cursor]:
-        result = []
-        for cursor_id in CursorHandler.cursor_dict:
-            if cursor_id in exclude_ids:
-                continue
+        ranges = [(start, end)]
+        if exclude_start is not None and exclude_end is not None:
+            # exclude_range를 뺀 나머지 띠 모양 범위들만 찾는다.
+            ranges = subtract_range(start, end, exclude_start, exclude_end)
 
-            cursor = CursorHandler.cursor_dict[cursor_id]
-            pos = cursor.position
-            # start & end 범위를 벗어나는가
-            if \
-                    start.x > pos.x or end.x < pos.x or \
-                    end.y > pos.y or start.y < pos.y:
+        result = []
+        for cursor in CursorHandler.cursor_dict.in_ranges(ranges):
+            if cursor.conn_id in exclude_ids:
                 continue
 
-            # exclude_range 범위에 들어가는가
-            if exclude_start is not None and exclude_end is not None:
-                if \
-                        pos.x >= exclude_start.x and pos.x <= exclude_end.x and \
-                        pos.y >= exclude_end.y and pos.y <= exclude_start.y:
-                    continue
-
             result.append(cursor)
 
         return result
@@ -66,14 +136,8 @@ class CursorHandler:
     @staticmethod
     def view_includes(p: Point, exclude_ids: list[str] = []) -> list[Cursor]:
         result = []
-        for cursor_id in CursorHandler.cursor_dict:
-            if cursor_id in exclude_ids:
-                continue
-
-            cursor = CursorHandler.cursor_dict[cursor_id]
-
-            # 커서 뷰 범위를 벗어나는가
-            if not cursor.check_in_view(p):
+        for cursor in CursorHandler.cursor_dict.viewing(p):
+            if cursor.conn_id in exclude_ids:
                 continue
 
             result.append(cursor)
@@ -99,13 +163,7 @@ class CursorHandler:
         if not watcher.check_in_view(watching.position):
             raise NotWatchableException(p=watching.position, cursor_id=watcher.conn_id)
 
-        if not watcher_id in CursorHandler.watching:
-            CursorHandler.watching[watcher_id] = []
-        CursorHandler.watching[watcher_id].append(watching_id)
-
-        if not watching_id in CursorHandler.watchers:
-            CursorHandler.watchers[watching_id] = []
-        CursorHandler.watchers[watching_id].append(watcher_id)
+        _link(watcher_id, watching_id)
 
     @staticmethod
     def remove_watcher(watcher: Cursor, watching: Cursor):
@@ -123,33 +181,48 @@ class CursorHandler:
         if not CursorHandler.check_cursor_watching(watching_id, watcher_id):
             raise NotWatchingException(watcher=watcher_id, watching=watching_id)
 
-        CursorHandler.watching[watcher_id].remove(watching_id)
-        if len(CursorHandler.watching[watcher_id]) == 0:
-            del CursorHandler.watching[watcher_id]
+        _unlink(watcher_id, watching_id)
+
+    @staticmethod
+    def update_watchers(
+        added: Iterable[tuple[str, str]] = (),
+        removed: Iterable[tuple[str, str]] = ()
+    ):
+        """
+        (watcher id, watching id) 관계들을 한 번에 제거(removed), 추가(added)한다.
+        커서 존재 여부와 뷰 범위는 호출하는 쪽에서 확인해야 한다.
+        """
+        for watcher_id, watching_id in removed:
+            if not CursorHandler.check_cursor_watching(watching_id, watcher_id):
+                raise NotWatchingException(watcher=watcher_id, watching=watching_id)
+            _unlink(watcher_id, watching_id)
 
-        CursorHandler.watchers[watching_id].remove(watcher_id)
-        if len(CursorHandler.watchers[watching_id]) == 0:
-            del CursorHandler.watchers[watching_id]
+        for watcher_id, watching_id in added:
+            if CursorHandler.check_cursor_watching(watching_id, watcher_id):
+                raise AlreadyWatchingException(watcher=watcher_id, watching=watching_id)
+            _link(watcher_id, watching_id)
 
     @staticmethod
-    def get_watchers(cursor_id: str) -> list[str]:
+    def get_watchers(cursor_id: str) -> Set[str]:
+        """
+        cursor_id를 보고 있는 커서 id들.
+        복사하지 않으므로 읽기 전용으로 사용하고, 관계를 바꾸는 동안 들고 있어야 하면 복사해서 사용한다.
+        """
         if not CursorHandler.check_cursor_exists(cursor_id):
             raise NoMatchingCursorException(cursor_id)
 
-        if cursor_id in CursorHandler.watchers:
-            return CursorHandler.watchers[cursor_id].copy()
-
-        return []
+        return CursorHandler.watchers.get(cursor_id, _EMPTY)
 
     @staticmethod
-    def get_watching(cursor_id: str) -> list[str]:
+    def get_watching(cursor_id: str) -> Set[str]:
+        """
+        cursor_id가 보고 있는 커서 id들.
+        복사하지 않으므로 읽기 전용으로 사용하고, 관계를 바꾸는 동안 들고 있어야 하면 복사해서 사용한다.
+        """
         if not CursorHandler.check_cursor_exists(cursor_id):
             raise NoMatchingCursorException(cursor_id)
 
-        if cursor_id in CursorHandler.watching:
-            return CursorHandler.watching[cursor_id].copy()
-
-        return []
+        return CursorHandler.watching.get(cursor_id, _EMPTY)
 
     @staticmethod
     def check_cursor_exists(id: str):
@@ -160,10 +233,68 @@ class CursorHandler:
         """
         커서 watching 관계가 형성되어 있으면 True
         """
-        watcher_rel = watching_id in CursorHandler.watchers
-        watcher_rel = watcher_rel and watcher_id in CursorHandler.watchers[watching_id]
-
-        watching_rel = watcher_id in CursorHandler.watching
-        watching_rel = watching_rel and watching_id in CursorHandler.watching[watcher_id]
+        watcher_rel = watcher_id in CursorHandler.watchers.get(watching_id, _EMPTY)
+        watching_rel = watching_id in CursorHandler.watching.get(watcher_id, _EMPTY)
 
         return watcher_rel and watching_rel
+
+
+_EMPTY: frozenset[str] = frozenset()
+
+
+def view_range(cursor: Cursor, position: Point | None = None) -> tuple[Point, Point]:
+    """
+    position(기본값은 커서 위치)에 있을 때 커서 뷰의 (top_left, bottom_right)
+    """
+    pos = position if position is not None else cursor.position
+    return (
+        Point(pos.x - cursor.width, pos.y + cursor.height),
+        Point(pos.x + cursor.width, pos.y - cursor.height)
+    )
+
+
+def subtract_range(
+    start: Point, end: Point, exclude_start: Point, exclude_end: Point
+) -> list[tuple[Point, Point]]:
+    """
+    start ~ end 범위에서 exclude_start ~ exclude_end 범위를 뺀 나머지를
+    겹치지 않는 (start, end) 범위들로 나누어 반환한다. (위, 아래, 왼쪽, 오른쪽 순)
+    """
+    left, right = max(start.x, exclude_start.x), min(end.x, exclude_end.x)
+    top, bottom = min(start.y, exclude_start.y), max(end.y, exclude_end.y)
+
+    if left > right or bottom > top:
+        # 겹치지 않음
+        return [(start, end)]
+
+    result = []
+    if start.y > top:
+        result.append((Point(start.x, start.y), Point(end.x, top + 1)))
+    if end.y < bottom:
+        result.append((Point(start.x, bottom - 1), Point(end.x, end.y)))
+    if start.x < left:
+        result.append((Point(start.x, top), Point(left - 1, bottom)))
+    if end.x > right:
+        result.append((Point(right + 1, top), Point(end.x, bottom)))
+
+    return result
+
+
+def _link(watcher_id: str, watching_id: str):
+    if not watcher_id in CursorHandler.watching:
+        CursorHandler.watching[watcher_id] = set()
+    CursorHandler.watching[watcher_id].add(watching_id)
+
+    if not watching_id in CursorHandler.watchers:
+        CursorHandler.watchers[watching_id] = set()
+    CursorHandler.watchers[watching_id].add(watcher_id)
+
+
+def _unlink(watcher_id: str, watching_id: str):
+    CursorHandler.watching[watcher_id].discard(watching_id)
+    if len(CursorHandler.watching[watcher_id]) == 0:
+        del CursorHandler.watching[watcher_id]
+
+    CursorHandler.watchers[watching_id].discard(watcher_id)
+    if len(CursorHandler.watchers[watching_id]) == 0:
+        del CursorHandler.watchers[watching_id]
@@ -0,0 +1,190 @@
+from typing import Iterator
+from board.data import Point
+from cursor.data import Cursor
+
+
+def cell_key(x: int, y: int) -> int:
+    """
+    셀 좌표 (x, y)를 하나의 정수로 묶는다.
+    """
+    return (y << 32) + x
+
+
+class CursorStore:
+    """
+    conn_id -> Cursor 저장소.
+    커서 위치와 커서 뷰 범위를 CELL_SIZE 크기의 격자 셀로 나누어 인덱싱한다.
+    - 위치 인덱스: 셀 -> 위치가 그 셀에 있는 커서들
+    - 뷰 인덱스: 셀 -> 뷰 범위가 그 셀과 겹치는 커서들
+    커서 위치와 크기는 move(), resize()를 통해서만 바꿔야 인덱스가 유지된다.
+    """
+    # 셀 한 변의 길이. 일반적인 뷰 크기 정도로 잡는다.
+    CELL_SIZE = 32
+
+    def __init__(self, cursors: dict[str, Cursor] = {}):
+        self._cursors: dict[str, Cursor] = {}
+        # 추가된 순서. 범위 검색 결과를 추가된 순서로 돌려주기 위해 사용한다.
+        self._order: dict[str, int] = {}
+        self._count = 0
+        self._cells: dict[int, dict[str, Cursor]] = {}
+        self._view_cells: dict[int, dict[str, Cursor]] = {}
+
+        for conn_id, cursor in cursors.items():
+            self[conn_id] = cursor
+
+    def get(self, conn_id: str) -> Cursor | None:
+        return self._cursors.get(conn_id)
+
+    def values(self):
+        return self._cursors.values()
+
+    def move(self, cursor: Cursor, position: Point):
+        """
+        커서 위치를 position으로 바꾸고 인덱스를 갱신한다.
+        """
+        if cursor.conn_id in self._cursors:
+            self._remove_from_cell(cursor)
+            old_view_keys = self._view_cell_keys(cursor)
+
+            cursor.position = position
+
+            self._add_to_cell(cursor)
+            self._update_view_cells(cursor, old_view_keys)
+            return
+
+        cursor.position = position
+
+    def resize(self, cursor: Cursor, width: int, height: int):
+        """
+        커서 뷰 크기를 바꾸고 인덱스를 갱신한다.
+        """
+        if cursor.conn_id in self._cursors:
+            old_view_keys = self._view_cell_keys(cursor)
+            cursor.set_size(width, height)
+            self._update_view_cells(cursor, old_view_keys)
+            return
+
+        cursor.set_size(width, height)
+
+    def in_range(self, start: Point, end: Point) -> list[Cursor]:
+        """
+        위치가 start ~ end 범위에 들어가는 커서들을 추가된 순서로 반환한다.
+        """
+        return self.in_ranges([(start, end)])
+
+    def in_ranges(self, ranges: list[tuple[Point, Point]]) -> list[Cursor]:
+        """
+        위치가 ranges의 (start, end) 범위 중 하나에 들어가는 커서들을 추가된 순서로 반환한다.
+        ranges는 서로 겹치지 않아야 한다.
+        """
+        result = []
+        for start, end in ranges:
+            x_cells = range(start.x // self.CELL_SIZE, end.x // self.CELL_SIZE + 1)
+            y_cells = range(end.y // self.CELL_SIZE, start.y // self.CELL_SIZE + 1)
+
+            if len(x_cells) * len(y_cells) > len(self._cursors):
+                # 범위가 너무 넓으면 셀을 도는 것보다 전체를 보는 게 빠르다.
+                candidates = self._cursors.values()
+            else:
+                candidates = []
+                for cell_y in y_cells:
+                    for cell_x in x_cells:
+                        cell = self._cells.get(cell_key(cell_x, cell_y))
+                        if cell is not None:
+                            candidates.extend(cell.values())
+
+            for cursor in candidates:
+                pos = cursor.position
+                if start.x <= pos.x <= end.x and end.y <= pos.y <= start.y:
+                    result.append(cursor)
+
+        result.sort(key=lambda c: self._order[c.conn_id])
+        return result
+
+    def viewing(self, p: Point) -> list[Cursor]:
+        """
+        뷰 범위에 p가 포함되는 커서들을 추가된 순서로 반환한다.
+        """
+        cell = self._view_cells.get(self._cell_key_of(p))
+        if cell is None:
+            return []
+
+        result = [cursor for cursor in cell.values() if cursor.check_in_view(p)]
+
+        result.sort(key=lambda c: self._order[c.conn_id])
+        return result
+
+    def __getitem__(self, conn_id: str) -> Cursor:
+        return self._cursors[conn_id]
+
+    def __setitem__(self, conn_id: str, cursor: Cursor):
+        if conn_id in self._cursors:
+            del self[conn_id]
+
+        self._cursors[conn_id] = cursor
+        self._order[conn_id] = self._count
+        self._count += 1
+        self._add_to_cell(cursor)
+        self._add_to_view_cells(cursor, self._view_cell_keys(cursor))
+
+    def __delitem__(self, conn_id: str):
+        cursor = self._cursors.pop(conn_id)
+        del self._order[conn_id]
+        self._remove_from_cell(cursor)
+        self._remove_from_view_cells(cursor, self._view_cell_keys(cursor))
+
+    def __contains__(self, conn_id: str) -> bool:
+        return conn_id in self._cursors
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._cursors)
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+    def _cell_key_of(self, p: Point) -> int:
+        return cell_key(p.x // self.CELL_SIZE, p.y // self.CELL_SIZE)
+
+    def _add_to_cell(self, cursor: Cursor):
+        key = self._cell_key_of(cursor.position)
+        if key not in self._cells:
+            self._cells[key] = {}
+        self._cells[key][cursor.conn_id] = cursor
+
+    def _remove_from_cell(self, cursor: Cursor):
+        key = self._cell_key_of(cursor.position)
+        cell = self._cells[key]
+        del cell[cursor.conn_id]
+        if len(cell) == 0:
+            del self._cells[key]
+
+    def _view_cell_keys(self, cursor: Cursor) -> list[int]:
+        """
+        커서 뷰 범위와 겹치는 셀들의 키
+        """
+        pos = cursor.position
+        x_cells = range((pos.x - cursor.width) // self.CELL_SIZE, (pos.x + cursor.width) // self.CELL_SIZE + 1)
+        y_cells = range((pos.y - cursor.height) // self.CELL_SIZE, (pos.y + cursor.height) // self.CELL_SIZE + 1)
+
+        return [cell_key(cell_x, cell_y) for cell_y in y_cells for cell_x in x_cells]
+
+    def _update_view_cells(self, cursor: Cursor, old_keys: list[int]):
+        new_keys = self._view_cell_keys(cursor)
+        if new_keys == old_keys:
+            return
+
+        self._remove_from_view_cells(cursor, old_keys)
+        self._add_to_view_cells(cursor, new_keys)
+
+    def _add_to_view_cells(self, cursor: Cursor, keys: list[int]):
+        for key in keys:
+            if key not in self._view_cells:
+                self._view_cells[key] = {}
+            self._view_cells[key][cursor.conn_id] = cursor
+
+    def _remove_from_view_cells(self, cursor: Cursor, keys: list[int]):
+        for key in keys:
+            cell = self._view_cells[key]
+            del cell[cursor.conn_id]
+            if len(cell) == 0:
+                del self._view_cells[key]
@@ -1 +1,2 @@
 from .cursor_handler_test import CursorHandlerTestCase
+from .cursor_store_test import CursorStoreTestCase
@@ -1,19 +1,22 @@
 from cursor.data import Cursor, Color
 from cursor.data.handler import (
     CursorHandler,
+    CursorStore,
     NoMatchingCursorException,
     AlreadyWatchingException,
     NotWatchableException,
     NotWatchingException
 )
+from cursor.data.handler.internal.cursor_handler import subtract_range
 from board.data import Point
+import random
 import unittest
 
 
 class CursorHandlerTestCase(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         # /docs/example/cursor-location.png
-        CursorHandler.cursor_dict = {
+        CursorHandler.cursor_dict = CursorStore({
             "A": Cursor(
                 conn_id="A",
                 position=Point(-3, 3),
@@ -41,10 +44,10 @@ class CursorHandlerTestCase(unittest.IsolatedAsyncioTestCase):
                 color=Color.BLUE,
                 revive_at=None
             )
-        }
+        })
 
     def tearDown(self):
-        CursorHandler.cursor_dict = {}
+        CursorHandler.cursor_dict = CursorStore()
         CursorHandler.watchers = {}
         CursorHandler.watching = {}
 
@@ -105,6 +108,88 @@ class CursorHandlerTestCase(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(result), 1)
         self.assertIn("C", result)
 
+    def test_move_cursor(self):
+        cursor = CursorHandler.cursor_dict["A"]
+        CursorHandler.move_cursor(cursor, Point(2, -2))
+
+        self.assertEqual(cursor.position, Point(2, -2))
+
+        result = CursorHandler.exists_range(start=Point(1, -1), end=Point(3, -3))
+        result = [c.conn_id for c in result]
+
+        self.assertEqual(result, ["A", "C"])
+
+    def test_subtract_range(self):
+        # 한 칸 오른쪽으로 이동한 뷰
+        ranges = subtract_range(Point(-2, 2), Point(2, -2), Point(-3, 2), Point(1, -2))
+        self.assertEqual(ranges, [(Point(2, 2), Point(2, -2))])
+
+        # 대각선 이동
+        ranges = subtract_range(Point(-1, 1), Point(1, -1), Point(0, 0), Point(2, -2))
+        self.assertEqual(ranges, [
+            (Point(-1, 1), Point(1, 1)),
+            (Point(-1, 0), Point(-1, -1))
+        ])
+
+        # 겹치지 않음
+        ranges = subtract_range(Point(0, 0), Point(1, -1), Point(5, 5), Point(6, 4))
+        self.assertEqual(ranges, [(Point(0, 0), Point(1, -1))])
+
+        # 완전히 포함됨
+        ranges = subtract_range(Point(0, 0), Point(1, -1), Point(-5, 5), Point(6, -4))
+        self.assertEqual(ranges, [])
+
+    def test_apply_move(self):
+        a = CursorHandler.cursor_dict["A"]
+        b = CursorHandler.cursor_dict["B"]
+        c = CursorHandler.cursor_dict["C"]
+        CursorHandler.add_watcher(watcher=b, watching=a)
+        CursorHandler.add_watcher(watcher=b, watching=c)
+        CursorHandler.add_watcher(watcher=a, watching=c)
+
+        # C를 A 뷰 밖, B 뷰 안으로
+        delta = CursorHandler.apply_move(c, Point(4, -1))
+
+        self.assertEqual(c.position, Point(4, -1))
+        self.assertEqual(set(delta.original_watchers), {"A", "B"})
+        self.assertEqual(delta.new_watchings, [])
+        self.assertEqual(delta.new_watchers, [])
+        self.assertEqual(CursorHandler.get_watchers("C"), {"B"})
+        self.assertEqual(CursorHandler.get_watching("A"), set())
+
+        # C를 다시 A 뷰 안으로
+        delta = CursorHandler.apply_move(c, Point(3, -1))
+
+        self.assertEqual([cur.conn_id for cur in delta.new_watchers], ["A"])
+        self.assertEqual(CursorHandler.get_watchers("C"), {"A", "B"})
+
+    def test_apply_move_matches_full_scan(self):
+        rand = random.Random(0)
+
+        CursorHandler.cursor_dict = CursorStore()
+        for i in range(30):
+            cursor = CursorHandler.create_cursor(str(i))
+            CursorHandler.move_cursor(cursor, Point(rand.randint(-20, 20), rand.randint(-20, 20)))
+            CursorHandler.set_cursor_size(cursor, rand.randint(1, 8), rand.randint(1, 8))
+
+        cursors = list(CursorHandler.cursor_dict.values())
+        for watcher in cursors:
+            for watching in cursors:
+                if watcher is not watching and watcher.check_in_view(watching.position):
+                    CursorHandler.add_watcher(watcher=watcher, watching=watching)
+
+        for _ in range(200):
+            cursor = rand.choice(cursors)
+            pos = cursor.position
+            CursorHandler.apply_move(cursor, Point(pos.x + rand.randint(-1, 1), pos.y + rand.randint(-1, 1)))
+
+        for watcher in cursors:
+            expected = {
+                watching.conn_id for watching in cursors
+                if watcher is not watching and watcher.check_in_view(watching.position)
+            }
+            self.assertEqual(set(CursorHandler.get_watching(watcher.conn_id)), expected)
+
     def test_view_includes(self):
         result = CursorHandler.view_includes(p=Point(-3, 0))
 
@@ -161,8 +246,8 @@ class CursorHandlerTestCase(unittest.IsolatedAsyncioTestCase):
             )
 
     def test_remove_watcher(self):
-        CursorHandler.watchers["A"] = ["B"]
-        CursorHandler.watching["B"] = ["A", None]
+        CursorHandler.watchers["A"] = {"B"}
+        CursorHandler.watching["B"] = {"A", None}
 
         CursorHandler.remove_watcher(
             watcher=CursorHandler.cursor_dict["B"],
@@ -196,10 +281,34 @@ class CursorHandlerTestCase(unittest.IsolatedAsyncioTestCase):
         b_watchers = CursorHandler.get_watchers("B")
 
         self.assertEqual(len(a_watchers), 1)
-        self.assertEqual(a_watchers[0], "B")
+        self.assertIn("B", a_watchers)
 
         self.assertEqual(len(b_watchers), 0)
 
+    def test_update_watchers(self):
+        CursorHandler.add_watcher(
+            watcher=CursorHandler.cursor_dict["B"],
+            watching=CursorHandler.cursor_dict["A"]
+        )
+
+        CursorHandler.update_watchers(
+            added=[("B", "C"), ("A", "C")],
+            removed=[("B", "A")]
+        )
+
+        self.assertEqual(CursorHandler.get_watchers("C"), {"A", "B"})
+        self.assertEqual(CursorHandler.get_watching("B"), {"C"})
+        self.assertEqual(len(CursorHandler.get_watchers("A")), 0)
+        self.assertNotIn("A", CursorHandler.watchers)
+
+    def test_update_watchers_invalid(self):
+        with self.assertRaises(NotWatchingException):
+            CursorHandler.update_watchers(removed=[("B", "A")])
+
+        CursorHandler.update_watchers(added=[("B", "A")])
+        with self.assertRaises(AlreadyWatchingException):
+            CursorHandler.update_watchers(added=[("B", "A")])
+
     def test_get_watchers_no_matching_cursor(self):
         with self.assertRaises(NoMatchingCursorException):
             CursorHandler.get_watchers("D")
@@ -213,7 +322,7 @@ class CursorHandlerTestCase(unittest.IsolatedAsyncioTestCase):
         a_watching = CursorHandler.get_watching("A")
         b_watching = CursorHandler.get_watching("B")
 
-        self.assertEqual(b_watching[0], "A")
+        self.assertIn("A", b_watching)
         self.assertEqual(len(b_watching), 1)
 
         self.assertEqual(len(a_watching), 0)
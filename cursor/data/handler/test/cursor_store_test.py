@@ -0,0 +1,100 @@
+import unittest
+from board.data import Point
+from cursor.data import Cursor, Color
+from cursor.data.handler import CursorStore
+
+
+def create_cursor(conn_id: str, position: Point) -> Cursor:
+    return Cursor(
+        conn_id=conn_id,
+        position=position,
+        pointer=None,
+        color=Color.BLUE,
+        width=1,
+        height=1,
+        revive_at=None
+    )
+
+
+class CursorStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.store = CursorStore({
+            "A": create_cursor("A", Point(-3, 3)),
+            "B": create_cursor("B", Point(100, -100)),
+            "C": create_cursor("C", Point(CursorStore.CELL_SIZE, 0)),
+        })
+
+    def test_dict_interface(self):
+        self.assertEqual(len(self.store), 3)
+        self.assertIn("A", self.store)
+        self.assertNotIn("D", self.store)
+        self.assertEqual(list(self.store), ["A", "B", "C"])
+        self.assertEqual(self.store["B"].conn_id, "B")
+        self.assertIsNone(self.store.get("D"))
+
+        del self.store["B"]
+        self.assertNotIn("B", self.store)
+        self.assertEqual([c.conn_id for c in self.store.in_range(Point(99, -99), Point(101, -101))], [])
+
+    def test_in_range(self):
+        result = self.store.in_range(Point(-10, 10), Point(CursorStore.CELL_SIZE, -10))
+        self.assertEqual([c.conn_id for c in result], ["A", "C"])
+
+        # 경계 포함
+        result = self.store.in_range(Point(-3, 3), Point(-3, 3))
+        self.assertEqual([c.conn_id for c in result], ["A"])
+
+        result = self.store.in_range(Point(-2, 3), Point(10, -10))
+        self.assertEqual(result, [])
+
+    def test_in_range_wide(self):
+        # 셀 개수가 커서 수보다 많은 범위
+        result = self.store.in_range(Point(-1000, 1000), Point(1000, -1000))
+        self.assertEqual([c.conn_id for c in result], ["A", "B", "C"])
+
+    def test_move(self):
+        cursor = self.store["A"]
+        self.store.move(cursor, Point(100, -101))
+
+        self.assertEqual(cursor.position, Point(100, -101))
+        self.assertEqual(self.store.in_range(Point(-10, 10), Point(10, -10)), [])
+
+        result = self.store.in_range(Point(99, -99), Point(101, -101))
+        # 추가된 순서 유지
+        self.assertEqual([c.conn_id for c in result], ["A", "B"])
+
+    def test_viewing(self):
+        # A 뷰: (-4, 4) ~ (-2, 2)
+        self.assertEqual([c.conn_id for c in self.store.viewing(Point(-2, 2))], ["A"])
+        self.assertEqual(self.store.viewing(Point(-1, 2)), [])
+
+        # C 뷰는 셀 경계에 걸쳐 있음
+        result = self.store.viewing(Point(CursorStore.CELL_SIZE - 1, -1))
+        self.assertEqual([c.conn_id for c in result], ["C"])
+
+        del self.store["C"]
+        self.assertEqual(self.store.viewing(Point(CursorStore.CELL_SIZE - 1, -1)), [])
+
+    def test_viewing_after_move(self):
+        cursor = self.store["A"]
+        self.store.move(cursor, Point(101, -100))
+
+        self.assertEqual(self.store.viewing(Point(-3, 3)), [])
+        result = self.store.viewing(Point(100, -101))
+        self.assertEqual([c.conn_id for c in result], ["A", "B"])
+
+    def test_viewing_after_resize(self):
+        cursor = self.store["A"]
+        far = Point(-3 + CursorStore.CELL_SIZE * 2, 3)
+        self.assertEqual(self.store.viewing(far), [])
+
+        self.store.resize(cursor, CursorStore.CELL_SIZE * 2, 1)
+        self.assertEqual(cursor.width, CursorStore.CELL_SIZE * 2)
+        self.assertEqual([c.conn_id for c in self.store.viewing(far)], ["A"])
+
+        self.store.resize(cursor, 1, 1)
+        self.assertEqual(self.store.viewing(far), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1 +1,2 @@
 from .internal.cursor_event_handler import CursorEventHandler
+from .internal.cursor_tick import CursorTick
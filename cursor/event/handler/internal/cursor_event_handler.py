@@ -31,6 +31,7 @@ from message.payload import (
     ErrorEvent,
     ErrorPayload
 )
+from .cursor_tick import CursorTick
 
 
 class CursorEventHandler:
@@ -38,7 +39,7 @@ class CursorEventHandler:
     @staticmethod
     async def receive_new_conn(message: Message[NewConnPayload]):
         cursor = CursorHandler.create_cursor(message.payload.conn_id)
-        cursor.set_size(message.payload.width, message.payload.height)
+        CursorHandler.set_cursor_size(cursor, message.payload.width, message.payload.height)
 
         publish_coroutines = []
 
@@ -129,7 +130,10 @@ class CursorEventHandler:
             )
         )
 
-        await EventBroker.publish(message)
+        # 같은 프로세스에 보드가 있으면 바로 응답을 받는다.
+        result = await EventBroker.request(message)
+        if result is not None:
+            await EventBroker.publish(result)
 
     @EventBroker.add_receiver(PointEvent.POINTING_RESULT)
     @staticmethod
@@ -147,11 +151,17 @@ class CursorEventHandler:
             return
 
         watchers = CursorHandler.get_watchers(cursor.conn_id)
+        target_conns = [cursor.conn_id, *watchers]
+
+        if CursorTick.enabled():
+            # watcher들에게는 다음 틱에 전달
+            CursorTick.add_pointer(cursor, watchers)
+            target_conns = [cursor.conn_id]
 
         message = Message(
             event="multicast",
             header={
-                "target_conns": [cursor.conn_id] + watchers,
+                "target_conns": target_conns,
                 "origin_event": PointEvent.POINTER_SET
             },
             payload=PointerSetPayload(
@@ -202,7 +212,10 @@ class CursorEventHandler:
             )
         )
 
-        await EventBroker.publish(message)
+        # 같은 프로세스에 보드가 있으면 바로 응답을 받는다.
+        result = await EventBroker.request(message)
+        if result is not None:
+            await EventBroker.publish(result)
 
     @EventBroker.add_receiver(MoveEvent.MOVABLE_RESULT)
     @staticmethod
@@ -225,53 +238,28 @@ class CursorEventHandler:
         new_position = message.payload.position
         original_position = cursor.position
 
-        cursor.position = new_position
-
-        # TODO: 새로운 방식으로 커서들 찾기. 최적화하기.
-
-        # 새로운 뷰의 커서들 찾기
-        top_left = Point(cursor.position.x - cursor.width, cursor.position.y + cursor.height)
-        bottom_right = Point(cursor.position.x + cursor.width, cursor.position.y - cursor.height)
-        cursors_in_view = CursorHandler.exists_range(start=top_left, end=bottom_right, exclude_ids=[cursor.conn_id])
-
-        original_watching_ids = CursorHandler.get_watching(cursor_id=cursor.conn_id)
-        original_watchings = [CursorHandler.get_cursor(id) for id in original_watching_ids]
-
-        if len(original_watchings) > 0:
-            # 범위 벗어난 커서들 연관관계 해제
-            for watching in original_watchings:
-                in_view = cursor.check_in_view(watching.position)
-                if not in_view:
-                    CursorHandler.remove_watcher(watcher=cursor, watching=other_cursor)
+        delta = CursorHandler.apply_move(cursor, new_position)
 
         publish_coroutines = []
 
-        new_watchings = list(filter(lambda c: c.conn_id not in original_watching_ids, cursors_in_view))
-        if len(new_watchings) > 0:
-            # 새로운 watching 커서들 연관관계 설정
-            for other_cursor in new_watchings:
-                CursorHandler.add_watcher(watcher=cursor, watching=other_cursor)
-
+        if len(delta.new_watchings) > 0:
             # 새로운 커서들 전달
             publish_coroutines.append(
                 publish_new_cursors_event(
                     target_cursors=[cursor],
-                    cursors=new_watchings
+                    cursors=delta.new_watchings
                 )
             )
 
-        # 새로운 위치를 바라보고 있는 커서들 찾기, 본인 제외
-        watchers_new_pos = CursorHandler.view_includes(p=new_position, exclude_ids=[cursor.conn_id])
-
-        original_watcher_ids = CursorHandler.get_watchers(cursor_id=cursor.conn_id)
-        original_watchers = [CursorHandler.get_cursor(id) for id in original_watcher_ids]
-
-        if len(original_watchers) > 0:
+        if CursorTick.enabled():
+            # moved 이벤트는 다음 틱에 전달
+            CursorTick.add_move(cursor, original_position, delta.original_watchers)
+        elif len(delta.original_watchers) > 0:
             # moved 이벤트 전달
             message = Message(
                 event="multicast",
                 header={
-                    "target_conns": original_watcher_ids,
+                    "target_conns": delta.original_watchers,
                     "origin_event": MoveEvent.MOVED,
                 },
                 payload=MovedPayload(
@@ -283,22 +271,11 @@ class CursorEventHandler:
 
             publish_coroutines.append(EventBroker.publish(message))
 
-            # 범위 벗어나면 watcher 제거
-            for watcher in original_watchers:
-                in_view = watcher.check_in_view(cursor.position)
-                if not in_view:
-                    CursorHandler.remove_watcher(watcher=watcher, watching=cursor)
-
-        new_watchers = list(filter(lambda c: c.conn_id not in original_watcher_ids, watchers_new_pos))
-        if len(new_watchers) > 0:
-            # 새로운 watcher 커서들 연관관계 설정
-            for other_cursor in new_watchers:
-                CursorHandler.add_watcher(watcher=other_cursor, watching=cursor)
-
+        if len(delta.new_watchers) > 0:
             # 새로운 커서들에게 본인 커서 전달
             publish_coroutines.append(
                 publish_new_cursors_event(
-                    target_cursors=new_watchers,
+                    target_cursors=delta.new_watchers,
                     cursors=[cursor]
                 )
             )
@@ -319,18 +296,16 @@ class CursorEventHandler:
         publish_coroutines = []
 
         # 변경된 타일을 보고있는 커서들에게 전달
-        view_cursors = CursorHandler.view_includes(p=position)
-        if len(view_cursors) > 0:
-            pub_message = Message(
-                event="multicast",
-                header={"target_conns": [c.conn_id for c in view_cursors],
-                        "origin_event": InteractionEvent.TILE_UPDATED},
-                payload=TileUpdatedPayload(
-                    position=position,
-                    tile=pub_tile
-                )
+        pub_message = Message(
+            event="areacast",
+            header={"position": position,
+                    "origin_event": InteractionEvent.TILE_UPDATED},
+            payload=TileUpdatedPayload(
+                position=position,
+                tile=pub_tile
             )
-            publish_coroutines.append(EventBroker.publish(pub_message))
+        )
+        publish_coroutines.append(EventBroker.publish(pub_message))
 
         if not (tile.is_open and tile.is_mine):
             await asyncio.gather(*publish_coroutines)
@@ -366,18 +341,16 @@ class CursorEventHandler:
 
         cursor = CursorHandler.get_cursor(sender)
 
-        watching = CursorHandler.get_watching(cursor_id=cursor.conn_id)
-        watchers = CursorHandler.get_watchers(cursor_id=cursor.conn_id)
+        watching = list(CursorHandler.get_watching(cursor_id=cursor.conn_id))
+        watchers = list(CursorHandler.get_watchers(cursor_id=cursor.conn_id))
 
-        for id in watching:
-            other_cursor = CursorHandler.get_cursor(id)
-            CursorHandler.remove_watcher(watcher=cursor, watching=other_cursor)
-
-        for id in watchers:
-            other_cursor = CursorHandler.get_cursor(id)
-            CursorHandler.remove_watcher(watcher=other_cursor, watching=cursor)
+        CursorHandler.update_watchers(removed=[
+            *[(cursor.conn_id, id) for id in watching],
+            *[(id, cursor.conn_id) for id in watchers]
+        ])
 
         CursorHandler.remove_cursor(cursor.conn_id)
+        CursorTick.discard(cursor.conn_id)
 
         message = Message(
             event="multicast",
@@ -403,10 +376,10 @@ class CursorEventHandler:
             # 변동 없음
             return
 
-        cur_watching = CursorHandler.get_watching(cursor_id=cursor.conn_id)
+        cur_watching = list(CursorHandler.get_watching(cursor_id=cursor.conn_id))
 
         old_width, old_height = cursor.width, cursor.height
-        cursor.set_size(new_width, new_height)
+        CursorHandler.set_cursor_size(cursor, new_width, new_height)
 
         size_grown = (new_width > old_width) or (new_height > old_height)
 
@@ -0,0 +1,138 @@
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from board.data import Point
+from cursor.data import Cursor
+from cursor.data.handler import CursorHandler
+from event import EventBroker
+from message import Message
+from message.payload import CursorDeltaEvent, CursorDeltaPayload, CursorsDeltaPayload
+
+
+@dataclass
+class PendingDelta:
+    # 틱 시작 시점의 위치
+    origin_position: Point
+    # 변경 사항을 받을 커서 id들
+    targets: set[str] = field(default_factory=set)
+
+
+class CursorTick:
+    """
+    커서 위치, 포인터 변경을 틱 동안 모았다가
+    watcher마다 한 틱에 하나의 cursors-delta 메시지로 전달한다.
+    interval이 0이면 사용하지 않고, 변경 사항을 바로 전달한다.
+    """
+    interval: float = 0
+
+    # cursor id -> 이번 틱에 쌓인 변경 사항
+    pending: dict[str, PendingDelta] = {}
+
+    _task: asyncio.Task | None = None
+
+    @staticmethod
+    def enabled() -> bool:
+        return CursorTick.interval > 0
+
+    @staticmethod
+    def add_move(cursor: Cursor, origin_position: Point, watchers: Iterable[str]):
+        """
+        이동 전 위치와, 이동 전 watcher들을 기록한다.
+        """
+        CursorTick._get_pending(cursor, origin_position).targets.update(watchers)
+
+    @staticmethod
+    def add_pointer(cursor: Cursor, watchers: Iterable[str]):
+        CursorTick._get_pending(cursor, cursor.position).targets.update(watchers)
+
+    @staticmethod
+    def discard(cursor_id: str):
+        CursorTick.pending.pop(cursor_id, None)
+
+    @staticmethod
+    async def flush():
+        """
+        쌓인 변경 사항들을 watcher별로 모아 발행한다.
+        같은 변경 사항들을 받는 watcher들은 하나의 메시지로 묶는다.
+        """
+        pending, CursorTick.pending = CursorTick.pending, {}
+
+        # watcher id -> 변경된 커서 id들
+        changes: dict[str, list[str]] = {}
+        for cursor_id, delta in pending.items():
+            for target in delta.targets:
+                if not CursorHandler.check_cursor_exists(target):
+                    continue
+                if target not in changes:
+                    changes[target] = []
+                changes[target].append(cursor_id)
+
+        # 변경된 커서 id들 -> watcher id들
+        groups: dict[tuple[str, ...], list[str]] = {}
+        for target, cursor_ids in changes.items():
+            key = tuple(cursor_ids)
+            if key not in groups:
+                groups[key] = []
+            groups[key].append(target)
+
+        coroutines = []
+        for cursor_ids, targets in groups.items():
+            cursors = []
+            for cursor_id in cursor_ids:
+                cursor = CursorHandler.get_cursor(cursor_id)
+                cursors.append(CursorDeltaPayload(
+                    origin_position=pending[cursor_id].origin_position,
+                    new_position=cursor.position,
+                    pointer=cursor.pointer,
+                    color=cursor.color
+                ))
+
+            message = Message(
+                event="multicast",
+                header={
+                    "target_conns": targets,
+                    "origin_event": CursorDeltaEvent.CURSORS_DELTA
+                },
+                payload=CursorsDeltaPayload(cursors=cursors)
+            )
+            coroutines.append(EventBroker.publish(message))
+
+        await asyncio.gather(*coroutines)
+
+    @staticmethod
+    def start(rate: float):
+        """
+        초당 rate번 flush하는 틱을 시작한다.
+        """
+        CursorTick.interval = 1 / rate
+        CursorTick._task = asyncio.create_task(CursorTick._run())
+
+    @staticmethod
+    async def stop():
+        CursorTick.interval = 0
+
+        if CursorTick._task is not None:
+            CursorTick._task.cancel()
+            CursorTick._task = None
+
+        await CursorTick.flush()
+
+    @staticmethod
+    async def _run():
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+
+        while True:
+            next_tick += CursorTick.interval
+            await asyncio.sleep(max(0, next_tick - loop.time()))
+
+            try:
+                await CursorTick.flush()
+            except Exception as e:
+                print(f"Unhandled error while flushing cursor deltas: {type(e)}: '{e}'")
+
+    @staticmethod
+    def _get_pending(cursor: Cursor, origin_position: Point) -> PendingDelta:
+        if cursor.conn_id not in CursorTick.pending:
+            CursorTick.pending[cursor.conn_id] = PendingDelta(origin_position=origin_position)
+        return CursorTick.pending[cursor.conn_id]
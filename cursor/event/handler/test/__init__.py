@@ -6,3 +6,4 @@ from .cursor_event_handler_test import (
     CursorEventHandler_ConnClosed_TestCase,
     CursorEventHandler_SetViewSize_TestCase
 )
+from .cursor_tick_test import CursorTickTestCase
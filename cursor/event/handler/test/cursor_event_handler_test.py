@@ -1,6 +1,6 @@
 import asyncio
 from cursor.data import Cursor, Color
-from cursor.data.handler import CursorHandler
+from cursor.data.handler import CursorHandler, CursorStore
 from cursor.event.handler import CursorEventHandler
 from message import Message
 from message.payload import (
@@ -58,7 +58,7 @@ Test
 
 class CursorEventHandler_NewConnReceiver_TestCase(unittest.IsolatedAsyncioTestCase):
     def tearDown(self):
-        CursorHandler.cursor_dict = {}
+        CursorHandler.cursor_dict = CursorStore()
         CursorHandler.watchers = {}
         CursorHandler.watching = {}
 
@@ -104,7 +104,7 @@ class CursorEventHandler_NewConnReceiver_TestCase(unittest.IsolatedAsyncioTestCa
         """
 
         # 초기 커서 셋팅
-        CursorHandler.cursor_dict = {}
+        CursorHandler.cursor_dict = CursorStore()
 
         # 생성될 커서 값
         expected_conn_id = "example"
@@ -178,7 +178,7 @@ class CursorEventHandler_NewConnReceiver_TestCase(unittest.IsolatedAsyncioTestCa
     async def test_receive_new_conn_with_cursors(self, mock: AsyncMock):
         # /docs/example/cursor-location.png
         # But B is at 0,0
-        CursorHandler.cursor_dict = {
+        CursorHandler.cursor_dict = CursorStore({
             "A": Cursor(
                 conn_id="A",
                 position=Point(-3, 3),
@@ -199,7 +199,7 @@ class CursorEventHandler_NewConnReceiver_TestCase(unittest.IsolatedAsyncioTestCa
                 color=Color.BLUE,
                 revive_at=None
             )
-        }
+        })
 
         original_cursors_len = 2
         original_cursors = [c.conn_id for c in list(CursorHandler.cursor_dict.values())]
@@ -290,11 +290,11 @@ class CursorEventHandler_PointingReceiver_TestCase(unittest.IsolatedAsyncioTestC
         self.cur_c = curs[2]
 
     def tearDown(self):
-        CursorHandler.cursor_dict = {}
+        CursorHandler.cursor_dict = CursorStore()
         CursorHandler.watchers = {}
         CursorHandler.watching = {}
 
-    @patch("event.EventBroker.publish")
+    @patch("event.EventBroker.request", return_value=None)
     async def test_receive_pointing(self, mock: AsyncMock):
         click_type = ClickType.GENERAL_CLICK
         pointer = Point(0, 0)
@@ -310,7 +310,7 @@ class CursorEventHandler_PointingReceiver_TestCase(unittest.IsolatedAsyncioTestC
 
         await CursorEventHandler.receive_pointing(message)
 
-        # try-pointing 발행하는지 확인
+        # try-pointing 요청하는지 확인
         mock.assert_called_once()
         got = mock.mock_calls[0].args[0]
         self.assertEqual(type(got), Message)
@@ -528,11 +528,11 @@ class CursorEventHandler_MovingReceiver_TestCase(unittest.IsolatedAsyncioTestCas
         self.cur_c = curs[2]
 
     def tearDown(self):
-        CursorHandler.cursor_dict = {}
+        CursorHandler.cursor_dict = CursorStore()
         CursorHandler.watchers = {}
         CursorHandler.watching = {}
 
-    @patch("event.EventBroker.publish")
+    @patch("event.EventBroker.request", return_value=None)
     async def test_receive_moving(self, mock: AsyncMock):
         message = Message(
             event=MoveEvent.MOVING,
@@ -548,7 +548,7 @@ class CursorEventHandler_MovingReceiver_TestCase(unittest.IsolatedAsyncioTestCas
 
         await CursorEventHandler.receive_moving(message)
 
-        # check-movable 이벤트 발행 확인
+        # check-movable 요청 확인
         mock.assert_called_once()
         got = mock.mock_calls[0].args[0]
         self.assertEqual(type(got), Message)
@@ -849,7 +849,7 @@ class CursorEventHandler_TileStateChanged_TestCase(unittest.IsolatedAsyncioTestC
         self.cur_c = curs[2]
 
     def tearDown(self):
-        CursorHandler.cursor_dict = {}
+        CursorHandler.cursor_dict = CursorStore()
         CursorHandler.watchers = {}
         CursorHandler.watching = {}
 
@@ -874,15 +874,13 @@ class CursorEventHandler_TileStateChanged_TestCase(unittest.IsolatedAsyncioTestC
         # tile-updated
         got: Message[TileUpdatedPayload] = mock.mock_calls[0].args[0]
         self.assertEqual(type(got), Message)
-        self.assertEqual(got.event, "multicast")
+        self.assertEqual(got.event, "areacast")
         # origin_event
         self.assertIn("origin_event", got.header)
         self.assertEqual(got.header["origin_event"], InteractionEvent.TILE_UPDATED)
-        # target_conns 확인, [A, B]
-        self.assertIn("target_conns", got.header)
-        self.assertEqual(len(got.header["target_conns"]), 2)
-        self.assertIn("A", got.header["target_conns"])
-        self.assertIn("B", got.header["target_conns"])
+        # position 확인
+        self.assertIn("position", got.header)
+        self.assertEqual(got.header["position"], position)
         # payload 확인
         self.assertEqual(type(got.payload), TileUpdatedPayload)
         self.assertEqual(got.payload.position, position)
@@ -909,15 +907,13 @@ class CursorEventHandler_TileStateChanged_TestCase(unittest.IsolatedAsyncioTestC
         # tile-updated
         got: Message[TileUpdatedPayload] = mock.mock_calls[0].args[0]
         self.assertEqual(type(got), Message)
-        self.assertEqual(got.event, "multicast")
+        self.assertEqual(got.event, "areacast")
         # origin_event
         self.assertIn("origin_event", got.header)
         self.assertEqual(got.header["origin_event"], InteractionEvent.TILE_UPDATED)
-        # target_conns 확인, [A, B]
-        self.assertIn("target_conns", got.header)
-        self.assertEqual(len(got.header["target_conns"]), 2)
-        self.assertIn("A", got.header["target_conns"])
-        self.assertIn("B", got.header["target_conns"])
+        # position 확인
+        self.assertIn("position", got.header)
+        self.assertEqual(got.header["position"], position)
         # payload 확인
         self.assertEqual(type(got.payload), TileUpdatedPayload)
         self.assertEqual(got.payload.position, position)
@@ -953,7 +949,7 @@ class CursorEventHandler_ConnClosed_TestCase(unittest.IsolatedAsyncioTestCase):
         self.cur_c = curs[2]
 
     def tearDown(self):
-        CursorHandler.cursor_dict = {}
+        CursorHandler.cursor_dict = CursorStore()
         CursorHandler.watchers = {}
         CursorHandler.watching = {}
 
@@ -1007,7 +1003,7 @@ class CursorEventHandler_SetViewSize_TestCase(unittest.IsolatedAsyncioTestCase):
         self.cur_c = curs[2]
 
     def tearDown(self):
-        CursorHandler.cursor_dict = {}
+        CursorHandler.cursor_dict = CursorStore()
         CursorHandler.watchers = {}
         CursorHandler.watching = {}
 
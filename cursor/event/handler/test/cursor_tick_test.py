@@ -0,0 +1,148 @@
+import unittest
+from unittest.mock import AsyncMock, patch
+from cursor.data.handler import CursorHandler, CursorStore
+from cursor.event.handler import CursorEventHandler, CursorTick
+from message import Message
+from message.payload import (
+    MoveEvent,
+    MovableResultPayload,
+    PointEvent,
+    PointingResultPayload,
+    PointerSetPayload,
+    CursorDeltaEvent,
+    CursorsDeltaPayload,
+    ConnClosedPayload,
+    NewConnEvent
+)
+from board.data import Point
+from .fixtures import setup_cursor_locations
+
+
+class CursorTickTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        curs = setup_cursor_locations()
+        self.cur_a = curs[0]
+        self.cur_b = curs[1]
+        self.cur_c = curs[2]
+
+        CursorTick.interval = 0.05
+        CursorTick.pending = {}
+
+    def tearDown(self):
+        CursorHandler.cursor_dict = CursorStore()
+        CursorHandler.watchers = {}
+        CursorHandler.watching = {}
+
+        CursorTick.interval = 0
+        CursorTick.pending = {}
+
+    async def move_c(self):
+        await CursorEventHandler.receive_movable_result(Message(
+            event=MoveEvent.MOVABLE_RESULT,
+            header={"receiver": "C"},
+            payload=MovableResultPayload(position=Point(2, -2), movable=True)
+        ))
+
+    async def point_a(self):
+        await CursorEventHandler.receive_pointing_result(Message(
+            event=PointEvent.POINTING_RESULT,
+            header={"receiver": "A"},
+            payload=PointingResultPayload(pointer=Point(-3, 4), pointable=True)
+        ))
+
+    @patch("event.EventBroker.publish")
+    async def test_batched_until_flush(self, mock: AsyncMock):
+        await self.move_c()
+
+        # moved 이벤트는 바로 발행하지 않음
+        mock.assert_not_called()
+
+        await self.point_a()
+
+        # pointer-set은 본인에게만 바로 발행
+        self.assertEqual(len(mock.mock_calls), 1)
+        got: Message[PointerSetPayload] = mock.mock_calls[0].args[0]
+        self.assertEqual(got.header["origin_event"], PointEvent.POINTER_SET)
+        self.assertEqual(got.header["target_conns"], ["A"])
+
+        mock.reset_mock()
+        await CursorTick.flush()
+
+        # A: [C], B: [C, A]
+        self.assertEqual(len(mock.mock_calls), 2)
+
+        messages = {}
+        for call in mock.mock_calls:
+            got: Message[CursorsDeltaPayload] = call.args[0]
+            self.assertEqual(got.event, "multicast")
+            self.assertEqual(got.header["origin_event"], CursorDeltaEvent.CURSORS_DELTA)
+            self.assertEqual(len(got.header["target_conns"]), 1)
+            messages[got.header["target_conns"][0]] = got.payload
+
+        a_payload = messages["A"]
+        self.assertEqual(len(a_payload.cursors), 1)
+        self.assertEqual(a_payload.cursors[0].origin_position, Point(2, -1))
+        self.assertEqual(a_payload.cursors[0].new_position, Point(2, -2))
+        self.assertEqual(a_payload.cursors[0].color, self.cur_c.color)
+
+        b_payload = messages["B"]
+        self.assertEqual(len(b_payload.cursors), 2)
+        self.assertEqual(b_payload.cursors[1].origin_position, Point(-3, 3))
+        self.assertEqual(b_payload.cursors[1].new_position, Point(-3, 3))
+        self.assertEqual(b_payload.cursors[1].pointer, Point(-3, 4))
+        self.assertEqual(b_payload.cursors[1].color, self.cur_a.color)
+
+        # 비워짐
+        mock.reset_mock()
+        await CursorTick.flush()
+        mock.assert_not_called()
+
+    @patch("event.EventBroker.publish")
+    async def test_moves_collapsed(self, mock: AsyncMock):
+        await self.move_c()
+        await CursorEventHandler.receive_movable_result(Message(
+            event=MoveEvent.MOVABLE_RESULT,
+            header={"receiver": "C"},
+            payload=MovableResultPayload(position=Point(2, -3), movable=True)
+        ))
+
+        await CursorTick.flush()
+
+        # A, B 모두 [C] 이므로 하나의 메시지
+        self.assertEqual(len(mock.mock_calls), 1)
+        got: Message[CursorsDeltaPayload] = mock.mock_calls[0].args[0]
+        self.assertEqual(set(got.header["target_conns"]), {"A", "B"})
+        self.assertEqual(len(got.payload.cursors), 1)
+        self.assertEqual(got.payload.cursors[0].origin_position, Point(2, -1))
+        self.assertEqual(got.payload.cursors[0].new_position, Point(2, -3))
+
+    @patch("event.EventBroker.publish")
+    async def test_conn_closed(self, mock: AsyncMock):
+        await self.move_c()
+
+        await CursorEventHandler.receive_conn_closed(Message(
+            event=NewConnEvent.CONN_CLOSED,
+            header={"sender": "C"},
+            payload=ConnClosedPayload()
+        ))
+        self.assertNotIn("C", CursorTick.pending)
+
+        mock.reset_mock()
+        await CursorTick.flush()
+        mock.assert_not_called()
+
+    @patch("event.EventBroker.publish")
+    async def test_start_stop(self, mock: AsyncMock):
+        CursorTick.start(rate=1000)
+        self.assertTrue(CursorTick.enabled())
+
+        await self.move_c()
+        await CursorTick.stop()
+
+        self.assertFalse(CursorTick.enabled())
+        self.assertEqual(len(mock.mock_calls), 1)
+        self.assertEqual(mock.mock_calls[0].args[0].header["origin_event"], CursorDeltaEvent.CURSORS_DELTA)
+
+
+if __name__ == "__main__":
+    unittest.main()
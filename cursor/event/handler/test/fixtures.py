@@ -1,6 +1,6 @@
 from board.data import Point
 from cursor.data import Cursor, Color
-from cursor.data.handler import CursorHandler
+from cursor.data.handler import CursorHandler, CursorStore
 
 
 def setup_cursor_locations() -> tuple[Cursor]:
@@ -9,7 +9,7 @@ def setup_cursor_locations() -> tuple[Cursor]:
 
     A, B, C 차례로 반환
     """
-    CursorHandler.cursor_dict = {
+    CursorHandler.cursor_dict = CursorStore({
         "A": Cursor(
             conn_id="A",
             position=Point(-3, 3),
@@ -37,7 +37,7 @@ def setup_cursor_locations() -> tuple[Cursor]:
             color=Color.PURPLE,
             revive_at=None
         )
-    }
+    })
 
     cur_a = CursorHandler.cursor_dict["A"]
     cur_b = CursorHandler.cursor_dict["B"]
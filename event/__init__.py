@@ -1,2 +1,4 @@
 from .internal.event_broker import EventBroker, Receiver
-from .internal.exceptions import NoMatchingReceiverException
+from .internal.exceptions import NoMatchingReceiverException, LaneFullException
+from .internal.tracer import Tracer, TraceLevel, TraceSink, PrintSink, RingBufferSink, FileSink
+from .internal.event_lanes import EventLanes, Lane, Priority, OverloadPolicy
@@ -1,8 +1,9 @@
 from __future__ import annotations
 import asyncio
-from typing import Callable, Generic
+from typing import Awaitable, Callable, Generic
 from message import Message
 from .exceptions import NoMatchingReceiverException
+from .tracer import Tracer
 from message.internal.message import EVENT_TYPE
 from uuid import uuid4
 
@@ -42,6 +43,11 @@ class Receiver(Generic[EVENT_TYPE]):
 
 class EventBroker:
     event_dict: dict[str, list[str]] = {}
+    # 이벤트 -> 수신 함수들. event_dict가 바뀔 때마다 다시 만든다.
+    # publish에서 id -> Receiver 조회 없이 바로 호출하기 위해 사용한다.
+    dispatch_table: dict[str, tuple[Callable[[Message], Awaitable], ...]] = {}
+    # 요청 이벤트 -> 응답 메시지를 반환하는 함수
+    responder_dict: dict[str, Callable[[Message], Awaitable[Message]]] = {}
 
     @staticmethod
     def add_receiver(event: str):
@@ -56,6 +62,7 @@ class EventBroker:
                 receiver = Receiver(func, event)
 
             EventBroker.event_dict[event].append(receiver.id)
+            EventBroker._rebuild_dispatch(event)
 
             return receiver
         return wrapper
@@ -72,21 +79,58 @@ class EventBroker:
             if len(EventBroker.event_dict[event]) == 0:
                 del EventBroker.event_dict[event]
 
+            EventBroker._rebuild_dispatch(event)
+
     @staticmethod
-    async def publish(message: Message):
-        EventBroker._debug(message)
+    def _rebuild_dispatch(event: str):
+        if event not in EventBroker.event_dict:
+            EventBroker.dispatch_table.pop(event, None)
+            return
 
-        if message.event not in EventBroker.event_dict:
-            raise NoMatchingReceiverException(message.event)
+        EventBroker.dispatch_table[event] = tuple(
+            Receiver.receiver_dict[id].func for id in EventBroker.event_dict[event]
+        )
+
+    @staticmethod
+    def add_responder(event: str):
+        """
+        event 요청에 대한 응답 메시지를 반환하는 함수를 등록한다.
+        이벤트마다 하나만 등록할 수 있고, 나중에 등록한 함수로 덮어쓴다.
+        """
+        def wrapper(func: Callable[[Message], Awaitable[Message]]):
+            EventBroker.responder_dict[event] = func
+            return func
+        return wrapper
+
+    @staticmethod
+    def remove_responder(event: str):
+        EventBroker.responder_dict.pop(event, None)
 
-        coroutines = []
+    @staticmethod
+    async def request(message: Message) -> Message | None:
+        """
+        같은 프로세스에 등록된 responder가 있으면 바로 호출해 응답 메시지를 반환한다.
+        없으면 요청을 publish하고 None을 반환한다. 이 경우 응답은 결과 이벤트로 따로 발행된다.
+        """
+        responder = EventBroker.responder_dict.get(message.event)
+        if responder is None:
+            await EventBroker.publish(message)
+            return None
 
-        receiver_ids = EventBroker.event_dict[message.event]
-        for id in receiver_ids:
-            receiver = Receiver.get_receiver(id)
-            coroutines.append(receiver(message))
+        return await responder(message)
 
-        await asyncio.gather(*coroutines)
+    @staticmethod
+    async def publish(message: Message):
+        if Tracer.level:
+            Tracer.trace(message)
+
+        funcs = EventBroker.dispatch_table.get(message.event)
+        if funcs is None:
+            raise NoMatchingReceiverException(message.event)
+
+        if len(funcs) == 1:
+            # 수신자가 하나면 gather 없이 바로 기다린다.
+            await funcs[0](message)
+            return
 
-    def _debug(message: Message):
-        print(message.to_str(del_header=False))
+        await asyncio.gather(*(func(message) for func in funcs))
@@ -0,0 +1,205 @@
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+from typing import Awaitable, Callable
+from message import Message
+from .event_broker import EventBroker
+from .exceptions import LaneFullException
+
+
+class Priority(IntEnum):
+    # 값이 작을수록 먼저 처리한다.
+    HIGH = 0
+    NORMAL = 1
+    BULK = 2
+
+
+class OverloadPolicy(str, Enum):
+    """
+    큐가 가득 찼을 때 새 메시지를 처리하는 방법
+    DROP: 새 메시지를 버린다.
+    COALESCE: 같은 sender의 같은 이벤트가 큐에 있으면 그 자리를 새 메시지로 바꾸고, 없으면 새 메시지를 버린다.
+        이전 메시지가 사라지므로 마지막 값만 의미 있는 이벤트(예: 뷰 크기)에만 사용해야 한다.
+        이동, 클릭처럼 순서대로 모두 처리해야 하는 이벤트에는 REJECT를 사용한다.
+    REJECT: LaneFullException을 발생시킨다.
+    """
+    DROP = "drop"
+    COALESCE = "coalesce"
+    REJECT = "reject"
+
+
+@dataclass
+class Lane:
+    priority: Priority
+    # 큐에 쌓일 수 있는 최대 메시지 수
+    maxsize: int
+    policy: OverloadPolicy = OverloadPolicy.DROP
+    # 동시에 처리하는 메시지 수
+    workers: int = 1
+    queue: deque[Message] = field(default_factory=deque)
+    # 처리 중인 메시지의 sender들. 같은 sender의 메시지는 순서대로 하나씩 처리한다.
+    active: set[str] = field(default_factory=set)
+    dropped: int = 0
+
+    def put(self, message: Message):
+        if len(self.queue) < self.maxsize:
+            self.queue.append(message)
+            return
+
+        match self.policy:
+            case OverloadPolicy.DROP:
+                self.dropped += 1
+            case OverloadPolicy.COALESCE:
+                self.dropped += 1
+                key = (message.event, message.header.get("sender"))
+                for i, queued in enumerate(self.queue):
+                    if (queued.event, queued.header.get("sender")) == key:
+                        self.queue[i] = message
+                        return
+            case OverloadPolicy.REJECT:
+                raise LaneFullException(message.event)
+
+    def take(self) -> Message | None:
+        """
+        처리 중이 아닌 sender의 가장 오래된 메시지를 꺼낸다.
+        """
+        for i, message in enumerate(self.queue):
+            sender = message.header.get("sender")
+            if sender in self.active:
+                continue
+
+            del self.queue[i]
+            if sender is not None:
+                self.active.add(sender)
+            return message
+
+        return None
+
+    def discard(self, sender: str):
+        """
+        sender의 대기 중인 메시지들을 버린다.
+        """
+        kept = [message for message in self.queue if message.header.get("sender") != sender]
+        self.queue.clear()
+        self.queue.extend(kept)
+
+
+class EventLanes:
+    """
+    외부에서 받은 메시지를 이벤트 우선순위별 큐(Lane)에 넣고, Lane마다 worker들이 EventBroker로 발행한다.
+    높은 우선순위 Lane에 대기 중인 메시지가 있으면 낮은 우선순위 Lane은 새 메시지를 꺼내지 않는다.
+    lanes가 비어 있으면 사용하지 않는다.
+    """
+    lanes: dict[Priority, Lane] = {}
+    # 이벤트 -> 우선순위. 없으면 NORMAL
+    event_priority: dict[str, Priority] = {}
+
+    # 메시지 처리 중 발생한 예외를 sender에게 알리는 함수. 없으면 출력만 한다.
+    on_error: Callable[[Message, Exception], Awaitable[None]] | None = None
+
+    _changed: asyncio.Condition | None = None
+    _tasks: list[asyncio.Task] = []
+
+    @staticmethod
+    def enabled() -> bool:
+        return len(EventLanes.lanes) > 0
+
+    @staticmethod
+    def start(
+        lanes: list[Lane], event_priority: dict[str, Priority],
+        on_error: Callable[[Message, Exception], Awaitable[None]] | None = None
+    ):
+        EventLanes.lanes = {lane.priority: lane for lane in lanes}
+        EventLanes.event_priority = event_priority
+        EventLanes.on_error = on_error
+        EventLanes._changed = asyncio.Condition()
+
+        for lane in lanes:
+            for _ in range(lane.workers):
+                EventLanes._tasks.append(asyncio.create_task(EventLanes._run(lane)))
+
+    @staticmethod
+    async def stop():
+        for task in EventLanes._tasks:
+            task.cancel()
+        await asyncio.gather(*EventLanes._tasks, return_exceptions=True)
+
+        EventLanes._tasks = []
+        EventLanes.lanes = {}
+        EventLanes.event_priority = {}
+        EventLanes.on_error = None
+        EventLanes._changed = None
+
+    @staticmethod
+    async def submit(message: Message):
+        """
+        message를 우선순위에 맞는 Lane에 넣는다.
+        Lane이 가득 찼으면 Lane의 OverloadPolicy를 따른다.
+        """
+        priority = EventLanes.event_priority.get(message.event, Priority.NORMAL)
+        lane = EventLanes.lanes.get(priority)
+        if lane is None:
+            lane = EventLanes.lanes[max(EventLanes.lanes)]
+
+        lane.put(message)
+
+        async with EventLanes._changed:
+            EventLanes._changed.notify_all()
+
+    @staticmethod
+    def discard(sender: str):
+        """
+        모든 Lane에서 sender의 대기 중인 메시지들을 버린다. 연결이 닫혔을 때 사용한다.
+        """
+        for lane in EventLanes.lanes.values():
+            lane.discard(sender)
+
+    @staticmethod
+    def _blocked(lane: Lane) -> bool:
+        """
+        lane보다 높은 우선순위 Lane에 대기 중인 메시지가 있는지
+        """
+        for priority, other in EventLanes.lanes.items():
+            if priority < lane.priority and len(other.queue) > 0:
+                return True
+        return False
+
+    @staticmethod
+    def _take(lane: Lane) -> Message | None:
+        if EventLanes._blocked(lane):
+            return None
+        return lane.take()
+
+    @staticmethod
+    async def _handle_error(message: Message, e: Exception):
+        if EventLanes.on_error is None:
+            print(f"Unhandled error while handling message: \n{message.__dict__}\n{type(e)}: '{e}'")
+            return
+
+        try:
+            await EventLanes.on_error(message, e)
+        except Exception as error:
+            print(f"Unhandled error while reporting error: {type(error)}: '{error}'")
+
+    @staticmethod
+    async def _run(lane: Lane):
+        changed = EventLanes._changed
+
+        while True:
+            async with changed:
+                while (message := EventLanes._take(lane)) is None:
+                    await changed.wait()
+
+            try:
+                await EventBroker.publish(message)
+            except Exception as e:
+                await EventLanes._handle_error(message, e)
+            finally:
+                lane.active.discard(message.header.get("sender"))
+
+                async with changed:
+                    changed.notify_all()
+
+            # 처리가 await 없이 끝나도 다른 worker와 세션들이 돌 수 있도록 양보한다.
+            await asyncio.sleep(0)
@@ -2,3 +2,9 @@ class NoMatchingReceiverException(Exception):
     def __init__(self, event, *args):
         self.msg = f"no matching receiver for '{event}'"
         super().__init__(*args)
+
+
+class LaneFullException(Exception):
+    def __init__(self, event, *args):
+        self.msg = f"too many pending messages for '{event}'"
+        super().__init__(*args)
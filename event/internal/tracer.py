@@ -0,0 +1,102 @@
+import asyncio
+import random
+from collections import deque
+from enum import IntEnum
+from typing import Protocol
+from message import Message
+
+
+class TraceLevel(IntEnum):
+    # 기록하지 않음. publish에서 직렬화를 하지 않는다.
+    OFF = 0
+    # 이벤트 이름과 header만 기록
+    EVENT = 1
+    # payload까지 JSON으로 기록
+    PAYLOAD = 2
+
+
+class TraceSink(Protocol):
+    def emit(self, record: str) -> None:
+        ...
+
+
+class PrintSink:
+    """
+    stdout으로 출력한다.
+    """
+
+    def emit(self, record: str):
+        print(record)
+
+
+class RingBufferSink:
+    """
+    최근 size개의 기록만 메모리에 유지한다.
+    """
+
+    def __init__(self, size: int = 1024):
+        self.records: deque[str] = deque(maxlen=size)
+
+    def emit(self, record: str):
+        self.records.append(record)
+
+
+class FileSink:
+    """
+    기록을 모아두었다가 이벤트 루프를 막지 않도록 별도 스레드에서 파일에 쓴다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._buffer: list[str] = []
+        self._task: asyncio.Task | None = None
+
+    def emit(self, record: str):
+        self._buffer.append(record)
+
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self.flush())
+
+    async def flush(self):
+        while len(self._buffer) > 0:
+            records, self._buffer = self._buffer, []
+            await asyncio.to_thread(self._write, records)
+
+        self._task = None
+
+    def _write(self, records: list[str]):
+        with open(self.path, "a") as f:
+            f.write("\n".join(records) + "\n")
+
+
+class Tracer:
+    """
+    EventBroker로 발행되는 메시지를 기록한다.
+    level이 OFF면 아무것도 하지 않는다.
+    """
+    level: TraceLevel = TraceLevel.OFF
+    # 기록할 메시지 비율 (0 ~ 1)
+    sample_rate: float = 1.0
+    sink: TraceSink = PrintSink()
+
+    @staticmethod
+    def configure(level: TraceLevel, sample_rate: float = 1.0, sink: TraceSink | None = None):
+        Tracer.level = level
+        Tracer.sample_rate = sample_rate
+        if sink is not None:
+            Tracer.sink = sink
+
+    @staticmethod
+    def trace(message: Message):
+        if Tracer.level == TraceLevel.OFF:
+            return
+
+        if Tracer.sample_rate < 1 and random.random() >= Tracer.sample_rate:
+            return
+
+        if Tracer.level == TraceLevel.EVENT:
+            record = f"{message.event} {message.header}"
+        else:
+            record = message.to_str(del_header=False)
+
+        Tracer.sink.emit(record)
@@ -1,4 +1,6 @@
 from .event_broker_test import EventBrokerTestCase
+from .tracer_test import TracerTestCase
+from .event_lanes_test import LaneTestCase, EventLanesTestCase
 
 import unittest
 
@@ -36,6 +36,15 @@ class EventBrokerTestCase(unittest.IsolatedAsyncioTestCase):
         self.assertNotIn(self.handler.receive_a.id, Receiver.receiver_dict)
         self.assertNotIn("example_a", EventBroker.event_dict)
 
+    def test_dispatch_table(self):
+        self.assertEqual(EventBroker.dispatch_table["example_a"], (self.handler.receive_a.func,))
+        self.assertEqual(EventBroker.dispatch_table["example_c"], (self.handler.receive_b.func,))
+
+        EventBroker.remove_receiver(self.handler.receive_b)
+
+        self.assertNotIn("example_b", EventBroker.dispatch_table)
+        self.assertNotIn("example_c", EventBroker.dispatch_table)
+
     async def test_publish(self):
         message = Message(event="example_a", payload=None)
 
@@ -60,6 +69,19 @@ class EventBrokerTestCase(unittest.IsolatedAsyncioTestCase):
         mock_message_c = self.handler.receive_b.func.mock_calls[1].args[0]
         self.assertEqual(mock_message_c.event, message_c.event)
 
+    async def test_publish_same_event_receivers(self):
+        func_d = AsyncMock()
+        receiver_d = EventBroker.add_receiver("example_a")(func_d)
+        self.addCleanup(EventBroker.remove_receiver, receiver_d)
+
+        self.assertEqual(len(EventBroker.dispatch_table["example_a"]), 2)
+
+        message = Message(event="example_a", payload=None)
+        await EventBroker.publish(message=message)
+
+        self.handler.receive_a.func.assert_called_once_with(message)
+        func_d.assert_called_once_with(message)
+
     async def test_publish_no_receiver(self):
         message = Message(event="invaild_event", payload=None)
 
@@ -67,6 +89,26 @@ class EventBrokerTestCase(unittest.IsolatedAsyncioTestCase):
             await EventBroker.publish(message=message)
         self.assertEqual(cm.exception.msg, "no matching receiver for 'invaild_event'")
 
+    async def test_request(self):
+        response = Message(event="example_response", payload=None)
+        responder = AsyncMock(return_value=response)
+        EventBroker.add_responder("example_request")(responder)
+        self.addCleanup(EventBroker.remove_responder, "example_request")
+
+        message = Message(event="example_request", payload=None)
+        got = await EventBroker.request(message)
+
+        self.assertIs(got, response)
+        responder.assert_called_once_with(message)
+
+    async def test_request_no_responder(self):
+        # responder가 없으면 publish
+        message = Message(event="example_a", payload=None)
+        got = await EventBroker.request(message)
+
+        self.assertIsNone(got)
+        self.handler.receive_a.func.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
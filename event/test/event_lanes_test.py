@@ -0,0 +1,166 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+
+from message import Message
+from event import EventBroker, EventLanes, Lane, Priority, OverloadPolicy, LaneFullException
+
+
+def create_message(event: str, sender: str = "a", payload=None) -> Message:
+    return Message(event=event, header={"sender": sender}, payload=payload)
+
+
+class LaneTestCase(unittest.TestCase):
+    def test_drop(self):
+        lane = Lane(priority=Priority.NORMAL, maxsize=1, policy=OverloadPolicy.DROP)
+        first = create_message("example")
+        lane.put(first)
+        lane.put(create_message("example"))
+
+        self.assertEqual(list(lane.queue), [first])
+        self.assertEqual(lane.dropped, 1)
+
+    def test_coalesce(self):
+        lane = Lane(priority=Priority.NORMAL, maxsize=2, policy=OverloadPolicy.COALESCE)
+        a_size = create_message("set-view-size", sender="a")
+        b_size = create_message("set-view-size", sender="b")
+        lane.put(a_size)
+        lane.put(b_size)
+
+        # 같은 sender, 같은 이벤트는 자리를 바꾼다.
+        a_size_2 = create_message("set-view-size", sender="a")
+        lane.put(a_size_2)
+        self.assertEqual(list(lane.queue), [a_size_2, b_size])
+
+        # 없으면 다른 연결의 메시지는 그대로 두고 새 메시지를 버린다.
+        lane.put(create_message("set-view-size", sender="c"))
+        self.assertEqual(list(lane.queue), [a_size_2, b_size])
+        self.assertEqual(lane.dropped, 2)
+
+    def test_reject(self):
+        lane = Lane(priority=Priority.BULK, maxsize=1, policy=OverloadPolicy.REJECT)
+        lane.put(create_message("fetch-tiles"))
+
+        with self.assertRaises(LaneFullException) as cm:
+            lane.put(create_message("fetch-tiles"))
+        self.assertEqual(cm.exception.msg, "too many pending messages for 'fetch-tiles'")
+
+    def test_take_skips_active_sender(self):
+        lane = Lane(priority=Priority.NORMAL, maxsize=10)
+        a_1 = create_message("example", sender="a")
+        a_2 = create_message("example", sender="a")
+        b_1 = create_message("example", sender="b")
+        for message in [a_1, a_2, b_1]:
+            lane.put(message)
+
+        self.assertIs(lane.take(), a_1)
+        self.assertIs(lane.take(), b_1)
+        self.assertIsNone(lane.take())
+
+        lane.active.discard("a")
+        self.assertIs(lane.take(), a_2)
+
+
+class EventLanesTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.handled: list[str] = []
+
+        async def record(message: Message):
+            await asyncio.sleep(0)
+            self.handled.append(message.payload)
+
+        self.receivers = [
+            EventBroker.add_receiver(event)(record)
+            for event in ["example_high", "example_bulk", "example_normal"]
+        ]
+
+    async def asyncSetUp(self):
+        EventLanes.start(
+            lanes=[
+                Lane(priority=Priority.HIGH, maxsize=10, workers=2),
+                Lane(priority=Priority.BULK, maxsize=10, workers=1)
+            ],
+            event_priority={
+                "example_high": Priority.HIGH,
+                "example_bulk": Priority.BULK
+            }
+        )
+
+    async def asyncTearDown(self):
+        await EventLanes.stop()
+
+    def tearDown(self):
+        for receiver in self.receivers:
+            EventBroker.remove_receiver(receiver)
+
+    async def wait_idle(self):
+        for _ in range(100):
+            lanes = EventLanes.lanes.values()
+            if all(len(lane.queue) == 0 and len(lane.active) == 0 for lane in lanes):
+                return
+            await asyncio.sleep(0)
+        self.fail("lanes are not idle")
+
+    async def test_high_priority_first(self):
+        await EventLanes.submit(create_message("example_bulk", sender="a", payload="bulk"))
+        await EventLanes.submit(create_message("example_high", sender="b", payload="high"))
+
+        await self.wait_idle()
+
+        self.assertEqual(self.handled, ["high", "bulk"])
+
+    async def test_sender_order(self):
+        for i in range(3):
+            await EventLanes.submit(create_message("example_high", sender="a", payload=f"a{i}"))
+        await EventLanes.submit(create_message("example_high", sender="b", payload="b0"))
+
+        await self.wait_idle()
+
+        a_handled = [payload for payload in self.handled if payload.startswith("a")]
+        self.assertEqual(a_handled, ["a0", "a1", "a2"])
+        self.assertEqual(len(self.handled), 4)
+
+    async def test_unknown_event_normal_fallback(self):
+        # NORMAL Lane이 없으면 가장 낮은 우선순위 Lane으로 간다.
+        await EventLanes.submit(create_message("example_normal", payload="normal"))
+        self.assertEqual(len(EventLanes.lanes[Priority.BULK].queue), 1)
+
+        await self.wait_idle()
+        self.assertEqual(self.handled, ["normal"])
+
+    async def test_handler_error(self):
+        receiver = EventBroker.add_receiver("example_error")(AsyncMock(side_effect=Exception("error")))
+        self.addCleanup(EventBroker.remove_receiver, receiver)
+
+        await EventLanes.submit(create_message("example_error"))
+        await EventLanes.submit(create_message("example_high", payload="high"))
+
+        await self.wait_idle()
+
+        # 에러가 나도 worker는 계속 동작한다.
+        receiver.func.assert_called_once()
+        self.assertEqual(self.handled, ["high"])
+
+    async def test_handler_error_on_error(self):
+        receiver = EventBroker.add_receiver("example_error")(AsyncMock(side_effect=Exception("error")))
+        self.addCleanup(EventBroker.remove_receiver, receiver)
+
+        on_error = AsyncMock(side_effect=Exception("on_error"))
+        EventLanes.on_error = on_error
+
+        message = create_message("example_error", sender="a")
+        await EventLanes.submit(message)
+        await EventLanes.submit(create_message("example_high", payload="high"))
+
+        await self.wait_idle()
+
+        # 실패한 메시지와 예외를 on_error로 넘기고, on_error가 실패해도 worker는 계속 동작한다.
+        on_error.assert_awaited_once()
+        got_message, got_error = on_error.await_args.args
+        self.assertIs(got_message, message)
+        self.assertEqual(str(got_error), "error")
+        self.assertEqual(self.handled, ["high"])
+
+
+if __name__ == "__main__":
+    unittest.main()
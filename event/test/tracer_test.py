@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from message import Message
+from event import EventBroker, Tracer, TraceLevel, PrintSink, RingBufferSink, FileSink
+
+
+class TracerTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.receiver = EventBroker.add_receiver("example_trace")(AsyncMock())
+        self.sink = RingBufferSink(size=2)
+
+    def tearDown(self):
+        EventBroker.remove_receiver(self.receiver)
+        Tracer.configure(level=TraceLevel.OFF, sample_rate=1.0, sink=PrintSink())
+
+    async def test_off(self):
+        Tracer.configure(level=TraceLevel.OFF, sink=self.sink)
+
+        message = Message(event="example_trace", payload=None)
+        with patch.object(Message, "to_str") as to_str:
+            await EventBroker.publish(message)
+            to_str.assert_not_called()
+
+        self.assertEqual(len(self.sink.records), 0)
+        self.receiver.func.assert_called_once()
+
+    async def test_event_level(self):
+        Tracer.configure(level=TraceLevel.EVENT, sink=self.sink)
+
+        message = Message(event="example_trace", header={"sender": "a"}, payload=None)
+        with patch.object(Message, "to_str") as to_str:
+            await EventBroker.publish(message)
+            to_str.assert_not_called()
+
+        self.assertEqual(list(self.sink.records), ["example_trace {'sender': 'a'}"])
+
+    async def test_payload_level(self):
+        Tracer.configure(level=TraceLevel.PAYLOAD, sink=self.sink)
+
+        for _ in range(3):
+            await EventBroker.publish(Message(event="example_trace", header={"sender": "a"}, payload=None))
+
+        # 최근 2개만 유지
+        self.assertEqual(len(self.sink.records), 2)
+        self.assertEqual(self.sink.records[0], Message(event="example_trace", header={"sender": "a"}, payload=None).to_str(del_header=False))
+
+    async def test_sample_rate(self):
+        Tracer.configure(level=TraceLevel.PAYLOAD, sample_rate=0, sink=self.sink)
+
+        await EventBroker.publish(Message(event="example_trace", payload=None))
+
+        self.assertEqual(len(self.sink.records), 0)
+
+    async def test_file_sink(self):
+        with tempfile.TemporaryDirectory() as dir:
+            path = os.path.join(dir, "trace.log")
+            sink = FileSink(path)
+            Tracer.configure(level=TraceLevel.EVENT, sink=sink)
+
+            await EventBroker.publish(Message(event="example_trace", payload=None))
+            await EventBroker.publish(Message(event="example_trace", payload=None))
+            if sink._task is not None:
+                await sink._task
+
+            with open(path) as f:
+                self.assertEqual(f.read(), "example_trace {}\nexample_trace {}\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,2 +1,2 @@
-from .internal.message import Message
+from .internal.message import Message, Protocol
 from .internal.exceptions import InvalidEventTypeException
@@ -0,0 +1,29 @@
+from message.payload import encode_value
+
+import json
+
+# orjson이 설치되어 있으면 사용하고, 없으면 표준 json을 사용한다.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# json.dumps()는 옵션이 있으면 호출마다 JSONEncoder를 새로 만들므로 하나를 만들어 재사용한다.
+_encoder = json.JSONEncoder(default=encode_value, sort_keys=True)
+
+
+def dumps(obj) -> str:
+    """
+    키를 정렬한 JSON 문자열. Payload 등 기본 타입이 아닌 값은 encode_value로 바꾼다.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=encode_value, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+
+    return _encoder.encode(obj)
+
+
+def loads(s: str | bytes):
+    if orjson is not None:
+        return orjson.loads(s)
+
+    return json.loads(s)
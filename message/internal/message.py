@@ -9,11 +9,16 @@ from message.payload import (
     PointingPayload,
     MovingPayload,
     NewConnEvent,
-    SetViewSizePayload
+    SetViewSizePayload,
+    TileEncoding,
+    compile_decoder,
+    encode_payload
 )
 from .exceptions import InvalidEventTypeException
+from .json_codec import dumps, loads
+from enum import Enum
 
-import json
+import struct
 
 EVENT_TYPE = TypeVar(
     "EVENT_TYPE",
@@ -29,27 +34,69 @@ DECODABLE_PAYLOAD_DICT: dict[str, Payload] = {
 }
 
 
+# binary 프레임으로 보낼 수 있는 이벤트. 프레임의 첫 byte가 이벤트 id이다.
+BINARY_EVENT_ID_DICT: dict[str, int] = {
+    TilesEvent.TILES: 1
+}
+
+
+class Protocol(str, Enum):
+    """
+    연결 시 협상하는 메시지 전송 방식.
+    BINARY: BINARY_EVENT_ID_DICT의 이벤트는 binary 프레임으로, 나머지는 JSON으로 보낸다.
+    """
+    JSON = "json"
+    BINARY = "binary"
+
+
 class Message(Generic[EVENT_TYPE]):
     def __init__(self, event: str, payload: EVENT_TYPE, header: dict[str, object] = {}):
         self.event = event
         self.header = header
         self.payload = payload
+        # (event, binary, tile_encoding) -> 인코딩된 프레임
+        self._frames: dict[tuple[str, bool, TileEncoding], str | bytes] = {}
+
+    def to_frame(self, protocol: Protocol = Protocol.JSON, tile_encoding: TileEncoding = TileEncoding.HEX) -> str | bytes:
+        """
+        연결로 보낼 프레임. header는 포함하지 않는다.
+        여러 연결에 보내는 경우 한 번만 인코딩하도록 결과를 저장해두고 같은 프레임을 돌려준다.
+        프레임을 만든 뒤에는 payload를 바꾸면 안 된다.
+        """
+        binary = protocol == Protocol.BINARY and self.event in BINARY_EVENT_ID_DICT
 
-    def to_str(self, del_header: bool = True):
-        data = self
-        if del_header:
-            data = Message(event=self.event, payload=self.payload)
-            del data.header
+        key = (self.event, binary, tile_encoding)
+        if key not in self._frames:
+            if binary:
+                self._frames[key] = self.to_bytes(tile_encoding=tile_encoding)
+            else:
+                self._frames[key] = self.to_str(tile_encoding=tile_encoding)
 
-        return json.dumps(
-            data,
-            default=lambda o: o.__dict__,
-            sort_keys=True
-        )
+        return self._frames[key]
+
+    def to_str(self, del_header: bool = True, tile_encoding: TileEncoding = TileEncoding.HEX):
+        payload = self.payload
+        if isinstance(payload, TilesPayload):
+            payload = payload.encode(tile_encoding)
+
+        data = {"event": self.event, "payload": encode_payload(payload)}
+        if not del_header:
+            data["header"] = self.header
+
+        return dumps(data)
+
+    def to_bytes(self, tile_encoding: TileEncoding = TileEncoding.HEX) -> bytes:
+        """
+        | event id (1 byte) | payload.to_bytes() |
+        """
+        if not self.event in BINARY_EVENT_ID_DICT:
+            raise InvalidEventTypeException(self.event)
+
+        return struct.pack("!B", BINARY_EVENT_ID_DICT[self.event]) + self.payload.to_bytes(tile_encoding)
 
     @staticmethod
     def from_str(msg: str):
-        decoded = json.loads(msg)
+        decoded = loads(msg)
 
         event = decoded["event"]
         payload = decode_data(event, decoded["payload"])
@@ -69,3 +116,8 @@ def decode_data(event: str, data: dict):
         raise InvalidEventTypeException(event)
 
     return DECODABLE_PAYLOAD_DICT[event]._from_dict(data)
+
+
+# 받을 수 있는 Payload들의 decoder는 import 시점에 미리 만든다.
+for payload_type in DECODABLE_PAYLOAD_DICT.values():
+    compile_decoder(payload_type)
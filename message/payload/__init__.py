@@ -1,5 +1,6 @@
-from .internal.tiles_payload import FetchTilesPayload, TilesPayload, TilesEvent
-from .internal.base_payload import Payload
+from .internal.tiles_payload import FetchTilesPayload, TilesPayload, TilesEvent, TileEncoding
+from .internal.base_payload import Payload, compile_decoder
+from .internal.payload_encoder import encode_payload, encode_value, compile_encoder
 from .internal.exceptions import InvalidFieldException, MissingFieldException, DumbHumanException
 from .internal.new_conn_payload import NewConnPayload, NewConnEvent, CursorPayload, CursorsPayload, MyCursorPayload, ConnClosedPayload, CursorQuitPayload, SetViewSizePayload
 from .internal.parsable_payload import ParsablePayload
@@ -7,3 +8,4 @@ from .internal.pointing_payload import PointerSetPayload, PointingResultPayload,
 from .internal.move_payload import MoveEvent, MovingPayload, MovedPayload, CheckMovablePayload, MovableResultPayload
 from .internal.interaction_payload import TileStateChangedPayload, TileUpdatedPayload, YouDiedPayload, InteractionEvent
 from .internal.error_payload import ErrorEvent, ErrorPayload
+from .internal.cursor_delta_payload import CursorDeltaEvent, CursorDeltaPayload, CursorsDeltaPayload
@@ -2,54 +2,119 @@ from .exceptions import InvalidFieldException, MissingFieldException, DumbHumanE
 from .parsable_payload import ParsablePayload
 
 from enum import Enum
+from types import UnionType
+from typing import Callable, Union
 
 
 class Payload():
+    # 하위 dataclass들이 slots=True로 __dict__ 없이 만들어지도록 한다.
+    __slots__ = ()
+
     @classmethod
     def _from_dict(cls, dict: dict):
-        kwargs = {}
+        decoder = _DECODERS.get(cls)
+        if decoder is None:
+            decoder = compile_decoder(cls)
+
+        return decoder(dict)
+
+
+# Payload 클래스 -> compile_decoder()로 만든 decoder
+_DECODERS: dict[type, Callable[[dict], Payload]] = {}
+
 
-        missing = set(cls.__annotations__.keys()) - set(dict.keys())
+def compile_decoder(cls: type[Payload]) -> Callable[[dict], Payload]:
+    """
+    cls.__annotations__를 한 번만 보고, dict를 cls로 decode하는 함수를 만든다.
+    """
+    if cls in _DECODERS:
+        return _DECODERS[cls]
+
+    fields = cls.__annotations__
+    converters = {key: _compile_field(key, t) for key, t in fields.items()}
+    required = fields.keys()
+
+    def decode(dict: dict):
+        missing = required - dict.keys()
         if len(missing) > 0:
             # 필요한 key가 없음
             raise MissingFieldException(missing)
 
-        for key in dict:
-            if not key in cls.__annotations__:
+        kwargs = {}
+        for key, value in dict.items():
+            converter = converters.get(key)
+            if converter is None:
                 # event의 없는 key
-                raise InvalidFieldException(key, dict[key])
-
-            t = cls.__annotations__[key]
-            if hasattr(t, "__origin__") and t.__origin__ == ParsablePayload:
-                if len(t.__args__) != 1:
-                    raise DumbHumanException()
-                try:
-                    kwargs[key] = t.__args__[0](**dict[key])
-                except Exception as e:
-                    raise InvalidFieldException(key, e)
-                continue
-
-            if issubclass(t, Payload):
-                try:
-                    kwargs[key] = t._from_dict(dict[key])
-                except InvalidFieldException as e:
-                    raise InvalidFieldException(key, e)
-                except MissingFieldException as e:
-                    raise MissingFieldException(key, e)
-                continue
-
-            if issubclass(t, Enum) and dict[key] in t:
-                kwargs[key] = t(dict[key])
-                continue
-
-            if not type(dict[key]) == t:
-                # 잘못된 형식의 data
-                raise InvalidFieldException(key, dict[key])
-
-            kwargs[key] = t(dict[key])
+                raise InvalidFieldException(key, value)
+
+            kwargs[key] = converter(value)
 
         return cls(**kwargs)
 
+    _DECODERS[cls] = decode
+    return decode
+
+
+def _compile_field(key: str, t) -> Callable[[object], object]:
+    if hasattr(t, "__origin__") and t.__origin__ == ParsablePayload:
+        if len(t.__args__) != 1:
+            raise DumbHumanException()
+        data_type = t.__args__[0]
+
+        def parse(value):
+            try:
+                return data_type(**value)
+            except Exception as e:
+                raise InvalidFieldException(key, e)
+        return parse
+
+    if isinstance(t, UnionType) or getattr(t, "__origin__", None) is Union:
+        if len(t.__args__) == 2 and type(None) in t.__args__:
+            # X | None
+            inner = _compile_field(key, next(arg for arg in t.__args__ if arg is not type(None)))
+            return lambda value: None if value is None else inner(value)
+
+        if not all(isinstance(arg, type) and not issubclass(arg, (Payload, Enum)) for arg in t.__args__):
+            raise DumbHumanException()
+
+        # str | bytes 처럼 기본 타입들 중 하나
+        types = t.__args__
+
+        def check_types(value):
+            if type(value) not in types:
+                raise InvalidFieldException(key, value)
+            return value
+        return check_types
+
+    if not isinstance(t, type):
+        raise DumbHumanException()
+
+    if issubclass(t, Payload):
+        def decode_payload(value):
+            try:
+                return t._from_dict(value)
+            except InvalidFieldException as e:
+                raise InvalidFieldException(key, e)
+            except MissingFieldException as e:
+                raise MissingFieldException(key, e)
+        return decode_payload
+
+    if issubclass(t, Enum):
+        def to_enum(value):
+            if value in t:
+                return t(value)
+            if not type(value) == t:
+                raise InvalidFieldException(key, value)
+            return value
+        return to_enum
+
+    def check_type(value):
+        if not type(value) == t:
+            # 잘못된 형식의 data
+            raise InvalidFieldException(key, value)
+        return value
+    return check_type
+
 
 if __name__ == "__main__":
     pass
@@ -0,0 +1,25 @@
+from board.data import Point
+from cursor.data import Color
+from dataclasses import dataclass
+from .base_payload import Payload
+from .parsable_payload import ParsablePayload
+from enum import Enum
+
+
+class CursorDeltaEvent(str, Enum):
+    CURSORS_DELTA = "cursors-delta"
+
+
+@dataclass(slots=True)
+class CursorDeltaPayload(Payload):
+    # 틱 시작 시점의 위치
+    origin_position: ParsablePayload[Point]
+    # 틱 끝 시점의 위치
+    new_position: ParsablePayload[Point]
+    pointer: ParsablePayload[Point] | None
+    color: Color
+
+
+@dataclass(slots=True)
+class CursorsDeltaPayload(Payload):
+    cursors: list[CursorDeltaPayload]
@@ -7,6 +7,6 @@ class ErrorEvent(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorPayload(Payload):
     msg: str
@@ -11,18 +11,18 @@ class InteractionEvent(str, Enum):
     TILE_STATE_CHANGED = "tile-state-changed"
 
 
-@dataclass
+@dataclass(slots=True)
 class YouDiedPayload(Payload):
     revive_at: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TileUpdatedPayload(Payload):
     position: ParsablePayload[Point]
     tile: ParsablePayload[Tile]
 
 
-@dataclass
+@dataclass(slots=True)
 class TileStateChangedPayload(Payload):
     position: ParsablePayload[Point]
     tile: ParsablePayload[Tile]
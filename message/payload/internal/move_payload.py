@@ -13,24 +13,24 @@ class MoveEvent(str, Enum):
     MOVABLE_RESULT = "movable-result"
 
 
-@dataclass
+@dataclass(slots=True)
 class MovingPayload(Payload):
     position: ParsablePayload[Point]
 
 
-@dataclass
+@dataclass(slots=True)
 class MovedPayload(Payload):
     origin_position: ParsablePayload[Point]
     new_position: ParsablePayload[Point]
     color: Color
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckMovablePayload(Payload):
     position: ParsablePayload[Point]
 
 
-@dataclass
+@dataclass(slots=True)
 class MovableResultPayload(Payload):
     position: ParsablePayload[Point]
     movable: bool
@@ -15,40 +15,41 @@ class NewConnEvent(str, Enum):
     SET_VIEW_SIZE = "set-view-size"
 
 
-@dataclass
+@dataclass(slots=True)
 class NewConnPayload(Payload):
     conn_id: str
     width: int
     height: int
 
 
-@dataclass
+@dataclass(slots=True)
 class CursorPayload(Payload):
     position: ParsablePayload[Point]
     pointer: ParsablePayload[Point] | None
     color: Color
 
 
-@dataclass
+@dataclass(slots=True)
 class CursorsPayload(Payload):
     cursors: list[CursorPayload]
 
 
+@dataclass(slots=True)
 class MyCursorPayload(CursorPayload):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnClosedPayload(Payload):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class CursorQuitPayload(CursorPayload):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class SetViewSizePayload(Payload):
     width: int
     height: int
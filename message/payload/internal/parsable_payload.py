@@ -4,4 +4,4 @@ DATA_TYPE = TypeVar("DATA_TYPE")
 
 
 class ParsablePayload(Generic[DATA_TYPE]):
-    pass
\ No newline at end of file
+    __slots__ = ()
@@ -0,0 +1,111 @@
+from .parsable_payload import ParsablePayload
+
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from types import UnionType
+from typing import Callable, Union, get_type_hints
+
+# dataclass -> compile_encoder()로 만든 encoder
+_ENCODERS: dict[type, Callable[[object], dict]] = {}
+
+
+def encode_payload(payload) -> object:
+    """
+    payload를 JSON으로 바로 직렬화할 수 있는 dict, list, 기본 타입으로 바꾼다.
+    """
+    encoder = _ENCODERS.get(type(payload))
+    if encoder is None:
+        if not is_dataclass(payload):
+            return encode_value(payload)
+        encoder = compile_encoder(type(payload))
+
+    return encoder(payload)
+
+
+def encode_value(o) -> object:
+    """
+    타입 정보 없이 o를 바꾼다. JSON 라이브러리의 default 훅으로도 사용한다.
+    """
+    if o is None or isinstance(o, (str, int, float, bool)):
+        return o
+    if isinstance(o, (list, tuple)):
+        return [encode_value(v) for v in o]
+    if isinstance(o, dict):
+        return {k: encode_value(v) for k, v in o.items()}
+    if is_dataclass(o):
+        return encode_payload(o)
+    if hasattr(o, "__dict__"):
+        return encode_value(o.__dict__)
+
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def compile_encoder(cls: type) -> Callable[[object], dict]:
+    """
+    dataclass cls의 필드 타입을 한 번만 보고, cls 객체를 dict로 바꾸는 함수를 만든다.
+    """
+    if cls in _ENCODERS:
+        return _ENCODERS[cls]
+
+    hints = get_type_hints(cls)
+    plain: list[str] = []
+    converted: list[tuple[str, Callable]] = []
+    for field in fields(cls):
+        converter = _compile_value(hints.get(field.name))
+        if converter is None:
+            plain.append(field.name)
+        else:
+            converted.append((field.name, converter))
+
+    def encode(o) -> dict:
+        if type(o) is not cls:
+            # 선언과 다른 타입이 들어온 경우
+            return encode_value(o)
+
+        result = {name: getattr(o, name) for name in plain}
+        for name, converter in converted:
+            result[name] = converter(getattr(o, name))
+        return result
+
+    _ENCODERS[cls] = encode
+    return encode
+
+
+def _compile_value(t) -> Callable[[object], object] | None:
+    """
+    t 타입 값을 바꾸는 함수. 그대로 직렬화할 수 있으면 None
+    """
+    if t is None:
+        return encode_value
+
+    origin = getattr(t, "__origin__", None)
+
+    if origin is ParsablePayload:
+        return _compile_value(t.__args__[0])
+
+    if origin is Union or isinstance(t, UnionType):
+        args = [arg for arg in t.__args__ if arg is not type(None)]
+        if len(args) != 1:
+            return encode_value
+
+        converter = _compile_value(args[0])
+        if converter is None:
+            return None
+        return lambda v: None if v is None else converter(v)
+
+    if origin is list:
+        converter = _compile_value(t.__args__[0])
+        if converter is None:
+            return None
+        return lambda v: [converter(item) for item in v]
+
+    if not isinstance(t, type):
+        return encode_value
+
+    if issubclass(t, (str, int, float, bool, Enum)):
+        return None
+
+    if is_dataclass(t):
+        return compile_encoder(t)
+
+    return encode_value
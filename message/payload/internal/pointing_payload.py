@@ -18,13 +18,13 @@ class ClickType(str, Enum):
     SPECIAL_CLICK = "SPECIAL_CLICK"
 
 
-@dataclass
+@dataclass(slots=True)
 class PointingPayload(Payload):
     position: ParsablePayload[Point]
     click_type: ClickType
 
 
-@dataclass
+@dataclass(slots=True)
 class TryPointingPayload(Payload):
     cursor_position: ParsablePayload[Point]
     new_pointer: ParsablePayload[Point]
@@ -32,13 +32,13 @@ class TryPointingPayload(Payload):
     click_type: ClickType
 
 
-@dataclass
+@dataclass(slots=True)
 class PointingResultPayload(Payload):
     pointer: ParsablePayload[Point]
     pointable: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class PointerSetPayload(ParsablePayload):
     origin_position: ParsablePayload[Point] | None
     new_position: ParsablePayload[Point] | None
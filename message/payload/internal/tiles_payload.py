@@ -3,6 +3,11 @@ from dataclasses import dataclass
 from .base_payload import Payload
 from .parsable_payload import ParsablePayload
 from enum import Enum
+from functools import lru_cache
+
+import base64
+import struct
+import zlib
 
 
 class TilesEvent(str, Enum):
@@ -10,14 +15,65 @@ class TilesEvent(str, Enum):
     TILES = "tiles"
 
 
-@dataclass
+class TileEncoding(str, Enum):
+    """
+    연결 시 협상하는 TilesPayload.tiles의 인코딩.
+    HEX: 타일 byte의 hex 문자열 (JSON), 타일 byte 그대로 (binary)
+    DEFLATE: 타일 byte를 zlib으로 압축. JSON에서는 base64 문자열로 보낸다.
+    """
+    HEX = "hex"
+    DEFLATE = "deflate"
+
+
+@dataclass(slots=True)
 class FetchTilesPayload(Payload):
     start_p: ParsablePayload[Point]
     end_p: ParsablePayload[Point]
 
 
-@dataclass
+@dataclass(slots=True)
 class TilesPayload(Payload):
     start_p: ParsablePayload[Point]
     end_p: ParsablePayload[Point]
-    tiles: str
+    # 타일 byte의 hex 문자열.
+    # 서버에서 보낼 때는 hex로 바꾸지 않고 타일 byte 그대로 넣고, JSON으로 보낼 때만 hex로 바꾼다.
+    tiles: str | bytes
+
+    def encode(self, encoding: TileEncoding):
+        """
+        tiles를 encoding으로 인코딩한 TilesPayload (JSON 용)
+        """
+        if encoding == TileEncoding.HEX:
+            if isinstance(self.tiles, str):
+                return self
+            return TilesPayload(start_p=self.start_p, end_p=self.end_p, tiles=self.tiles.hex())
+
+        tiles = base64.b64encode(compress_tiles(self.tiles)).decode("ascii")
+        return TilesPayload(start_p=self.start_p, end_p=self.end_p, tiles=tiles)
+
+    def to_bytes(self, encoding: TileEncoding = TileEncoding.HEX) -> bytes:
+        """
+        | start_p.x | start_p.y | end_p.x | end_p.y | tiles |
+        좌표는 각각 big-endian int32.
+        tiles는 HEX면 타일 byte 그대로, DEFLATE면 zlib으로 압축한 byte.
+        """
+        header = struct.pack("!4i", self.start_p.x, self.start_p.y, self.end_p.x, self.end_p.y)
+
+        if encoding == TileEncoding.DEFLATE:
+            return header + compress_tiles(self.tiles)
+        return header + raw_tiles(self.tiles)
+
+
+def raw_tiles(tiles: str | bytes) -> bytes:
+    if isinstance(tiles, str):
+        return bytes.fromhex(tiles)
+    return tiles
+
+
+@lru_cache(maxsize=64)
+def compress_tiles(tiles: str | bytes) -> bytes:
+    """
+    타일 byte (또는 그 hex 문자열) tiles를 zlib으로 압축한다.
+    같은 범위를 여러 연결에 보낼 때 한 번만 압축하도록 결과를 캐싱한다.
+    """
+    return zlib.compress(raw_tiles(tiles), level=1)
@@ -1,5 +1,6 @@
 import unittest
 from .base_payload_test import BasePayloadTestCase
+from .payload_encoder_test import PayloadEncoderTestCase
 
 
 if __name__ == "__main__":
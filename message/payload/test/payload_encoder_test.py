@@ -0,0 +1,71 @@
+import json
+import unittest
+from dataclasses import dataclass
+
+from board.data import Point
+from cursor.data import Color
+from message.payload import (
+    Payload,
+    ParsablePayload,
+    CursorPayload,
+    CursorsPayload,
+    MyCursorPayload,
+    encode_payload,
+    compile_encoder,
+    compile_decoder
+)
+
+
+@dataclass
+class ExamplePayload(Payload):
+    position: ParsablePayload[Point]
+    pointer: ParsablePayload[Point] | None
+    name: str
+
+
+class Unknown:
+    def __init__(self):
+        self.a = 1
+
+
+class PayloadEncoderTestCase(unittest.TestCase):
+    def test_encode(self):
+        payload = ExamplePayload(position=Point(1, 2), pointer=None, name="a")
+
+        self.assertEqual(encode_payload(payload), {"position": {"x": 1, "y": 2}, "pointer": None, "name": "a"})
+
+    def test_encode_nested(self):
+        payload = CursorsPayload(cursors=[
+            CursorPayload(position=Point(0, 0), pointer=None, color=Color.BLUE),
+            # 선언된 타입의 하위 클래스
+            MyCursorPayload(position=Point(1, 1), pointer=Point(2, 2), color=Color.RED)
+        ])
+
+        self.assertEqual(encode_payload(payload), {"cursors": [
+            {"position": {"x": 0, "y": 0}, "pointer": None, "color": Color.BLUE},
+            {"position": {"x": 1, "y": 1}, "pointer": {"x": 2, "y": 2}, "color": Color.RED}
+        ]})
+
+    def test_encode_slots(self):
+        # __dict__가 없는 slots dataclass도 인코딩한다.
+        payload = CursorPayload(position=Point(0, 0), pointer=None, color=Color.BLUE)
+        self.assertFalse(hasattr(payload, "__dict__"))
+        self.assertFalse(hasattr(payload.position, "__dict__"))
+
+        self.assertEqual(json.loads(json.dumps(encode_payload(payload))), {
+            "position": {"x": 0, "y": 0}, "pointer": None, "color": "BLUE"
+        })
+
+    def test_encode_undeclared_type(self):
+        # 선언과 다른 타입이면 __dict__를 사용한다.
+        payload = ExamplePayload(position=Unknown(), pointer=Point(0, 0), name="a")
+
+        self.assertEqual(encode_payload(payload)["position"], {"a": 1})
+
+    def test_compile_once(self):
+        self.assertIs(compile_encoder(ExamplePayload), compile_encoder(ExamplePayload))
+        self.assertIs(compile_decoder(CursorPayload), compile_decoder(CursorPayload))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,13 @@
-from message import Message, InvalidEventTypeException
-from message.payload import Payload, FetchTilesPayload, TilesPayload
+from message import Message, InvalidEventTypeException, Protocol
+from message.payload import Payload, FetchTilesPayload, TilesPayload, TileEncoding
 from .message_testdata import FETCH_TILES_EXAMPLE, INVALID_EVENT_EXAMPLE, TILES_EXAMPLE
 from board.data import Point
 
 import unittest
 import json
+import struct
+import base64
+import zlib
 
 
 class MessageTestCase(unittest.TestCase):
@@ -58,6 +61,119 @@ class MessageTestCase(unittest.TestCase):
 
         self.assertEqual(json.loads(msg_str), json.loads(TILES_EXAMPLE))
 
+    def test_tiles_to_bytes(self):
+        message: Message[TilesPayload] = Message(
+            event="tiles",
+            payload=TilesPayload(
+                start_p=Point(-1, 2),
+                end_p=Point(1, 0),
+                tiles="818283"
+            )
+        )
+
+        b = message.to_bytes()
+
+        self.assertEqual(b[0], 1)
+        self.assertEqual(struct.unpack("!4i", b[1:17]), (-1, 2, 1, 0))
+        self.assertEqual(b[17:], bytes([0x81, 0x82, 0x83]))
+
+    def test_tiles_raw(self):
+        # 타일 byte 그대로 만든 payload는 hex 문자열로 만든 payload와 같은 프레임이 된다.
+        def create(tiles: str | bytes):
+            return Message(
+                event="tiles",
+                payload=TilesPayload(start_p=Point(-1, 2), end_p=Point(1, 0), tiles=tiles)
+            )
+
+        raw = create(bytes([0x81, 0x82, 0x83]))
+        hex = create("818283")
+
+        self.assertEqual(raw.to_bytes(), hex.to_bytes())
+        self.assertEqual(raw.to_str(), hex.to_str())
+        self.assertEqual(
+            zlib.decompress(raw.to_bytes(tile_encoding=TileEncoding.DEFLATE)[17:]),
+            bytes([0x81, 0x82, 0x83])
+        )
+
+    def test_tiles_to_bytes_deflate(self):
+        message: Message[TilesPayload] = Message(
+            event="tiles",
+            payload=TilesPayload(
+                start_p=Point(-1, 2),
+                end_p=Point(1, 0),
+                tiles="818283"
+            )
+        )
+
+        b = message.to_bytes(tile_encoding=TileEncoding.DEFLATE)
+
+        self.assertEqual(b[0], 1)
+        self.assertEqual(struct.unpack("!4i", b[1:17]), (-1, 2, 1, 0))
+        self.assertEqual(zlib.decompress(b[17:]), bytes([0x81, 0x82, 0x83]))
+
+    def test_tiles_to_str_deflate(self):
+        payload = TilesPayload(
+            start_p=Point(-1, 2),
+            end_p=Point(1, 0),
+            tiles="818283"
+        )
+        message: Message[TilesPayload] = Message(event="tiles", payload=payload)
+
+        msg = json.loads(message.to_str(tile_encoding=TileEncoding.DEFLATE))
+
+        self.assertEqual(msg["payload"]["start_p"], {"x": -1, "y": 2})
+        self.assertEqual(msg["payload"]["end_p"], {"x": 1, "y": 0})
+        self.assertEqual(zlib.decompress(base64.b64decode(msg["payload"]["tiles"])), bytes([0x81, 0x82, 0x83]))
+        # 원본 payload는 그대로
+        self.assertEqual(message.payload.tiles, "818283")
+
+    def test_to_frame(self):
+        message: Message[TilesPayload] = Message(
+            event="tiles",
+            header={"target_conns": ["a"]},
+            payload=TilesPayload(
+                start_p=Point(-1, 2),
+                end_p=Point(1, 0),
+                tiles="818283"
+            )
+        )
+
+        frame = message.to_frame()
+        self.assertEqual(frame, message.to_str())
+        # 한 번만 인코딩하고 같은 프레임을 돌려준다.
+        self.assertIs(message.to_frame(), frame)
+
+        binary = message.to_frame(protocol=Protocol.BINARY)
+        self.assertEqual(binary, message.to_bytes())
+        self.assertIs(message.to_frame(protocol=Protocol.BINARY), binary)
+
+        deflate = message.to_frame(protocol=Protocol.BINARY, tile_encoding=TileEncoding.DEFLATE)
+        self.assertEqual(deflate, message.to_bytes(tile_encoding=TileEncoding.DEFLATE))
+
+    def test_to_frame_event_changed(self):
+        message: Message[FetchTilesPayload] = Message(
+            event="multicast",
+            payload=FetchTilesPayload(start_p=Point(0, 0), end_p=Point(0, 0))
+        )
+        before = message.to_frame()
+
+        message.event = "fetch-tiles"
+
+        self.assertEqual(json.loads(before)["event"], "multicast")
+        self.assertEqual(json.loads(message.to_frame())["event"], "fetch-tiles")
+
+    def test_to_bytes_invalid_event(self):
+        message: Message[FetchTilesPayload] = Message(
+            event="fetch-tiles",
+            payload=FetchTilesPayload(
+                start_p=Point(0, 0),
+                end_p=Point(0, 0)
+            )
+        )
+
+        with self.assertRaises(InvalidEventTypeException):
+            message.to_bytes()
+
     def test_from_str_invalid_event(self):
         socket_msg = INVALID_EVENT_EXAMPLE
 
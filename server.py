@@ -1,12 +1,102 @@
+import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket, Response, WebSocketDisconnect
 from websockets.exceptions import ConnectionClosed
+from conn import Conn
 from conn.manager import ConnectionManager
+from board.data.handler import BoardHandler
 from board.event.handler import BoardEventHandler
-from cursor.event.handler import CursorEventHandler
-from message import Message
-from message.payload import ErrorEvent, ErrorPayload
+from cursor.event.handler import CursorEventHandler, CursorTick
+from message import Message, Protocol
+from message.payload import ErrorEvent, ErrorPayload, TileEncoding, TilesEvent, PointEvent, MoveEvent
+from event import Tracer, TraceLevel, FileSink, EventLanes, Lane, Priority, OverloadPolicy, LaneFullException
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # SECTION_WORKERS: 섹션 생성을 담당할 프로세스 수. 0이면 CPU 개수만큼 사용.
+    if (workers := os.environ.get("SECTION_WORKERS")) is not None:
+        BoardHandler.use_process_pool(max_workers=int(workers) or None)
+
+    # SEND_FLUSH_INTERVAL_MS: 연결마다 보낼 메시지를 모아 한 번에 보내는 간격. 0이면 바로 보낸다.
+    # 배열 한 프레임으로 묶는 것은 batch=true로 연결한 클라이언트에게만 한다.
+    if (interval := os.environ.get("SEND_FLUSH_INTERVAL_MS")) is not None:
+        ConnectionManager.flush_interval = int(interval) / 1000
+
+    # EVENT_TRACE: 발행되는 이벤트 기록 수준. off(기본값), event, payload
+    # EVENT_TRACE_SAMPLE: 기록할 이벤트 비율 (0 ~ 1)
+    # EVENT_TRACE_FILE: 기록할 파일. 없으면 stdout으로 출력한다.
+    if (level := os.environ.get("EVENT_TRACE")) is not None:
+        path = os.environ.get("EVENT_TRACE_FILE")
+        Tracer.configure(
+            level=TraceLevel[level.upper()],
+            sample_rate=float(os.environ.get("EVENT_TRACE_SAMPLE", 1)),
+            sink=FileSink(path) if path else None
+        )
+
+    # CURSOR_TICK_RATE: 커서 이동, 포인터 변경을 모아서 보내는 초당 틱 수. 없으면 바로 보낸다.
+    if (rate := os.environ.get("CURSOR_TICK_RATE")) is not None:
+        CursorTick.start(rate=float(rate))
+
+    # EVENT_LANES: 1이면 받은 메시지를 우선순위 Lane으로 나누어 처리한다.
+    # 포인팅, 이동은 fetch-tiles 같은 큰 요청에 밀리지 않고 먼저 처리된다.
+    # 포인팅, 이동은 하나라도 빠지면 안 되므로 Lane이 가득 차면 거절하고 sender에게 에러를 보낸다.
+    if os.environ.get("EVENT_LANES") == "1":
+        EventLanes.start(
+            lanes=[
+                Lane(priority=Priority.HIGH, maxsize=1024, policy=OverloadPolicy.REJECT, workers=8),
+                Lane(priority=Priority.NORMAL, maxsize=1024, policy=OverloadPolicy.REJECT, workers=4),
+                Lane(priority=Priority.BULK, maxsize=256, policy=OverloadPolicy.REJECT, workers=1)
+            ],
+            event_priority={
+                PointEvent.POINTING: Priority.HIGH,
+                MoveEvent.MOVING: Priority.HIGH,
+                TilesEvent.FETCH_TILES: Priority.BULK
+            },
+            on_error=close_on_lane_error
+        )
+
+    yield
+
+    if EventLanes.enabled():
+        await EventLanes.stop()
+
+    if CursorTick.enabled():
+        await CursorTick.stop()
+
+    if BoardHandler.executor is not None:
+        BoardHandler.executor.shutdown(cancel_futures=True)
+        BoardHandler.set_executor(None)
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+async def send_error(conn: Conn, message: Message, e: Exception):
+    msg = e
+    if hasattr(e, "msg"):
+        msg = e.msg
+
+    await conn.send(Message(
+        event=ErrorEvent.ERROR,
+        payload=ErrorPayload(msg=msg)
+    ))
+
+    print(f"Unhandled error while handling message: \n{message.__dict__}\n{type(e)}: '{msg}'")
+
+
+async def close_on_lane_error(message: Message, e: Exception):
+    """
+    Lane worker에서 처리하다 실패한 메시지의 sender에게 에러를 보내고 연결을 닫는다.
+    session의 수신 반복은 연결 종료로 끝나면서 ConnectionManager.close()를 호출한다.
+    """
+    conn = ConnectionManager.get_conn(message.header.get("sender"))
+    if conn is None:
+        print(f"Unhandled error while handling message: \n{message.__dict__}\n{type(e)}: '{e}'")
+        return
+
+    await send_error(conn, message, e)
+    await conn.close()
 
 
 @app.websocket("/session")
@@ -26,7 +116,23 @@ async def session(ws: WebSocket):
         await ws.close(code=1006, reason=e.__repr__())
         return
 
-    conn = await ConnectionManager.add(ws, width=view_width, height=view_height)
+    try:
+        protocol = Protocol(ws.query_params.get("protocol", Protocol.JSON))
+        tile_encoding = TileEncoding(ws.query_params.get("tile_encoding", TileEncoding.HEX))
+        # 여러 메시지를 JSON 배열 한 프레임으로 받을 수 있는 클라이언트만 batch=true로 연결한다.
+        batch = ws.query_params.get("batch", "false")
+        if batch not in ("true", "false"):
+            raise ValueError(f"invalid batch: {batch}")
+        batch = batch == "true"
+    except ValueError as e:
+        print(f"WebSocket connection closed: {e}")
+        await ws.close(code=1000, reason="Unsupported protocol")
+        return
+
+    conn = await ConnectionManager.add(
+        ws, width=view_width, height=view_height,
+        protocol=protocol, tile_encoding=tile_encoding, batch=batch
+    )
 
     while True:
         try:
@@ -36,17 +142,18 @@ async def session(ws: WebSocket):
         except (WebSocketDisconnect, ConnectionClosed) as e:
             # 연결 종료됨
             break
-        except Exception as e:
-            msg = e
-            if hasattr(e, "msg"):
-                msg = e.msg
-
+        except LaneFullException as e:
+            # 처리 대기 중인 메시지가 너무 많음. 연결은 유지한다.
             await conn.send(Message(
                 event=ErrorEvent.ERROR,
-                payload=ErrorPayload(msg=msg)
+                payload=ErrorPayload(msg=e.msg)
             ))
+        except Exception as e:
+            if conn.closed:
+                # Lane worker에서 에러를 보내고 닫은 연결
+                break
 
-            print(f"Unhandled error while handling message: \n{message.__dict__}\n{type(e)}: '{msg}'")
+            await send_error(conn, message, e)
             break
 
     await ConnectionManager.close(conn)
@@ -59,4 +166,9 @@ def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+
+    # WS_PER_MESSAGE_DEFLATE: 0이면 websocket permessage-deflate 압축을 끈다.
+    # uvicorn CLI로 띄울 때는 --ws-per-message-deflate 옵션을 쓴다.
+    per_message_deflate = os.environ.get("WS_PER_MESSAGE_DEFLATE", "1") != "0"
+
+    uvicorn.run(app, host="127.0.0.1", port=8000, ws_per_message_deflate=per_message_deflate)
@@ -3,7 +3,7 @@ from fastapi.websockets import WebSocketDisconnect
 
 from server import app
 from message import Message
-from message.payload import FetchTilesPayload, TilesPayload, TilesEvent, NewConnEvent
+from message.payload import FetchTilesPayload, TilesPayload, TilesEvent, NewConnEvent, TileEncoding
 from board.data.handler.test.fixtures import setup_board
 from board.event.handler import BoardEventHandler
 from board.data import Point, Tile, Tiles
@@ -67,6 +67,85 @@ class ServerTestCase(unittest.TestCase):
             response = websocket.receive_text()
             self.assertEqual(response, expect.to_str())
 
+    def test_wrong_protocol(self):
+        with self.assertRaises(WebSocketDisconnect) as cm:
+            with self.client.websocket_connect("/session?view_width=1&view_height=1&protocol=ayo") as websocket:
+                websocket.close()
+
+        with self.assertRaises(WebSocketDisconnect) as cm:
+            with self.client.websocket_connect("/session?view_width=1&view_height=1&tile_encoding=ayo") as websocket:
+                websocket.close()
+
+    @patch("event.EventBroker.publish")
+    def test_fetch_tiles_binary(self, mock: AsyncMock):
+        async def filter_tiles_event(message: Message):
+            match (message.event):
+                case "multicast":
+                    await ConnectionManager.receive_multicast_event(message)
+                case TilesEvent.FETCH_TILES:
+                    await BoardEventHandler.receive_fetch_tiles(message)
+
+        mock.side_effect = filter_tiles_event
+
+        params = {"view_width": 1, "view_height": 1, "protocol": "binary"}
+        with self.client.websocket_connect("/session", **{"params": params}) as websocket:
+            msg = Message(
+                event=TilesEvent.FETCH_TILES,
+                payload=FetchTilesPayload(
+                    start_p=Point(-2, 1),
+                    end_p=Point(1, -2)
+                )
+            )
+
+            expect = Message(
+                event=TilesEvent.TILES,
+                payload=TilesPayload(
+                    start_p=Point(-2, 1),
+                    end_p=Point(1, -2),
+                    tiles="82818130818081008281813883280000"
+                )
+            )
+
+            websocket.send_text(msg.to_str())
+
+            response = websocket.receive_bytes()
+            self.assertEqual(response, expect.to_bytes())
+
+    @patch("event.EventBroker.publish")
+    def test_fetch_tiles_deflate(self, mock: AsyncMock):
+        async def filter_tiles_event(message: Message):
+            match (message.event):
+                case "multicast":
+                    await ConnectionManager.receive_multicast_event(message)
+                case TilesEvent.FETCH_TILES:
+                    await BoardEventHandler.receive_fetch_tiles(message)
+
+        mock.side_effect = filter_tiles_event
+
+        params = {"view_width": 1, "view_height": 1, "protocol": "binary", "tile_encoding": "deflate"}
+        with self.client.websocket_connect("/session", **{"params": params}) as websocket:
+            msg = Message(
+                event=TilesEvent.FETCH_TILES,
+                payload=FetchTilesPayload(
+                    start_p=Point(-2, 1),
+                    end_p=Point(1, -2)
+                )
+            )
+
+            expect = Message(
+                event=TilesEvent.TILES,
+                payload=TilesPayload(
+                    start_p=Point(-2, 1),
+                    end_p=Point(1, -2),
+                    tiles="82818130818081008281813883280000"
+                )
+            )
+
+            websocket.send_text(msg.to_str())
+
+            response = websocket.receive_bytes()
+            self.assertEqual(response, expect.to_bytes(tile_encoding=TileEncoding.DEFLATE))
+
 
 if __name__ == "__main__":
     unittest.main()